@@ -46,12 +46,21 @@ from autogalaxy import convert
 from . import aggregator as agg
 from . import plot
 from .dataset.imaging import MaskedImaging, SimulatorImaging
-from .dataset.interferometer import MaskedInterferometer, SimulatorInterferometer
-from .fit.fit import FitImaging, FitInterferometer
+from .dataset.interferometer import (
+    MaskedInterferometer,
+    SimulatorInterferometer,
+    TransformerDFTChunked,
+    interferometer_via_memmap_from,
+)
+from .dataset.preprocess import (
+    uv_binned_interferometer_and_report_from,
+    output_uv_binned_interferometer,
+)
+from .fit.fit import FitImaging, FitInterferometer, FitInterferometerDirtyImage
 from .fit.fit_positions import FitPositionsSourcePlaneMaxSeparation
 from .lens.settings import SettingsLens
 from .lens.ray_tracing import Tracer
-from .lens.positions_solver import PositionsFinder
+from .lens.positions_solver import PositionsFinder, PositionsFinderTriangles
 from .pipeline.setup import (
     SetupPipeline,
     SetupHyper,
@@ -73,6 +82,10 @@ from .pipeline.phase.settings import SettingsPhaseInterferometer
 from .pipeline.phase.imaging.phase import PhaseImaging
 from .pipeline.phase.interferometer.phase import PhaseInterferometer
 from .pipeline.phase.extensions.stochastic_phase import StochasticPhase
+from .pipeline.phase.extensions.subhalo_grid_search import (
+    GridSearchSubhalo,
+    as_grid_search_subhalo,
+)
 from .pipeline.phase.phase_galaxy import PhaseGalaxy
 
 from autoconf import conf
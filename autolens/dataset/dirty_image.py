@@ -0,0 +1,177 @@
+import numpy as np
+from scipy import signal
+from autoarray import decorator_util
+from autoarray.structures import arrays
+from autolens.dataset import memmap
+from autolens.dataset import w_tilde as wt
+
+
+class DirtyImageInterferometer:
+    def __init__(self, dirty_image, dirty_beam, noise, mask):
+        """
+        The dirty image and dirty beam of an interferometer dataset, which are used to fit it approximately in real
+        space (see `FitInterferometerDirtyImage`).
+
+        The dirty image of every masked image pixel is the noise weighted sum of the visibilities transformed back to
+        real space, normalized such that the dirty beam has a peak value of 1. The transform of a model image fitted
+        to the visibilities gives the model image convolved with the dirty beam, therefore the dirty image is fitted
+        with the model image convolved with the dirty beam.
+
+        This is approximate. The dirty beam assumes the real and imaginary noise of every visibility are equal, and
+        the noise of the dirty image, which is correlated over the dirty beam, is treated as independent in every pixel.
+
+        Parameters
+        ----------
+        dirty_image : np.ndarray
+            The 1D dirty image of the masked image pixels.
+        dirty_beam : np.ndarray
+            The 2D dirty beam, whose shape is twice that of the bounding box of the mask minus 1, such that it covers
+            the offset between every pair of masked image pixels.
+        noise : float
+            The noise of every pixel of the dirty image.
+        mask : Mask2D
+            The real-space mask of the image pixels.
+        """
+        self.dirty_image = dirty_image
+        self.dirty_beam = dirty_beam
+        self.noise = noise
+        self.mask = mask
+
+    @classmethod
+    def from_masked_interferometer(cls, masked_interferometer):
+        """
+        Compute the dirty image and dirty beam of a masked interferometer dataset, summing over its visibilities in
+        chunks if its `visibilities_chunk_size` is set.
+        """
+        mask = masked_interferometer.real_space_mask.mask_sub_1
+
+        visibilities = np.asarray(masked_interferometer.visibilities)
+        noise_map = np.asarray(masked_interferometer.noise_map)
+        uv_wavelengths = np.asarray(
+            masked_interferometer.interferometer.uv_wavelengths, dtype="float"
+        )
+        grid_radians = np.asarray(masked_interferometer.transformer.grid)
+        visibilities_mask = np.asarray(
+            masked_interferometer.visibilities_mask, dtype="bool"
+        )
+
+        rows, columns = np.where(np.invert(np.asarray(mask)))
+
+        beam_shape = (
+            2 * (np.max(rows) - np.min(rows)) + 1,
+            2 * (np.max(columns) - np.min(columns)) + 1,
+        )
+
+        pixel_scales_radians = np.asarray(mask.pixel_scales) * np.pi / 648000.0
+
+        dirty_image = np.zeros(shape=grid_radians.shape[0])
+        dirty_beam = np.zeros(shape=beam_shape)
+
+        for chunk in memmap.chunks_from(
+            total=visibilities.shape[0],
+            chunk_size=masked_interferometer.visibilities_chunk_size,
+        ):
+
+            visibilities_chunk = np.asarray(visibilities[chunk])
+            noise_map_chunk = np.asarray(noise_map[chunk])
+
+            dirty_image += wt.dirty_image_interferometer_from(
+                visibilities_real=visibilities_chunk.real,
+                visibilities_imag=visibilities_chunk.imag,
+                noise_map_real=noise_map_chunk.real,
+                noise_map_imag=noise_map_chunk.imag,
+                uv_wavelengths=np.asarray(uv_wavelengths[chunk]),
+                grid_radians=grid_radians,
+                visibilities_mask=np.asarray(visibilities_mask[chunk]),
+            )
+
+            dirty_beam += dirty_beam_interferometer_from(
+                noise_map_real=noise_map_chunk.real,
+                noise_map_imag=noise_map_chunk.imag,
+                uv_wavelengths=np.asarray(uv_wavelengths[chunk]),
+                pixel_scales_radians=pixel_scales_radians,
+                beam_shape=beam_shape,
+                visibilities_mask=np.asarray(visibilities_mask[chunk]),
+            )
+
+        beam_peak = dirty_beam[beam_shape[0] // 2, beam_shape[1] // 2]
+
+        return DirtyImageInterferometer(
+            dirty_image=dirty_image / beam_peak,
+            dirty_beam=dirty_beam / beam_peak,
+            noise=1.0 / np.sqrt(beam_peak),
+            mask=mask,
+        )
+
+    def dirty_model_image_from_image(self, image):
+        """
+        Convolve a 1D image of the masked image pixels with the dirty beam, returning the 1D dirty model image.
+
+        The image is convolved within the bounding box of the mask via a FFT, thus the cost is that of convolving an
+        image of this size as opposed to a sum over the visibilities.
+        """
+        rows, columns = np.where(np.invert(np.asarray(self.mask)))
+
+        rows = rows - np.min(rows)
+        columns = columns - np.min(columns)
+
+        image_2d = np.zeros(
+            shape=(self.dirty_beam.shape[0] // 2 + 1, self.dirty_beam.shape[1] // 2 + 1)
+        )
+        image_2d[rows, columns] = image
+
+        dirty_model_image_2d = signal.fftconvolve(image_2d, self.dirty_beam, mode="same")
+
+        return dirty_model_image_2d[rows, columns]
+
+    @property
+    def dirty_image_array(self):
+        return arrays.Array.manual_mask(array=self.dirty_image, mask=self.mask)
+
+
+@decorator_util.jit()
+def dirty_beam_interferometer_from(
+    noise_map_real,
+    noise_map_imag,
+    uv_wavelengths,
+    pixel_scales_radians,
+    beam_shape,
+    visibilities_mask,
+):
+    """
+    Returns the dirty beam of the unmasked visibilities, the noise weighted transform of a point source at the phase
+    centre back to real space, for every (y,x) pixel offset of a beam of the input shape.
+
+    Every visibility is weighted by the mean of the inverse variance of its real and imaginary components.
+    """
+    dirty_beam = np.zeros(beam_shape)
+
+    centre_row = beam_shape[0] // 2
+    centre_column = beam_shape[1] // 2
+
+    for row in range(beam_shape[0]):
+        for column in range(beam_shape[1]):
+
+            y_offset = -(row - centre_row) * pixel_scales_radians[0]
+            x_offset = (column - centre_column) * pixel_scales_radians[1]
+
+            for vis_1d_index in range(uv_wavelengths.shape[0]):
+
+                if visibilities_mask[vis_1d_index]:
+                    continue
+
+                weight = 0.5 * (
+                    1.0 / noise_map_real[vis_1d_index] ** 2.0
+                    + 1.0 / noise_map_imag[vis_1d_index] ** 2.0
+                )
+
+                dirty_beam[row, column] += weight * np.cos(
+                    2.0
+                    * np.pi
+                    * (
+                        x_offset * uv_wavelengths[vis_1d_index, 0]
+                        + y_offset * uv_wavelengths[vis_1d_index, 1]
+                    )
+                )
+
+    return dirty_beam
@@ -5,10 +5,11 @@ from autoarray.structures import arrays
 from autoarray.structures import grids
 from autoarray.structures import kernel
 from autogalaxy.dataset import imaging as im
+from autolens.dataset import memmap
 from autolens.lens import ray_tracing
 
 
-class MaskedImaging(imaging.MaskedImaging):
+class MaskedImaging(memmap.MemmapArraysMixin, imaging.MaskedImaging):
     def __init__(self, imaging, mask, settings=im.SettingsMaskedImaging()):
         """
         The lens dataset is the collection of data (image, noise-map, PSF), a mask, grid, convolver \
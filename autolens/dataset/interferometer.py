@@ -1,13 +1,24 @@
 import copy
 
+import numpy as np
 from autoarray.dataset import interferometer
 from autoarray.operators import transformer
 from autoarray.structures import grids
+from autoarray.structures import visibilities as vis
+from autoarray.util import transformer_util
 from autogalaxy.dataset import interferometer as inter
+from autolens.dataset import dirty_image as di
+from autolens.dataset import memmap
+from autolens.dataset import w_tilde as wt
 from autolens.lens import ray_tracing
 
 
-class MaskedInterferometer(interferometer.MaskedInterferometer):
+class MaskedInterferometer(memmap.MemmapArraysMixin, interferometer.MaskedInterferometer):
+
+    w_tilde = None
+    dirty_image_interferometer = None
+    visibilities_chunk_size = None
+
     def __init__(
         self,
         interferometer,
@@ -49,6 +60,149 @@ class MaskedInterferometer(interferometer.MaskedInterferometer):
             settings=settings,
         )
 
+    def chunk_visibilities(self, chunk_size):
+        """
+        Compute the log likelihood of the masked interferometer chunk by chunk, such that only `chunk_size`
+        visibilities (and their noise-map values and uv-wavelengths) are held in memory at once.
+
+        This is intended for visibilities that are memory-mapped from disk (see `interferometer_via_memmap_from`),
+        where the profile visibilities and chi-squared of a tracer without a pixelization are accumulated over every
+        chunk and the w-tilde of the dataset is computed one chunk at a time. The profile visibilities are computed by
+        the transformer of the masked interferometer (see `log_likelihood_interferometer_via_chunks_from`).
+
+        If the transformer is a `TransformerDFTChunked`, it transforms images in chunks of the same size.
+
+        Parameters
+        ----------
+        chunk_size : int
+            The number of visibilities in every chunk.
+        """
+        self.visibilities_chunk_size = chunk_size
+
+        if isinstance(self.transformer, TransformerDFTChunked):
+            self.transformer.chunk_size = chunk_size
+
+    def preload_w_tilde(self, directory=None):
+        """
+        Compute the w-tilde of the masked interferometer, such that the log likelihood of a tracer with a pixelization
+        is computed from the image-plane mapping matrix of its inversion without touching the visibilities (see
+        `WTildeInterferometer`).
+
+        Parameters
+        ----------
+        directory : str or None
+            The directory the w-tilde is cached in, such that it is computed once per dataset as opposed to every
+            time the masked interferometer is created. If None, it is not cached to disk.
+        """
+        self.w_tilde = wt.WTildeInterferometer.from_masked_interferometer(
+            masked_interferometer=self, directory=directory
+        )
+
+    def preload_dirty_image(self):
+        """
+        Compute the dirty image and dirty beam of the masked interferometer, such that the log likelihood of a tracer
+        without a pixelization is approximated in real space by fitting its image convolved with the dirty beam to
+        the dirty image (see `DirtyImageInterferometer`).
+        """
+        self.dirty_image_interferometer = di.DirtyImageInterferometer.from_masked_interferometer(
+            masked_interferometer=self
+        )
+
+
+class TransformerDFTChunked(transformer.TransformerDFT):
+
+    chunk_size = 2 ** 16
+
+    def __init__(self, uv_wavelengths, real_space_mask):
+        """
+        A DFT transformer which holds its uv-wavelengths as input (e.g. memory-mapped from disk) as opposed to a copy
+        in memory, and does not preload the transform of every image pixel to every visibility.
+
+        Images and mapping matrices are transformed `chunk_size` visibilities at a time, such that only one chunk of
+        the uv-wavelengths is read into memory at once.
+        """
+        super(transformer.TransformerDFT, self).__init__()
+
+        self.uv_wavelengths = uv_wavelengths
+        self.real_space_mask = real_space_mask.mask_sub_1
+        self.grid = (
+            self.real_space_mask.geometry.masked_grid_sub_1.in_1d_binned.in_radians
+        )
+
+        self.total_visibilities = uv_wavelengths.shape[0]
+        self.total_image_pixels = self.real_space_mask.pixels_in_mask
+
+        self.preload_transform = False
+
+        self.real_space_pixels = self.real_space_mask.pixels_in_mask
+
+        self.shape = (
+            int(np.prod(self.total_visibilities)),
+            int(np.prod(self.real_space_pixels)),
+        )
+        self.dtype = "complex128"
+        self.explicit = False
+
+    def visibilities_from_image(self, image):
+
+        visibilities = np.zeros(shape=self.total_visibilities, dtype="complex128")
+
+        for chunk in memmap.chunks_from(
+            total=self.total_visibilities, chunk_size=self.chunk_size
+        ):
+            visibilities[chunk] = transformer_util.visibilities_jit(
+                image_1d=image.in_1d_binned,
+                grid_radians=self.grid,
+                uv_wavelengths=np.asarray(self.uv_wavelengths[chunk], dtype="float"),
+            )
+
+        return vis.Visibilities(visibilities=visibilities)
+
+    def transformed_mapping_matrix_from_mapping_matrix(self, mapping_matrix):
+
+        transformed_mapping_matrix = np.zeros(
+            shape=(self.total_visibilities, mapping_matrix.shape[1]),
+            dtype="complex128",
+        )
+
+        for chunk in memmap.chunks_from(
+            total=self.total_visibilities, chunk_size=self.chunk_size
+        ):
+            transformed_mapping_matrix[
+                chunk
+            ] = transformer_util.transformed_mapping_matrix_jit(
+                mapping_matrix=mapping_matrix,
+                grid_radians=self.grid,
+                uv_wavelengths=np.asarray(self.uv_wavelengths[chunk], dtype="float"),
+            )
+
+        return transformed_mapping_matrix
+
+
+def interferometer_via_memmap_from(
+    visibilities_path, noise_map_path, uv_wavelengths_path
+):
+    """
+    Load an `Interferometer` whose visibilities, noise-map and uv-wavelengths are memory-mapped from .npy files, such
+    that they are read from disk as they are used as opposed to held in memory.
+
+    The .npy files are those output by `numpy.save` for a 1D complex array of the visibilities, a 1D complex array of
+    the noise-map and a [total_visibilities, 2] float array of the uv-wavelengths. The masked interferometer of this
+    dataset should use a `TransformerDFTChunked` and call `chunk_visibilities`, so that the arrays are only read one
+    chunk at a time.
+
+    The noise-map is the memory-mapped array itself as opposed to a `VisibilitiesNoiseMap`, which computes the weights
+    of every visibility in memory when it is created. The dataset therefore cannot be fitted with an `Inversion` which
+    uses linear operators.
+    """
+    return interferometer.Interferometer(
+        visibilities=vis.Visibilities(
+            visibilities=np.load(visibilities_path, mmap_mode="r")
+        ),
+        noise_map=np.load(noise_map_path, mmap_mode="r"),
+        uv_wavelengths=np.load(uv_wavelengths_path, mmap_mode="r"),
+    )
+
 
 class SimulatorInterferometer(interferometer.SimulatorInterferometer):
     def __init__(
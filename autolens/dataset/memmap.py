@@ -0,0 +1,227 @@
+import hashlib
+import io
+import os
+import pickle
+import uuid
+import weakref
+
+import numpy as np
+
+
+class MemmapArraysMixin:
+    """
+    Mixin for a masked dataset whose large arrays are stored in memory-mapped .npy files when it is pickled.
+
+    When a `NonLinearSearch` fits a model using multiple processes, the `Analysis` (and therefore the masked dataset)
+    is pickled and loaded by every process, such that every process holds its own copy of the image, noise-map,
+    grids, convolver, etc. For high resolution data with a large sub-grid size this multiplies the memory use of a
+    model-fit by the number of processes.
+
+    After `memmap_arrays` is called, pickling the masked dataset writes every array above `memmap_minimum_bytes` to
+    a .npy file in the memmap directory (once) and pickles only a reference to this file. Loading the pickle maps
+    the files into memory, such that every process reads the same pages of the operating system's page cache as
+    opposed to holding its own copy. The arrays are mapped copy-on-write, thus a process which writes to an array
+    does so privately and never changes the data of another process.
+
+    Pointing the memmap directory to a RAM backed file system (e.g. /dev/shm on Linux) places the arrays in shared
+    memory.
+
+    The files written by a masked dataset are deleted by `remove_memmap_files`, which is called automatically when the
+    masked dataset is garbage collected or the interpreter exits. A masked dataset loaded from a pickle maps the files
+    of the masked dataset that was pickled and never deletes them, thus the files must outlive the processes they are
+    loaded in (deleting a file which is already mapped by a process is safe on POSIX systems).
+
+    Every array is written to a file the first time it is pickled, alongside a checksum of its data. An array which
+    is changed in-place after it is written is detected by its checksum when it is next pickled and written to a new
+    file, such that stale data is never loaded.
+    """
+
+    memmap_directory = None
+    memmap_minimum_bytes = 2 ** 16
+
+    def memmap_arrays(self, directory):
+        """
+        Store the arrays of the masked dataset in memory-mapped files in the input directory whenever it is pickled.
+
+        Parameters
+        ----------
+        directory : str
+            The directory the .npy files of the arrays are written to, which must be readable by every process the
+            masked dataset is loaded in.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        self.memmap_directory = directory
+        self._memmap_files = {}
+        self._register_memmap_file_paths()
+
+    def _register_memmap_file_paths(self):
+        """
+        Create the list of files written by this masked dataset, which are deleted when it is garbage collected or the
+        interpreter exits.
+        """
+        self._memmap_file_paths = []
+        self._memmap_finalizer = weakref.finalize(
+            self, remove_files, self._memmap_file_paths
+        )
+
+    def remove_memmap_files(self):
+        """
+        Delete the memory-mapped files written by this masked dataset. The arrays are written to new files if it is
+        pickled again.
+        """
+        if self.memmap_directory is None:
+            return
+
+        remove_files(file_paths=self._memmap_file_paths)
+        self._memmap_files.clear()
+
+    def __getstate__(self):
+
+        state = self.__dict__.copy()
+
+        if self.memmap_directory is None:
+            return state
+
+        memmap_files = state.pop("_memmap_files")
+        memmap_file_paths = state.pop("_memmap_file_paths")
+        state.pop("_memmap_finalizer")
+
+        memmap_state = io.BytesIO()
+
+        MemmapPickler(
+            file=memmap_state,
+            directory=state["memmap_directory"],
+            memmap_files=memmap_files,
+            memmap_file_paths=memmap_file_paths,
+            minimum_bytes=self.memmap_minimum_bytes,
+        ).dump(state)
+
+        return {"memmap_state": memmap_state.getvalue()}
+
+    def __setstate__(self, state):
+
+        if "memmap_state" not in state:
+            self.__dict__.update(state)
+            return
+
+        unpickler = MemmapUnpickler(file=io.BytesIO(state["memmap_state"]))
+
+        self.__dict__.update(unpickler.load())
+        self._memmap_files = unpickler.memmap_files
+        self._register_memmap_file_paths()
+
+
+class MemmapPickler(pickle.Pickler):
+    def __init__(self, file, directory, memmap_files, memmap_file_paths, minimum_bytes):
+        """
+        Pickler which writes every array above a minimum size to a .npy file in a directory and pickles a reference to
+        this file in its place.
+
+        Parameters
+        ----------
+        memmap_files : dict
+            Dictionary mapping the id of every array which has already been written to a file to the array, its file
+            path and the checksum of its data when it was written. The array is stored to keep it alive, such that its
+            id is not reused by a different array.
+        memmap_file_paths : list
+            The paths of the files written by the pickler are appended to this list, such that they can be deleted.
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.directory = directory
+        self.memmap_files = memmap_files
+        self.memmap_file_paths = memmap_file_paths
+        self.minimum_bytes = minimum_bytes
+
+    def persistent_id(self, obj):
+
+        if (
+            not isinstance(obj, np.ndarray)
+            or obj.dtype.hasobject
+            or obj.nbytes < self.minimum_bytes
+        ):
+            return None
+
+        checksum = checksum_from(array=obj)
+
+        if (
+            id(obj) not in self.memmap_files
+            or self.memmap_files[id(obj)][2] != checksum
+        ):
+
+            file_path = os.path.join(self.directory, f"{uuid.uuid4().hex}.npy")
+
+            np.save(file_path, np.asarray(obj))
+
+            self.memmap_files[id(obj)] = (obj, file_path, checksum)
+            self.memmap_file_paths.append(file_path)
+
+        file_path = self.memmap_files[id(obj)][1]
+
+        if type(obj) in (np.ndarray, np.memmap):
+            return file_path, np.ndarray, {}, checksum
+
+        return file_path, type(obj), obj.__dict__, checksum
+
+
+class MemmapUnpickler(pickle.Unpickler):
+    def __init__(self, file):
+        """
+        Unpickler which loads every array pickled by a `MemmapPickler` by memory-mapping its .npy file.
+
+        Every file is mapped once, such that arrays which were the same object before pickling are the same object
+        after.
+        """
+        super().__init__(file)
+
+        self.memmap_files = {}
+        self.arrays = {}
+
+    def persistent_load(self, pid):
+
+        file_path, cls, array_dict, checksum = pid
+
+        if file_path not in self.arrays:
+
+            array = np.load(file_path, mmap_mode="c")
+
+            if cls is not np.ndarray:
+                array = array.view(cls)
+                array.__dict__.update(array_dict)
+
+            self.arrays[file_path] = array
+            self.memmap_files[id(array)] = (array, file_path, checksum)
+
+        return self.arrays[file_path]
+
+
+def checksum_from(array):
+    """
+    A checksum of the data of an array, which is used to detect arrays which are changed in-place after they are
+    written to a memory-mapped file.
+    """
+    return hashlib.blake2b(np.ascontiguousarray(array).view(np.uint8)).digest()
+
+
+def remove_files(file_paths):
+    """
+    Delete every file in a list of file paths (ignoring files which no longer exist) and empty the list.
+    """
+    while file_paths:
+
+        try:
+            os.remove(file_paths.pop())
+        except FileNotFoundError:
+            pass
+
+
+def chunks_from(total, chunk_size=None):
+    """
+    The slices of consecutive chunks of `chunk_size` entries that span `total` entries. If the chunk size is None, a
+    single chunk spanning every entry is returned.
+    """
+    if chunk_size is None:
+        return [slice(0, total)]
+
+    return [slice(start, start + chunk_size) for start in range(0, total, chunk_size)]
@@ -0,0 +1,138 @@
+import json
+from os import path
+
+import numpy as np
+from autoarray.dataset import interferometer as inter
+from autoarray.structures import visibilities as vis
+
+
+def uv_binned_interferometer_and_report_from(
+    interferometer, uv_cell_size, real_space_mask=None
+):
+    """
+    Compress an interferometer dataset by binning its visibilities in square cells of the uv-plane, returning the
+    binned `Interferometer` and a report of the compression and of the error it introduces.
+
+    The real and imaginary components of the visibilities in every cell are averaged weighted by their inverse
+    variance, such that the noise-map of every binned visibility is 1 / sqrt(sum(1 / noise_map ** 2.0)) of the
+    visibilities it contains. Every binned visibility is placed at the weighted mean uv-wavelength of its cell.
+
+    Averaging visibilities at different uv-wavelengths smears the emission of the source. For emission at a distance
+    theta (radians) from the phase centre, a visibility offset by delta_uv from the uv-wavelength of its bin has a
+    phase error of 2 pi theta delta_uv. If a real-space mask is input, the report gives the maximum phase error and
+    the fractional amplitude loss, 1 - <cos(phase error)> weighted by the visibility weights, for emission at the
+    edge of the mask, which are upper limits for the emission the mask contains.
+
+    Parameters
+    ----------
+    interferometer : Interferometer
+        The interferometer dataset whose visibilities are binned.
+    uv_cell_size : float
+        The size of the square uv-plane cells, in wavelengths.
+    real_space_mask : Mask2D or None
+        The real-space mask of the fit the binned dataset is used for, which sets the size of the region the
+        smearing error is computed for.
+
+    Returns
+    -------
+    (Interferometer, dict)
+        The binned interferometer dataset and the report of the binning.
+    """
+    visibilities = np.asarray(interferometer.visibilities)
+    noise_map = np.asarray(interferometer.noise_map)
+    uv_wavelengths = np.asarray(interferometer.uv_wavelengths, dtype="float")
+
+    cells = np.floor(uv_wavelengths / uv_cell_size).astype("int")
+
+    unique_cells, cell_indexes = np.unique(cells, axis=0, return_inverse=True)
+    cell_indexes = cell_indexes.ravel()
+
+    total_cells = unique_cells.shape[0]
+
+    weights_real = 1.0 / noise_map.real ** 2.0
+    weights_imag = 1.0 / noise_map.imag ** 2.0
+    weights = weights_real + weights_imag
+
+    def sum_in_cells(values):
+        return np.bincount(cell_indexes, weights=values, minlength=total_cells)
+
+    cell_weights_real = sum_in_cells(weights_real)
+    cell_weights_imag = sum_in_cells(weights_imag)
+    cell_weights = sum_in_cells(weights)
+
+    binned_visibilities = (
+        sum_in_cells(weights_real * visibilities.real) / cell_weights_real
+        + 1j * sum_in_cells(weights_imag * visibilities.imag) / cell_weights_imag
+    )
+
+    binned_noise_map = 1.0 / np.sqrt(cell_weights_real) + 1j / np.sqrt(
+        cell_weights_imag
+    )
+
+    binned_uv_wavelengths = np.stack(
+        [
+            sum_in_cells(weights * uv_wavelengths[:, 0]) / cell_weights,
+            sum_in_cells(weights * uv_wavelengths[:, 1]) / cell_weights,
+        ],
+        axis=1,
+    )
+
+    uv_offsets = np.sqrt(
+        np.sum((uv_wavelengths - binned_uv_wavelengths[cell_indexes]) ** 2.0, axis=1)
+    )
+
+    report = {
+        "uv_cell_size": float(uv_cell_size),
+        "total_visibilities": int(visibilities.shape[0]),
+        "total_binned_visibilities": int(total_cells),
+        "compression_factor": float(visibilities.shape[0] / total_cells),
+        "max_uv_offset": float(np.max(uv_offsets)),
+        "rms_uv_offset": float(
+            np.sqrt(np.sum(weights * uv_offsets ** 2.0) / np.sum(weights))
+        ),
+    }
+
+    if real_space_mask is not None:
+
+        grid_radians = real_space_mask.mask_sub_1.geometry.masked_grid_sub_1.in_radians
+
+        real_space_radius = np.max(
+            np.sqrt(np.sum(np.asarray(grid_radians) ** 2.0, axis=1))
+        )
+
+        phase_errors = 2.0 * np.pi * real_space_radius * uv_offsets
+
+        report["real_space_radius"] = float(real_space_radius * 648000.0 / np.pi)
+        report["max_phase_error"] = float(np.max(phase_errors))
+        report["amplitude_loss"] = float(
+            1.0 - np.sum(weights * np.cos(phase_errors)) / np.sum(weights)
+        )
+
+    binned_interferometer = inter.Interferometer(
+        visibilities=vis.Visibilities(visibilities=binned_visibilities),
+        noise_map=vis.VisibilitiesNoiseMap(visibilities=binned_noise_map),
+        uv_wavelengths=binned_uv_wavelengths,
+        positions=interferometer.positions,
+        name=interferometer.name,
+    )
+
+    return binned_interferometer, report
+
+
+def output_uv_binned_interferometer(
+    interferometer, report, output_path, overwrite=False
+):
+    """
+    Output a binned interferometer dataset to the .fits files visibilities.fits, noise_map.fits and
+    uv_wavelengths.fits in the output path, which are loaded via `Interferometer.from_fits`, and its report to
+    uv_binning.json.
+    """
+    interferometer.output_to_fits(
+        visibilities_path=path.join(output_path, "visibilities.fits"),
+        noise_map_path=path.join(output_path, "noise_map.fits"),
+        uv_wavelengths_path=path.join(output_path, "uv_wavelengths.fits"),
+        overwrite=overwrite,
+    )
+
+    with open(path.join(output_path, "uv_binning.json"), "w+") as f:
+        json.dump(report, f, indent=4)
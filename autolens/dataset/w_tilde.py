@@ -0,0 +1,500 @@
+import hashlib
+import os
+import tempfile
+from os import path
+
+import numpy as np
+from autoarray import decorator_util
+from autoarray import exc
+from autoarray.inversion import inversions as inv
+from autoarray.structures import visibilities as vis
+from autolens.dataset import memmap
+
+
+class WTildeInterferometer:
+    def __init__(
+        self,
+        w_matrix,
+        dirty_image,
+        data_chi_squared,
+        noise_normalization,
+        file_path=None,
+    ):
+        """
+        The w-tilde formalism of an interferometer dataset, which fits its visibilities using quantities that are
+        precomputed once on the masked image pixels of its real-space mask, such that the cost of every fit is
+        independent of the number of visibilities.
+
+        For the transform T (a DFT) from the image pixels to the visibilities and the noise-map N, the chi-squared of
+        a model image m is:
+
+        chi_squared = d^T N^-1 d - 2 m^T T^T N^-1 d + m^T T^T N^-1 T m
+
+        where every term is a sum over the real and imaginary components of the unmasked visibilities. The terms
+        d^T N^-1 d (the `data_chi_squared`), T^T N^-1 d (the `dirty_image`) and T^T N^-1 T (the `w_matrix`) do not
+        depend on the model, thus the chi-squared of a model image, and the curvature matrix and data vector of an
+        inversion, are computed from the image-plane mapping matrix without touching the visibilities.
+
+        Parameters
+        ----------
+        w_matrix : np.ndarray
+            The [image_pixels, image_pixels] matrix T^T N^-1 T of the visibility-space weighting of every pair of
+            image pixels.
+        dirty_image : np.ndarray
+            The noise weighted dirty image T^T N^-1 d of the visibilities.
+        data_chi_squared : float
+            The chi-squared of the visibilities fitted by a model of zeros, d^T N^-1 d.
+        noise_normalization : float
+            The noise normalization term of the unmasked visibilities of the noise-map.
+        file_path : str or None
+            The .npy file the w matrix is stored in, if it is cached to disk. The matrix is then memory-mapped from this
+            file, and pickling the w-tilde pickles a reference to the file as opposed to the matrix.
+        """
+        self.w_matrix = w_matrix
+        self.dirty_image = dirty_image
+        self.data_chi_squared = data_chi_squared
+        self.noise_normalization = noise_normalization
+        self.file_path = file_path
+
+    @classmethod
+    def from_masked_interferometer(cls, masked_interferometer, directory=None):
+        """
+        Compute the w-tilde of a masked interferometer dataset, which is a sum over every pair of image pixels and
+        every visibility and is therefore expensive for large datasets.
+
+        If the masked interferometer's `visibilities_chunk_size` is set, the sums over the visibilities are performed
+        one chunk at a time.
+
+        If a directory is input, the w-tilde is stored in it with a file name unique to the visibilities, noise-map,
+        uv-wavelengths and masks of the dataset, such that a w-tilde computed for the same dataset (e.g. by an earlier
+        phase of a pipeline or a previous run) is loaded as opposed to recomputed.
+
+        Parameters
+        ----------
+        masked_interferometer : MaskedInterferometer
+            The masked interferometer dataset whose w-tilde is computed.
+        directory : str or None
+            The directory the w-tilde is cached in. If None, it is not cached to disk.
+        """
+        visibilities = np.asarray(masked_interferometer.visibilities)
+        noise_map = np.asarray(masked_interferometer.noise_map)
+        uv_wavelengths = np.asarray(
+            masked_interferometer.interferometer.uv_wavelengths, dtype="float"
+        )
+        grid_radians = np.asarray(masked_interferometer.transformer.grid)
+        visibilities_mask = np.asarray(
+            masked_interferometer.visibilities_mask, dtype="bool"
+        )
+
+        chunks = memmap.chunks_from(
+            total=visibilities.shape[0],
+            chunk_size=masked_interferometer.visibilities_chunk_size,
+        )
+
+        if directory is not None:
+
+            key = hashlib.sha1()
+
+            for array in (visibilities, noise_map, uv_wavelengths, visibilities_mask):
+                for chunk in chunks:
+                    key.update(np.ascontiguousarray(array[chunk]).tobytes())
+
+            key.update(np.ascontiguousarray(grid_radians).tobytes())
+
+            file_path = path.join(directory, f"w_tilde_{key.hexdigest()}.npy")
+            data_file_path = path.join(
+                directory, f"w_tilde_data_{key.hexdigest()}.npz"
+            )
+
+            if path.exists(file_path) and path.exists(data_file_path):
+
+                data = np.load(data_file_path)
+
+                return WTildeInterferometer(
+                    w_matrix=np.load(file_path, mmap_mode="r"),
+                    dirty_image=data["dirty_image"],
+                    data_chi_squared=float(data["data_chi_squared"]),
+                    noise_normalization=float(data["noise_normalization"]),
+                    file_path=file_path,
+                )
+
+        w_matrix = np.zeros(shape=(grid_radians.shape[0], grid_radians.shape[0]))
+        dirty_image = np.zeros(shape=grid_radians.shape[0])
+        data_chi_squared = 0.0
+        noise_normalization = 0.0
+
+        for chunk in chunks:
+
+            visibilities_chunk = np.asarray(visibilities[chunk])
+            noise_map_chunk = np.asarray(noise_map[chunk])
+            uv_wavelengths_chunk = np.asarray(uv_wavelengths[chunk])
+            visibilities_mask_chunk = np.asarray(visibilities_mask[chunk])
+
+            w_matrix += w_matrix_interferometer_from(
+                noise_map_real=noise_map_chunk.real,
+                noise_map_imag=noise_map_chunk.imag,
+                uv_wavelengths=uv_wavelengths_chunk,
+                grid_radians=grid_radians,
+                visibilities_mask=visibilities_mask_chunk,
+            )
+
+            dirty_image += dirty_image_interferometer_from(
+                visibilities_real=visibilities_chunk.real,
+                visibilities_imag=visibilities_chunk.imag,
+                noise_map_real=noise_map_chunk.real,
+                noise_map_imag=noise_map_chunk.imag,
+                uv_wavelengths=uv_wavelengths_chunk,
+                grid_radians=grid_radians,
+                visibilities_mask=visibilities_mask_chunk,
+            )
+
+            unmasked = np.invert(visibilities_mask_chunk)
+
+            data_chi_squared += float(
+                np.sum(
+                    (visibilities_chunk.real[unmasked] / noise_map_chunk.real[unmasked])
+                    ** 2.0
+                )
+                + np.sum(
+                    (visibilities_chunk.imag[unmasked] / noise_map_chunk.imag[unmasked])
+                    ** 2.0
+                )
+            )
+
+            noise_normalization += float(
+                np.sum(np.log(2 * np.pi * noise_map_chunk.real[unmasked] ** 2.0))
+                + np.sum(np.log(2 * np.pi * noise_map_chunk.imag[unmasked] ** 2.0))
+            )
+
+        if directory is None:
+
+            return WTildeInterferometer(
+                w_matrix=w_matrix,
+                dirty_image=dirty_image,
+                data_chi_squared=data_chi_squared,
+                noise_normalization=noise_normalization,
+            )
+
+        os.makedirs(directory, exist_ok=True)
+
+        # Every process writes to its own temporary file, such that processes caching the same w-tilde at once never
+        # write to the same file and the cached files are only ever replaced by a complete file.
+
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as data_file:
+            np.savez(
+                data_file,
+                dirty_image=dirty_image,
+                data_chi_squared=data_chi_squared,
+                noise_normalization=noise_normalization,
+            )
+
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as file:
+            np.save(file, w_matrix)
+
+        os.replace(data_file.name, data_file_path)
+        os.replace(file.name, file_path)
+
+        return WTildeInterferometer(
+            w_matrix=np.load(file_path, mmap_mode="r"),
+            dirty_image=dirty_image,
+            data_chi_squared=data_chi_squared,
+            noise_normalization=noise_normalization,
+            file_path=file_path,
+        )
+
+    def chi_squared_from_model_image(self, model_image):
+        """
+        The chi-squared of the visibilities fitted by the transform of a model image of the image pixels.
+        """
+        return (
+            self.data_chi_squared
+            - 2.0 * np.dot(model_image, self.dirty_image)
+            + np.dot(model_image, np.dot(self.w_matrix, model_image))
+        )
+
+    def __getstate__(self):
+
+        state = self.__dict__.copy()
+
+        if self.file_path is not None:
+            state["w_matrix"] = None
+
+        return state
+
+    def __setstate__(self, state):
+
+        self.__dict__.update(state)
+
+        if self.file_path is not None:
+            self.w_matrix = np.load(self.file_path, mmap_mode="r")
+
+
+class InversionInterferometerWTilde(
+    inv.AbstractInversionInterferometer, inv.AbstractInversionMatrix
+):
+    def __init__(
+        self,
+        noise_map: vis.VisibilitiesNoiseMap,
+        transformer,
+        mapper,
+        regularization,
+        regularization_matrix: np.ndarray,
+        reconstruction: np.ndarray,
+        curvature_reg_matrix: np.ndarray,
+        settings: inv.SettingsInversion,
+    ):
+        """
+        An inversion of interferometer visibilities whose curvature matrix and data vector are computed from the
+        image-plane mapping matrix and the w-tilde of the dataset, as opposed to a transformed mapping matrix of size
+        [visibilities, source_pixels] (see `WTildeInterferometer`).
+
+        The mapped reconstructed visibilities are computed by transforming the mapped reconstructed image, thus the
+        visibilities are only touched if they are used (e.g. when visualizing the fit).
+        """
+        super(InversionInterferometerWTilde, self).__init__(
+            visibilities=None,
+            noise_map=noise_map,
+            transformer=transformer,
+            mapper=mapper,
+            regularization=regularization,
+            regularization_matrix=regularization_matrix,
+            reconstruction=reconstruction,
+            settings=settings,
+        )
+
+        inv.AbstractInversionMatrix.__init__(
+            self=self,
+            curvature_reg_matrix=curvature_reg_matrix,
+            regularization_matrix=regularization_matrix,
+        )
+
+    @classmethod
+    def from_image_w_tilde_mapper_and_regularization(
+        cls,
+        image: np.ndarray,
+        w_tilde: WTildeInterferometer,
+        noise_map: vis.VisibilitiesNoiseMap,
+        transformer,
+        mapper,
+        regularization,
+        settings=inv.SettingsInversion(),
+    ):
+        """
+        Perform the inversion of the noise weighted dirty image of the visibilities it fits.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            The noise weighted dirty image T^T N^-1 d of the visibilities the inversion fits, which for visibilities
+            with the transform of a model image m subtracted is the dirty image of the data minus the w matrix times m.
+        w_tilde : WTildeInterferometer
+            The w-tilde of the dataset, whose w matrix gives the curvature matrix.
+        """
+        mapping_matrix = np.asarray(mapper.mapping_matrix)
+
+        curvature_matrix = curvature_matrix_via_w_matrix_from(
+            w_matrix=np.asarray(w_tilde.w_matrix), mapping_matrix=mapping_matrix
+        )
+
+        data_vector = np.dot(mapping_matrix.T, image)
+
+        regularization_matrix = regularization.regularization_matrix_from_mapper(
+            mapper=mapper
+        )
+
+        curvature_reg_matrix = np.add(curvature_matrix, regularization_matrix)
+
+        try:
+            values = np.linalg.solve(curvature_reg_matrix, data_vector)
+        except np.linalg.LinAlgError:
+            raise exc.InversionException()
+
+        if settings.check_solution:
+            if np.isclose(a=values[0], b=values[1], atol=1e-4).all():
+                if np.isclose(a=values[0], b=values, atol=1e-4).all():
+                    raise exc.InversionException()
+
+        return InversionInterferometerWTilde(
+            noise_map=noise_map,
+            transformer=transformer,
+            mapper=mapper,
+            regularization=regularization,
+            regularization_matrix=regularization_matrix,
+            reconstruction=values,
+            curvature_reg_matrix=curvature_reg_matrix,
+            settings=settings,
+        )
+
+    @property
+    def mapped_reconstructed_visibilities(self):
+        return self.transformer.visibilities_from_image(
+            image=self.mapped_reconstructed_image
+        )
+
+
+@decorator_util.jit()
+def w_matrix_interferometer_from(
+    noise_map_real, noise_map_imag, uv_wavelengths, grid_radians, visibilities_mask
+):
+    """
+    Returns the w matrix T^T N^-1 T of every pair of image pixels, summing over the real and imaginary components of
+    every unmasked visibility.
+
+    For the phase theta_i = -2 pi (x_i u + y_i v) of image pixel i, the real and imaginary entries of the transform
+    are cos(theta_i) and sin(theta_i), such that every entry of the matrix is:
+
+    w_ij = sum [cos(theta_i) cos(theta_j) / sigma_real^2 + sin(theta_i) sin(theta_j) / sigma_imag^2]
+
+    which is computed from the cosines of theta_i - theta_j and theta_i + theta_j, the latter of which cancel when the
+    real and imaginary noise of a visibility are equal.
+    """
+    image_pixels = grid_radians.shape[0]
+
+    w_matrix = np.zeros((image_pixels, image_pixels))
+
+    for i in range(image_pixels):
+        for j in range(i, image_pixels):
+
+            y_offset = grid_radians[i, 0] - grid_radians[j, 0]
+            x_offset = grid_radians[i, 1] - grid_radians[j, 1]
+            y_sum = grid_radians[i, 0] + grid_radians[j, 0]
+            x_sum = grid_radians[i, 1] + grid_radians[j, 1]
+
+            value = 0.0
+
+            for vis_1d_index in range(uv_wavelengths.shape[0]):
+
+                if visibilities_mask[vis_1d_index]:
+                    continue
+
+                weight_real = 1.0 / noise_map_real[vis_1d_index] ** 2.0
+                weight_imag = 1.0 / noise_map_imag[vis_1d_index] ** 2.0
+
+                value += (
+                    0.5
+                    * (weight_real + weight_imag)
+                    * np.cos(
+                        2.0
+                        * np.pi
+                        * (
+                            x_offset * uv_wavelengths[vis_1d_index, 0]
+                            + y_offset * uv_wavelengths[vis_1d_index, 1]
+                        )
+                    )
+                )
+
+                if weight_real != weight_imag:
+
+                    value += (
+                        0.5
+                        * (weight_real - weight_imag)
+                        * np.cos(
+                            2.0
+                            * np.pi
+                            * (
+                                x_sum * uv_wavelengths[vis_1d_index, 0]
+                                + y_sum * uv_wavelengths[vis_1d_index, 1]
+                            )
+                        )
+                    )
+
+            w_matrix[i, j] = value
+            w_matrix[j, i] = value
+
+    return w_matrix
+
+
+@decorator_util.jit()
+def dirty_image_interferometer_from(
+    visibilities_real,
+    visibilities_imag,
+    noise_map_real,
+    noise_map_imag,
+    uv_wavelengths,
+    grid_radians,
+    visibilities_mask,
+):
+    """
+    Returns the noise weighted dirty image T^T N^-1 d of the unmasked visibilities.
+    """
+    dirty_image = np.zeros(grid_radians.shape[0])
+
+    for image_1d_index in range(grid_radians.shape[0]):
+        for vis_1d_index in range(uv_wavelengths.shape[0]):
+
+            if visibilities_mask[vis_1d_index]:
+                continue
+
+            theta = (
+                -2.0
+                * np.pi
+                * (
+                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
+                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
+                )
+            )
+
+            dirty_image[image_1d_index] += (
+                visibilities_real[vis_1d_index]
+                * np.cos(theta)
+                / noise_map_real[vis_1d_index] ** 2.0
+                + visibilities_imag[vis_1d_index]
+                * np.sin(theta)
+                / noise_map_imag[vis_1d_index] ** 2.0
+            )
+
+    return dirty_image
+
+
+@decorator_util.jit()
+def curvature_matrix_via_w_matrix_from(w_matrix, mapping_matrix):
+    """
+    Returns the curvature matrix M^T W M of a mapping matrix M and w matrix W.
+
+    Every image pixel maps to at most one source pixel per sub-pixel, thus the non-zero entries of every row of the
+    mapping matrix are gathered first and the matrix product is summed over these entries only.
+    """
+    image_pixels = mapping_matrix.shape[0]
+    source_pixels = mapping_matrix.shape[1]
+
+    sizes = np.zeros(image_pixels, dtype=np.int64)
+
+    for image_1d_index in range(image_pixels):
+        for pix_1d_index in range(source_pixels):
+            if mapping_matrix[image_1d_index, pix_1d_index] > 0.0:
+                sizes[image_1d_index] += 1
+
+    pix_indexes = np.zeros((image_pixels, max(np.max(sizes), 1)), dtype=np.int64)
+    pix_weights = np.zeros((image_pixels, max(np.max(sizes), 1)))
+
+    for image_1d_index in range(image_pixels):
+
+        entry = 0
+
+        for pix_1d_index in range(source_pixels):
+
+            value = mapping_matrix[image_1d_index, pix_1d_index]
+
+            if value > 0.0:
+                pix_indexes[image_1d_index, entry] = pix_1d_index
+                pix_weights[image_1d_index, entry] = value
+                entry += 1
+
+    curvature_matrix = np.zeros((source_pixels, source_pixels))
+
+    for i in range(image_pixels):
+        for j in range(image_pixels):
+
+            w_value = w_matrix[i, j]
+
+            for i_entry in range(sizes[i]):
+
+                i_value = w_value * pix_weights[i, i_entry]
+
+                for j_entry in range(sizes[j]):
+
+                    curvature_matrix[
+                        pix_indexes[i, i_entry], pix_indexes[j, j_entry]
+                    ] += (i_value * pix_weights[j, j_entry])
+
+    return curvature_matrix
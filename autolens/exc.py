@@ -21,5 +21,9 @@ class PixelizationException(af.exc.FitException):
     pass
 
 
+class LikelihoodException(af.exc.FitException):
+    pass
+
+
 class SettingsException(Exception):
     pass
@@ -1,9 +1,15 @@
 import numpy as np
 
 from autoconf import conf
+from autoarray import decorator_util
 from autoarray.fit import fit as aa_fit
+from autoarray.operators import transformer as trans
+from autoarray.structures import arrays
+from autoarray.util import fit_util
+from autoarray.util import transformer_util
 from autoarray.inversion import pixelizations as pix, inversions as inv
 from autogalaxy.galaxy import galaxy as g
+from autolens.dataset import memmap
 
 
 class FitImaging(aa_fit.FitImaging):
@@ -312,6 +318,85 @@ class FitInterferometer(aa_fit.FitInterferometer):
         return len(list(filter(None, self.tracer.regularizations_of_planes)))
 
 
+class FitInterferometerDirtyImage(aa_fit.FitDataset):
+    def __init__(self, masked_interferometer, tracer):
+        """
+        An approximate fit of an interferometer dataset in real space, which fits the dirty image of the visibilities
+        with the image of the tracer convolved with the dirty beam (see `DirtyImageInterferometer`).
+
+        The cost of the fit is that of fitting an imaging dataset, therefore it is intended for fast parametric model
+        scans (e.g. the early phases of a pipeline), which are followed by an exact fit to the visibilities via the
+        `FitInterferometer`. The noise of the dirty image is correlated over the dirty beam, which this fit omits,
+        therefore its log likelihood is not that of the visibilities.
+
+        The dirty image of the masked interferometer must be computed via its `preload_dirty_image` method before it
+        is fitted, such that it is computed once per dataset as opposed to in the log likelihood function.
+
+        Parameters
+        -----------
+        masked_interferometer : MaskedInterferometer
+            The masked interferometer dataset whose dirty image is fitted.
+        tracer : ray_tracing.Tracer
+            The tracer, which describes the ray-tracing and strong lens configuration.
+        """
+
+        self.tracer = tracer
+        self.dirty_image_interferometer = (
+            masked_interferometer.dirty_image_interferometer
+        )
+
+        self.model_image = tracer.image_from_grid(
+            grid=masked_interferometer.grid
+        ).in_1d_binned
+
+        model_data = arrays.Array.manual_mask(
+            array=self.dirty_image_interferometer.dirty_model_image_from_image(
+                image=np.asarray(self.model_image)
+            ),
+            mask=self.dirty_image_interferometer.mask,
+        )
+
+        super().__init__(
+            masked_dataset=masked_interferometer,
+            model_data=model_data,
+            use_mask_in_fit=False,
+        )
+
+    @property
+    def masked_interferometer(self):
+        return self.masked_dataset
+
+    @property
+    def mask(self):
+        return self.dirty_image_interferometer.mask
+
+    @property
+    def data(self):
+        return self.dirty_image_interferometer.dirty_image_array
+
+    @property
+    def noise_map(self):
+        return arrays.Array.manual_mask(
+            array=np.full(
+                shape=self.data.shape[0],
+                fill_value=self.dirty_image_interferometer.noise,
+            ),
+            mask=self.mask,
+        )
+
+    @property
+    def dirty_image(self):
+        return self.data
+
+    @property
+    def dirty_model_image(self):
+        return self.model_data
+
+    @property
+    def grid(self):
+        return self.masked_interferometer.grid
+
+
 def hyper_image_from_image_and_hyper_image_sky(image, hyper_image_sky):
 
     if hyper_image_sky is not None:
@@ -337,3 +422,482 @@ def hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise(
         noise_map[noise_map > noise_map_limit] = noise_map_limit
 
     return noise_map
+
+
+def log_likelihoods_from_image_noise_map_and_model_images(
+    image, noise_map, model_images
+):
+    """
+    Compute the log likelihoods of a batch of model images fitted to the same image and noise-map, in one vectorized
+    pass. This gives the same log likelihood as a *FitImaging* without an inversion, for every model image.
+
+    The noise normalization term depends only on the noise-map and is therefore computed once for the whole batch.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        The 1D image that is fitted.
+    noise_map : np.ndarray
+        The 1D noise-map of the image.
+    model_images : np.ndarray
+        The 1D model images of shape [total_model_images, total_unmasked_pixels].
+    """
+    image = np.asarray(image)
+    noise_map = np.asarray(noise_map)
+
+    chi_squareds = np.sum(
+        np.square((image[None, :] - model_images) / noise_map[None, :]), axis=1
+    )
+    noise_normalization = np.sum(np.log(2 * np.pi * noise_map ** 2.0))
+
+    return -0.5 * (chi_squareds + noise_normalization)
+
+
+def figure_of_merit_imaging_from(
+    masked_imaging,
+    tracer,
+    hyper_image_sky=None,
+    hyper_background_noise=None,
+    use_hyper_scaling=True,
+    settings_pixelization=pix.SettingsPixelization(),
+    settings_inversion=inv.SettingsInversion(),
+):
+    """
+    Returns the figure of merit of a `FitImaging` of masked imaging with a tracer (its log likelihood, or its log
+    evidence if the tracer has a pixelization), without building the diagnostic arrays of the fit.
+
+    A `FitImaging` stores the profile subtracted image, model image, residual-map, normalized residual-map and
+    chi-squared-map, none of which a `NonLinearSearch` uses. Here the chi-squared and noise normalization are
+    computed in single fused passes over the data, such that no array is allocated for them. The full `FitImaging`
+    is therefore only built for visualization and results.
+
+    Parameters
+    ----------
+    masked_imaging : MaskedImaging
+        The masked imaging that is fitted.
+    tracer : ray_tracing.Tracer
+        The tracer which fits the masked imaging.
+    """
+    if use_hyper_scaling:
+
+        image = hyper_image_from_image_and_hyper_image_sky(
+            image=masked_imaging.image, hyper_image_sky=hyper_image_sky
+        )
+
+        noise_map = hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise(
+            noise_map=masked_imaging.noise_map,
+            tracer=tracer,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+    else:
+
+        image = masked_imaging.image
+        noise_map = masked_imaging.noise_map
+
+    blurred_image = tracer.blurred_image_from_grid_and_convolver(
+        grid=masked_imaging.grid,
+        convolver=masked_imaging.convolver,
+        blurring_grid=masked_imaging.blurring_grid,
+    )
+
+    noise_normalization = noise_normalization_from(noise_map=np.asarray(noise_map))
+
+    if not tracer.has_pixelization:
+
+        chi_squared = chi_squared_from(
+            data=np.asarray(image),
+            model_data=np.asarray(blurred_image),
+            noise_map=np.asarray(noise_map),
+        )
+
+        return fit_util.log_likelihood_from(
+            chi_squared=chi_squared, noise_normalization=noise_normalization
+        )
+
+    profile_subtracted_image = image - blurred_image
+
+    inversion = tracer.inversion_imaging_from_grid_and_data(
+        grid=masked_imaging.grid_inversion,
+        image=profile_subtracted_image,
+        noise_map=noise_map,
+        convolver=masked_imaging.convolver,
+        settings_pixelization=settings_pixelization,
+        settings_inversion=settings_inversion,
+    )
+
+    # The residuals of the image and model image are those of the profile subtracted image and the inversion's
+    # reconstruction, which avoids summing the blurred image and reconstruction into a model image.
+
+    chi_squared = chi_squared_from(
+        data=np.asarray(profile_subtracted_image),
+        model_data=np.asarray(inversion.mapped_reconstructed_image),
+        noise_map=np.asarray(noise_map),
+    )
+
+    return fit_util.log_evidence_from(
+        chi_squared=chi_squared,
+        regularization_term=inversion.regularization_term,
+        log_curvature_regularization_term=inversion.log_det_curvature_reg_matrix_term,
+        log_regularization_term=inversion.log_det_regularization_matrix_term,
+        noise_normalization=noise_normalization,
+    )
+
+
+def log_likelihood_upper_bound_imaging_from(
+    masked_imaging, tracer, hyper_background_noise=None, use_hyper_scaling=True
+):
+    """
+    Returns an upper bound on the figure of merit of a `FitImaging` of masked imaging with a tracer, which is computed
+    from its (hyper) noise-map alone and thus costs only a fraction of the fit.
+
+    The log likelihood is -0.5 times the sum of the chi-squared and noise normalization, and the log evidence of a
+    tracer with a pixelization adds the regularization term and the log determinant of the curvature regularization
+    matrix minus that of the regularization matrix. The chi-squared, regularization term and difference of log
+    determinants are all non-negative, thus neither exceeds -0.5 times the noise normalization.
+
+    Parameters
+    ----------
+    masked_imaging : MaskedImaging
+        The masked imaging that is fitted.
+    tracer : ray_tracing.Tracer
+        The tracer which fits the masked imaging.
+    """
+    if use_hyper_scaling:
+        noise_map = hyper_noise_map_from_noise_map_tracer_and_hyper_background_noise(
+            noise_map=masked_imaging.noise_map,
+            tracer=tracer,
+            hyper_background_noise=hyper_background_noise,
+        )
+    else:
+        noise_map = masked_imaging.noise_map
+
+    return -0.5 * noise_normalization_from(noise_map=np.asarray(noise_map))
+
+
+def log_likelihood_upper_bound_interferometer_from(
+    masked_interferometer, hyper_background_noise=None, use_hyper_scaling=True
+):
+    """
+    Returns an upper bound on the figure of merit of a `FitInterferometer` of a masked interferometer dataset, which is
+    -0.5 times the noise normalization of its (hyper) noise-map (see `log_likelihood_upper_bound_imaging_from`).
+
+    The noise normalization is accumulated over chunks of the dataset's `visibilities_chunk_size` visibilities, such
+    that a memory-mapped noise-map is not loaded in full.
+    """
+    noise_normalization = 0.0
+
+    for chunk in memmap.chunks_from(
+        total=masked_interferometer.noise_map.shape[0],
+        chunk_size=masked_interferometer.visibilities_chunk_size,
+    ):
+
+        noise_map = np.asarray(masked_interferometer.noise_map[chunk])
+
+        if use_hyper_scaling and hyper_background_noise is not None:
+            noise_map = hyper_background_noise.hyper_noise_map_from_complex_noise_map(
+                noise_map=noise_map
+            )
+
+        noise_normalization += noise_normalization_complex_with_mask_from(
+            noise_map=noise_map,
+            mask=np.asarray(masked_interferometer.visibilities_mask[chunk]),
+        )
+
+    return -0.5 * noise_normalization
+
+
+def figure_of_merit_interferometer_from(
+    masked_interferometer,
+    tracer,
+    hyper_background_noise=None,
+    use_hyper_scaling=True,
+    settings_pixelization=pix.SettingsPixelization(),
+    settings_inversion=inv.SettingsInversion(),
+):
+    """
+    Returns the figure of merit of a `FitInterferometer` of a masked interferometer dataset with a tracer, without
+    building the diagnostic arrays of the fit (see `figure_of_merit_imaging_from`).
+
+    Parameters
+    ----------
+    masked_interferometer : MaskedInterferometer
+        The masked interferometer dataset that is fitted.
+    tracer : ray_tracing.Tracer
+        The tracer which fits the masked interferometer dataset.
+    """
+    if (
+        masked_interferometer.visibilities_chunk_size is not None
+        and not tracer.has_pixelization
+    ):
+        return log_likelihood_interferometer_via_chunks_from(
+            masked_interferometer=masked_interferometer,
+            tracer=tracer,
+            hyper_background_noise=hyper_background_noise if use_hyper_scaling else None,
+        )
+
+    if use_hyper_scaling and hyper_background_noise is not None:
+        noise_map = hyper_background_noise.hyper_noise_map_from_complex_noise_map(
+            noise_map=masked_interferometer.noise_map
+        )
+    else:
+        noise_map = masked_interferometer.noise_map
+
+    if (
+        masked_interferometer.w_tilde is not None
+        and tracer.has_pixelization
+        and noise_map is masked_interferometer.noise_map
+    ):
+        return log_evidence_interferometer_via_w_tilde_from(
+            masked_interferometer=masked_interferometer,
+            tracer=tracer,
+            settings_pixelization=settings_pixelization,
+            settings_inversion=settings_inversion,
+        )
+
+    visibilities_mask = np.asarray(masked_interferometer.visibilities_mask)
+
+    profile_visibilities = tracer.profile_visibilities_from_grid_and_transformer(
+        grid=masked_interferometer.grid,
+        transformer=masked_interferometer.transformer,
+    )
+
+    noise_normalization = noise_normalization_complex_with_mask_from(
+        noise_map=np.asarray(noise_map), mask=visibilities_mask
+    )
+
+    if not tracer.has_pixelization:
+
+        chi_squared = chi_squared_complex_with_mask_from(
+            data=np.asarray(masked_interferometer.visibilities),
+            model_data=np.asarray(profile_visibilities),
+            noise_map=np.asarray(noise_map),
+            mask=visibilities_mask,
+        )
+
+        return fit_util.log_likelihood_from(
+            chi_squared=chi_squared, noise_normalization=noise_normalization
+        )
+
+    profile_subtracted_visibilities = (
+        masked_interferometer.visibilities - profile_visibilities
+    )
+
+    inversion = tracer.inversion_interferometer_from_grid_and_data(
+        grid=masked_interferometer.grid_inversion,
+        visibilities=profile_subtracted_visibilities,
+        noise_map=noise_map,
+        transformer=masked_interferometer.transformer,
+        settings_pixelization=settings_pixelization,
+        settings_inversion=settings_inversion,
+    )
+
+    chi_squared = chi_squared_complex_with_mask_from(
+        data=np.asarray(profile_subtracted_visibilities),
+        model_data=np.asarray(inversion.mapped_reconstructed_visibilities),
+        noise_map=np.asarray(noise_map),
+        mask=visibilities_mask,
+    )
+
+    return fit_util.log_evidence_from(
+        chi_squared=chi_squared,
+        regularization_term=inversion.regularization_term,
+        log_curvature_regularization_term=inversion.log_det_curvature_reg_matrix_term,
+        log_regularization_term=inversion.log_det_regularization_matrix_term,
+        noise_normalization=noise_normalization,
+    )
+
+
+def log_likelihood_interferometer_via_chunks_from(
+    masked_interferometer, tracer, hyper_background_noise=None
+):
+    """
+    Returns the log likelihood of a tracer without a pixelization fitted to a masked interferometer dataset, where the
+    profile visibilities, chi-squared and noise normalization are accumulated over chunks of the dataset's
+    `visibilities_chunk_size` visibilities.
+
+    Only one chunk of the visibilities, noise-map and uv-wavelengths (which may be memory-mapped from disk) is held in
+    memory at once. The profile visibilities are computed by the transformer of the masked interferometer:
+
+    - A `TransformerDFT` (or `TransformerDFTChunked`) transforms the image of the tracer one chunk of uv-wavelengths
+      at a time, such that only one chunk of the profile visibilities is held in memory.
+    - Any other transformer (e.g. a `TransformerNUFFT`, whose plan already spans every visibility) transforms the
+      image once, and the chi-squared and noise normalization are accumulated over chunks of the result.
+    """
+    transformer = masked_interferometer.transformer
+    uv_wavelengths = transformer.uv_wavelengths
+
+    if isinstance(transformer, trans.TransformerDFT):
+
+        if tracer.has_light_profile:
+            image = np.asarray(
+                tracer.image_from_grid(grid=masked_interferometer.grid).in_1d_binned
+            )
+        else:
+            image = np.zeros(shape=transformer.grid.shape[0])
+
+        grid_radians = np.asarray(transformer.grid)
+
+    else:
+
+        profile_visibilities = np.asarray(
+            tracer.profile_visibilities_from_grid_and_transformer(
+                grid=masked_interferometer.grid, transformer=transformer
+            )
+        )
+
+    chi_squared = 0.0
+    noise_normalization = 0.0
+
+    for chunk in memmap.chunks_from(
+        total=uv_wavelengths.shape[0],
+        chunk_size=masked_interferometer.visibilities_chunk_size,
+    ):
+
+        noise_map = np.asarray(masked_interferometer.noise_map[chunk])
+
+        if hyper_background_noise is not None:
+            noise_map = hyper_background_noise.hyper_noise_map_from_complex_noise_map(
+                noise_map=noise_map
+            )
+
+        visibilities_mask = np.asarray(masked_interferometer.visibilities_mask[chunk])
+
+        if isinstance(transformer, trans.TransformerDFT):
+            profile_visibilities_chunk = transformer_util.visibilities_jit(
+                image_1d=image,
+                grid_radians=grid_radians,
+                uv_wavelengths=np.asarray(uv_wavelengths[chunk], dtype="float"),
+            )
+        else:
+            profile_visibilities_chunk = profile_visibilities[chunk]
+
+        chi_squared += chi_squared_complex_with_mask_from(
+            data=np.asarray(masked_interferometer.visibilities[chunk]),
+            model_data=profile_visibilities_chunk,
+            noise_map=noise_map,
+            mask=visibilities_mask,
+        )
+
+        noise_normalization += noise_normalization_complex_with_mask_from(
+            noise_map=noise_map, mask=visibilities_mask
+        )
+
+    return fit_util.log_likelihood_from(
+        chi_squared=chi_squared, noise_normalization=noise_normalization
+    )
+
+
+def log_evidence_interferometer_via_w_tilde_from(
+    masked_interferometer,
+    tracer,
+    settings_pixelization=pix.SettingsPixelization(),
+    settings_inversion=inv.SettingsInversion(),
+):
+    """
+    Returns the log evidence of a tracer with a pixelization fitted to a masked interferometer dataset via the w-tilde
+    of the dataset, such that the visibilities are not touched and the cost is independent of their number (see
+    `WTildeInterferometer`).
+
+    The profile image of the tracer is subtracted from the visibilities in the image pixels, where the dirty image of
+    the profile subtracted visibilities is the dirty image of the visibilities minus the w matrix times the profile
+    image. The chi-squared is that of the sum of the profile image and the inversion's reconstruction.
+
+    The w-tilde is an exact DFT of the image pixels and is computed for the noise-map of the dataset, thus this is only
+    used if the noise-map is not scaled by a hyper background noise.
+    """
+    w_tilde = masked_interferometer.w_tilde
+
+    if tracer.has_light_profile:
+        profile_image = np.asarray(
+            tracer.image_from_grid(grid=masked_interferometer.grid).in_1d_binned
+        )
+    else:
+        profile_image = np.zeros(shape=w_tilde.dirty_image.shape[0])
+
+    inversion = tracer.inversion_interferometer_via_w_tilde_from_grid_and_image(
+        grid=masked_interferometer.grid_inversion,
+        image=w_tilde.dirty_image - np.dot(w_tilde.w_matrix, profile_image),
+        w_tilde=w_tilde,
+        noise_map=masked_interferometer.noise_map,
+        transformer=masked_interferometer.transformer,
+        settings_pixelization=settings_pixelization,
+        settings_inversion=settings_inversion,
+    )
+
+    chi_squared = w_tilde.chi_squared_from_model_image(
+        model_image=profile_image + np.asarray(inversion.mapped_reconstructed_image)
+    )
+
+    return fit_util.log_evidence_from(
+        chi_squared=chi_squared,
+        regularization_term=inversion.regularization_term,
+        log_curvature_regularization_term=inversion.log_det_curvature_reg_matrix_term,
+        log_regularization_term=inversion.log_det_regularization_matrix_term,
+        noise_normalization=w_tilde.noise_normalization,
+    )
+
+
+@decorator_util.jit()
+def chi_squared_from(data, model_data, noise_map):
+    """
+    Returns the chi-squared of model data fitted to data, summing ((data - model_data) / noise_map) ** 2.0 in one pass
+    without allocating the residual-map or chi-squared-map.
+    """
+    chi_squared = 0.0
+
+    for index in range(data.shape[0]):
+        chi_squared += ((data[index] - model_data[index]) / noise_map[index]) ** 2.0
+
+    return chi_squared
+
+
+@decorator_util.jit()
+def noise_normalization_from(noise_map):
+    """
+    Returns the noise normalization term of a noise-map, summing log(2 * pi * noise_map ** 2.0) in one pass.
+    """
+    noise_normalization = 0.0
+
+    for index in range(noise_map.shape[0]):
+        noise_normalization += np.log(2 * np.pi * noise_map[index] ** 2.0)
+
+    return noise_normalization
+
+
+@decorator_util.jit()
+def chi_squared_complex_with_mask_from(data, model_data, noise_map, mask):
+    """
+    Returns the chi-squared of complex model data fitted to complex data, summing the chi-squared of the real and
+    imaginary components of every unmasked entry in one pass.
+    """
+    chi_squared = 0.0
+
+    for index in range(data.shape[0]):
+
+        if not mask[index]:
+
+            residual = data[index] - model_data[index]
+
+            chi_squared += (residual.real / noise_map[index].real) ** 2.0
+            chi_squared += (residual.imag / noise_map[index].imag) ** 2.0
+
+    return chi_squared
+
+
+@decorator_util.jit()
+def noise_normalization_complex_with_mask_from(noise_map, mask):
+    """
+    Returns the noise normalization term of a complex noise-map, summing the terms of the real and imaginary
+    components of every unmasked entry in one pass.
+    """
+    noise_normalization = 0.0
+
+    for index in range(noise_map.shape[0]):
+
+        if not mask[index]:
+
+            noise_normalization += np.log(2 * np.pi * noise_map[index].real ** 2.0)
+            noise_normalization += np.log(2 * np.pi * noise_map[index].imag ** 2.0)
+
+    return noise_normalization
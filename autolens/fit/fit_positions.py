@@ -1,5 +1,6 @@
 import numpy as np
 
+from autoarray import decorator_util
 from autoarray.fit import fit as aa_fit
 from autogalaxy.galaxy import galaxy as g
 
@@ -30,22 +31,23 @@ class AbstractFitPositionsSourcePlane:
 
     @property
     def maximum_separations(self):
-        return [
-            self.max_separation_of_grid(grid=np.asarray(positions))
-            for positions in self.source_plane_positions.in_grouped_list
-        ]
+        return list(
+            max_separations_of_grouped_grid_from(
+                grid=np.asarray(self.source_plane_positions),
+                upper_indexes=np.asarray(self.positions.upper_indexes),
+            )
+        )
 
     def maximum_separation_within_threshold(self, threshold):
-        return max(self.maximum_separations) <= threshold
+        return grouped_grid_max_separation_within_threshold_from(
+            grid=np.asarray(self.source_plane_positions),
+            upper_indexes=np.asarray(self.positions.upper_indexes),
+            threshold=threshold,
+        )
 
     @staticmethod
     def max_separation_of_grid(grid):
-        rdist_max = np.zeros((grid.shape[0]))
-        for i in range(grid.shape[0]):
-            xdists = np.square(np.subtract(grid[i, 0], grid[:, 0]))
-            ydists = np.square(np.subtract(grid[i, 1], grid[:, 1]))
-            rdist_max[i] = np.max(np.add(xdists, ydists))
-        return np.max(np.sqrt(rdist_max))
+        return max_separation_of_grid_from(grid=np.asarray(grid))
 
 
 class FitPositionsSourcePlaneMaxSeparation(AbstractFitPositionsSourcePlane):
@@ -71,3 +73,110 @@ class FitPositionsSourcePlaneMaxSeparation(AbstractFitPositionsSourcePlane):
     @property
     def figure_of_merit(self):
         return -0.5 * sum(self.chi_squared_map)
+
+
+def positions_trace_within_threshold_via_tracer(positions, tracer, threshold):
+    """
+    Returns whether every group of image-plane positions traces to within a threshold of one another in the
+    source-plane, where the maximum separation of every group is compared to the threshold.
+
+    This gives the same result as `FitPositionsSourcePlaneMaxSeparation.maximum_separation_within_threshold`, but
+    the positions are traced to the source-plane as a NumPy array (without creating a `GridIrregularGrouped` for
+    every plane) and the separations are computed in a single numba pass which exits as soon as any pair of
+    positions is separated by more than the threshold. It is used to resample models whose positions do not trace
+    within the threshold, which is performed for every model fitted by a `NonLinearSearch`.
+
+    Parameters
+    ----------
+    positions : grids.GridIrregularGrouped
+        The (y,x) arc-second coordinates of the groups of positions in the image-plane.
+    tracer : ray_tracing.Tracer
+        The object that defines the ray-tracing of the strong lens system of galaxies.
+    threshold : float
+        The maximum separation every group of positions must trace within.
+    """
+    return grouped_grid_max_separation_within_threshold_from(
+        grid=tracer.source_plane_coordinates_from_grid(grid=positions),
+        upper_indexes=np.asarray(positions.upper_indexes),
+        threshold=threshold,
+    )
+
+
+@decorator_util.jit()
+def max_separation_of_grid_from(grid):
+    """
+    Returns the maximum separation between any two (y,x) coordinates of a grid of shape [total_coordinates, 2], which
+    is NaN if any coordinate is NaN (e.g. a position traced from a singular mass profile centre).
+    """
+    max_squared_separation = 0.0
+
+    for i in range(grid.shape[0]):
+        for j in range(i + 1, grid.shape[0]):
+
+            squared_separation = (grid[i, 0] - grid[j, 0]) ** 2 + (
+                grid[i, 1] - grid[j, 1]
+            ) ** 2
+
+            if np.isnan(squared_separation):
+                return np.nan
+
+            if squared_separation > max_squared_separation:
+                max_squared_separation = squared_separation
+
+    return np.sqrt(max_squared_separation)
+
+
+@decorator_util.jit()
+def max_separations_of_grouped_grid_from(grid, upper_indexes):
+    """
+    Returns the maximum separation between the (y,x) coordinates of every group of a grouped grid, where the grid
+    is a NumPy array of shape [total_coordinates, 2] and the coordinates of group i are the entries
+    upper_indexes[i-1] (or 0) to upper_indexes[i].
+    """
+    max_separations = np.zeros(upper_indexes.shape[0])
+
+    lower_index = 0
+
+    for group_index in range(upper_indexes.shape[0]):
+
+        upper_index = upper_indexes[group_index]
+
+        max_separations[group_index] = max_separation_of_grid_from(
+            grid=grid[lower_index:upper_index]
+        )
+
+        lower_index = upper_index
+
+    return max_separations
+
+
+@decorator_util.jit()
+def grouped_grid_max_separation_within_threshold_from(grid, upper_indexes, threshold):
+    """
+    Returns whether the maximum separation of the (y,x) coordinates of every group of a grouped grid is within a
+    threshold, returning False as soon as any pair of coordinates in a group is separated by more than the threshold
+    or has a separation which is not finite.
+
+    See `max_separations_of_grouped_grid_from` for a description of the grouped grid.
+    """
+    squared_threshold = threshold ** 2
+
+    lower_index = 0
+
+    for group_index in range(upper_indexes.shape[0]):
+
+        upper_index = upper_indexes[group_index]
+
+        for i in range(lower_index, upper_index):
+            for j in range(i + 1, upper_index):
+
+                squared_separation = (grid[i, 0] - grid[j, 0]) ** 2 + (
+                    grid[i, 1] - grid[j, 1]
+                ) ** 2
+
+                if not squared_separation <= squared_threshold:
+                    return False
+
+        lower_index = upper_index
+
+    return True
@@ -1,4 +1,5 @@
 from autoarray import decorator_util
+from numba import prange
 import numpy as np
 from autoarray.util import grid_util, mask_util
 
@@ -120,7 +121,9 @@ class AbstractPositionsSolver:
             ),
         )
 
-    def grid_peaks_from(self, lensing_obj, grid, source_plane_coordinate):
+    def grid_peaks_from(
+        self, lensing_obj, grid, source_plane_coordinate, total_grids=1
+    ):
         """Find the 'peaks' of a grid of coordinates, where a peak corresponds to a (y,x) coordinate on the grid which
         traces closer to the input (y,x) source-plane coordinate than any of its 8 adjacent neighbors. This is
         performed by:
@@ -145,6 +148,9 @@ class AbstractPositionsSolver:
         source_plane_coordinate : (y,x)
             The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
             for.
+        total_grids : int
+            The number of square grids of equal size the grid concatenates, whose peaks are found separately but
+            whose deflection angles are computed in one call.
         """
         deflections = lensing_obj.deflections_from_grid(grid=grid)
         source_plane_grid = grid.grid_from_deflection_grid(deflection_grid=deflections)
@@ -152,12 +158,14 @@ class AbstractPositionsSolver:
             coordinate=source_plane_coordinate
         )
 
-        neighbors, has_neighbors = grid_square_neighbors_1d_from(shape_1d=grid.shape[0])
+        neighbors, has_neighbors = grid_square_neighbors_1d_from(
+            shape_1d=grid.shape[0] // total_grids, total_grids=total_grids
+        )
 
         grid_peaks = grid_peaks_from(
             distance_1d=source_plane_distances,
             grid_1d=grid,
-            neighbors=neighbors.astype("int"),
+            neighbors=neighbors,
             has_neighbors=has_neighbors,
         )
 
@@ -281,16 +289,10 @@ class PositionsFinder(AbstractPositionsSolver):
             for.
         """
 
-        grid = self.grid_buffed_and_upscaled_around_coordinate_from(
-            coordinate=coordinate,
-            pixel_scales=(pixel_scale, pixel_scale),
-            buffer=4,
-            upscale_factor=self.upscale_factor,
-        )
-
-        grid = self.grid_peaks_from(
+        grid = self.refined_coordinates_from_coordinates(
+            coordinates=np.asarray([coordinate]),
+            pixel_scale=pixel_scale,
             lensing_obj=lensing_obj,
-            grid=grid,
             source_plane_coordinate=source_plane_coordinate,
         )
 
@@ -299,6 +301,55 @@ class PositionsFinder(AbstractPositionsSolver):
         else:
             return [tuple(coordinate) for coordinate in grid]
 
+    def refined_coordinates_from_coordinates(
+        self, coordinates, pixel_scale, lensing_obj, source_plane_coordinate
+    ):
+        """For a 1D grid of (y,x) coordinates, determine the refined coordinates of every coordinate (see
+        `refined_coordinates_from_coordinate`), returned as one 1D grid in the order of the input coordinates.
+
+        The higher resolution grids around every coordinate are concatenated, such that the deflection angles of all
+        of them are computed in one call to the lensing object as opposed to one call per coordinate.
+
+        Parameters
+        ----------
+        coordinates : np.ndarray
+            The (y,x) coordinates around which the upscaled grids used to find the refined coordinates are computed.
+        pixel_scale : float
+            The pixel-scale resolution of the buffed and upscaled grids that are formed around the input coordinates.
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
+            for.
+        """
+
+        coordinates = np.asarray(coordinates).reshape(-1, 2)
+
+        if coordinates.shape[0] == 0:
+            return coordinates
+
+        upscale_factor = self.upscale_factor if self.use_upscaling else 1
+
+        grid = grids.GridIrregularGroupedUniform(
+            grid=grid_buffed_around_coordinates_from(
+                coordinates=coordinates,
+                pixel_scales=(pixel_scale, pixel_scale),
+                buffer=4,
+                upscale_factor=upscale_factor,
+            ),
+            pixel_scales=(pixel_scale / upscale_factor, pixel_scale / upscale_factor),
+        )
+
+        grid = self.grid_peaks_from(
+            lensing_obj=lensing_obj,
+            grid=grid,
+            source_plane_coordinate=source_plane_coordinate,
+            total_grids=coordinates.shape[0],
+        )
+
+        return np.asarray(grid).reshape(-1, 2)
+
     def solve_from_tracer(self, tracer):
         """Needs work - idea is it solves for all image plane multiple image positions using the redshift distribution of
         the tracer."""
@@ -329,22 +380,15 @@ class PositionsFinder(AbstractPositionsSolver):
 
         while pixel_scale > self.pixel_scale_precision:
 
-            refined_coordinates_list = []
-
-            for coordinate in coordinates_list:
-
-                refined_coordinates = self.refined_coordinates_from_coordinate(
-                    coordinate=coordinate,
-                    pixel_scale=pixel_scale,
-                    lensing_obj=lensing_obj,
-                    source_plane_coordinate=source_plane_coordinate,
-                )
-
-                if refined_coordinates is not None:
-                    refined_coordinates_list += refined_coordinates
+            refined_coordinates_list = self.refined_coordinates_from_coordinates(
+                coordinates=coordinates_list,
+                pixel_scale=pixel_scale,
+                lensing_obj=lensing_obj,
+                source_plane_coordinate=source_plane_coordinate,
+            )
 
             refined_coordinates_list = grid_remove_duplicates(
-                grid=np.asarray(refined_coordinates_list)
+                grid=refined_coordinates_list
             )
 
             pixel_scale = pixel_scale / self.upscale_factor
@@ -363,38 +407,414 @@ class PositionsFinder(AbstractPositionsSolver):
         return grids.GridIrregularGrouped(grid=coordinates_list)
 
 
+class PositionsFinderTriangles(AbstractPositionsSolver):
+    def __init__(
+        self,
+        grid,
+        pixel_scale_precision,
+        distance_from_source_centre=None,
+        distance_from_mass_profile_centre=None,
+    ):
+        """Given a `LensingObject` (e.g. a _MassProfile, `Galaxy`, `Plane` or _Tracer_) this class uses their
+        deflections_from_grid method to determine the (y,x) coordinates the multiple-images appear given a (y,x)
+        source-centre coordinate in the source-plane, by adaptively refining a mesh of triangles.
+
+        This is performed as follows:
+
+         1) The (y,x) coordinates of the input grid are used as the vertices of a mesh of square cells, where every
+            cell is split into two triangles.
+         2) Every vertex is ray-traced to the source-plane and the cells with a traced triangle which contains the
+            source-plane coordinate are retained, as they contain a multiple image.
+         3) The retained cells are divided into 4 cells of half their size and step 2 is repeated, until the cells are
+            smaller than the `pixel_scale_precision`.
+         4) The multiple images are estimated by linearly interpolating the vertices of every retained triangle to
+            the source-plane coordinate, and estimates of the same image in neighboring cells are merged.
+
+        Compared to the `PositionsFinder`, only the cells which contain a multiple image are refined and the
+        deflection angles of vertices shared by neighboring cells, or by a cell and the cells it is divided into, are
+        computed once.
+
+        Near the centre of a singular mass profile the traced triangles are large and may contain the source-plane
+        coordinate without a multiple image being present. By default, the multiple images which do not trace within
+        the `pixel_scale_precision` of the source-plane coordinate are therefore removed.
+
+        Parameters
+        ----------
+        grid : autoarray.Grid
+            The uniform grid of (y,x) coordinates that the multiple images are searched for on, where every square of
+            4 neighboring coordinates forms a cell of the initial mesh.
+        pixel_scale_precision : float
+            The size of the cells below which refinement stops.
+        distance_from_source_centre : float or None
+            Multiple images which do not trace within this distance of the source-plane coordinate are removed, where
+            the `pixel_scale_precision` is used if this is None.
+        distance_from_mass_profile_centre : float or None
+            If input, multiple images within this distance of the centre of a mass profile are removed.
+        """
+
+        if distance_from_source_centre is None:
+            distance_from_source_centre = pixel_scale_precision
+
+        super(PositionsFinderTriangles, self).__init__(
+            distance_from_source_centre=distance_from_source_centre,
+            distance_from_mass_profile_centre=distance_from_mass_profile_centre,
+        )
+
+        self.grid = grid.in_1d_binned
+        self.pixel_scale_precision = pixel_scale_precision
+
+        self.total_refinements = max(
+            int(np.ceil(np.log2(self.grid.pixel_scale / pixel_scale_precision))), 0
+        )
+
+        grid_1d = np.asarray(self.grid)
+
+        self.vertex_origin = (np.max(grid_1d[:, 0]), np.min(grid_1d[:, 1]))
+        self.vertex_scale = self.grid.pixel_scale / 2 ** self.total_refinements
+
+        self.grid_vertices = np.rint(
+            np.stack(
+                (
+                    self.vertex_origin[0] - grid_1d[:, 0],
+                    grid_1d[:, 1] - self.vertex_origin[1],
+                ),
+                axis=1,
+            )
+            / self.grid.pixel_scale
+        ).astype("int")
+
+        self.vertex_stride = (
+            np.max(self.grid_vertices[:, 1]) + 1
+        ) * 2 ** self.total_refinements
+
+    def image_plane_vertices_from(self, vertices):
+        """Convert the integer (y,x) indexes of vertices of the mesh, given at the resolution of the finest
+        refinement, to their (y,x) image-plane coordinates."""
+        return np.stack(
+            (
+                self.vertex_origin[0] - vertices[:, 0] * self.vertex_scale,
+                self.vertex_origin[1] + vertices[:, 1] * self.vertex_scale,
+            ),
+            axis=1,
+        )
+
+    def source_plane_vertices_from(self, lensing_obj, vertices, traced_vertices):
+        """Ray-trace the vertices of the mesh, whose integer (y,x) indexes are given at the resolution of the finest
+        refinement, to the source-plane.
+
+        Only vertices which are not already in the traced_vertices dictionary have their deflection angles computed,
+        such that vertices shared by neighboring cells or by a cell and the cells it is divided into are ray-traced
+        once.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            `MassProfile`, _Galaxy_, `Plane` or _Tracer_.
+        vertices : np.ndarray
+            The integer (y,x) indexes of the vertices which are ray-traced.
+        traced_vertices : dict
+            Dictionary mapping the key of every vertex ray-traced so far to its source-plane (y,x) coordinate, which
+            is updated with the newly ray-traced vertices.
+        """
+        keys = vertices[:, 0] * self.vertex_stride + vertices[:, 1]
+
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+
+        untraced_keys = np.asarray(
+            [key for key in unique_keys if key not in traced_vertices], dtype="int"
+        )
+
+        if len(untraced_keys) > 0:
+
+            grid = grids.GridIrregular(
+                grid=self.image_plane_vertices_from(
+                    vertices=np.stack(
+                        (
+                            untraced_keys // self.vertex_stride,
+                            untraced_keys % self.vertex_stride,
+                        ),
+                        axis=1,
+                    )
+                )
+            )
+
+            deflections = lensing_obj.deflections_from_grid(grid=grid)
+
+            traced_vertices.update(
+                zip(untraced_keys, np.asarray(grid) - np.asarray(deflections))
+            )
+
+        return np.asarray([traced_vertices[key] for key in unique_keys])[inverse]
+
+    def solve_from_tracer(self, tracer):
+        """Solve for the multiple image positions of the centre of every light profile in the final plane of the
+        tracer."""
+        return grids.GridIrregularGrouped(
+            grid=[
+                self.solve(lensing_obj=tracer, source_plane_coordinate=centre)
+                for centre in tracer.light_profile_centres.in_grouped_list[-1]
+            ]
+        )
+
+    def solve(self, lensing_obj, source_plane_coordinate):
+
+        source_plane_coordinate = np.asarray(source_plane_coordinate)
+
+        cells = grid_square_cells_from(grid_vertices=self.grid_vertices)
+
+        traced_vertices = {}
+
+        for refinement in range(self.total_refinements + 1):
+
+            if refinement > 0:
+                cells = cells_divided_from(cells=cells)
+
+            triangle_vertices = triangle_vertices_from(cells=cells) * 2 ** (
+                self.total_refinements - refinement
+            )
+
+            source_plane_triangles = self.source_plane_vertices_from(
+                lensing_obj=lensing_obj,
+                vertices=triangle_vertices.reshape(-1, 2),
+                traced_vertices=traced_vertices,
+            ).reshape(-1, 3, 2)
+
+            contains_coordinate = triangles_contain_coordinate_from(
+                triangles=source_plane_triangles, coordinate=source_plane_coordinate
+            )
+
+            cells = cells[np.any(contains_coordinate.reshape(-1, 2), axis=1)]
+
+            if cells.shape[0] == 0:
+                break
+
+        image_plane_triangles = self.image_plane_vertices_from(
+            vertices=triangle_vertices.reshape(-1, 2)
+        ).reshape(-1, 3, 2)
+
+        coordinates = triangles_interpolated_coordinate_from(
+            image_plane_triangles=image_plane_triangles[contains_coordinate],
+            source_plane_triangles=source_plane_triangles[contains_coordinate],
+            coordinate=source_plane_coordinate,
+        )
+
+        coordinates = grid_merge_within_distance(
+            grid=coordinates,
+            distance=2.0 * self.vertex_scale,
+        )
+
+        if coordinates.shape[0] == 0:
+            return grids.GridIrregularGrouped(grid=[])
+
+        coordinates = self.grid_with_coordinates_from_mass_profile_centre_removed(
+            lensing_obj=lensing_obj,
+            grid=grids.GridIrregularGroupedUniform(
+                grid=coordinates, pixel_scales=(self.vertex_scale, self.vertex_scale)
+            ),
+        )
+
+        coordinates = self.grid_within_distance_of_source_plane_centre(
+            lensing_obj=lensing_obj,
+            grid=grids.GridIrregularGroupedUniform(
+                grid=coordinates, pixel_scales=(self.vertex_scale, self.vertex_scale)
+            ),
+            source_plane_coordinate=source_plane_coordinate,
+            distance=self.distance_from_source_centre,
+        )
+
+        return grids.GridIrregularGrouped(grid=coordinates)
+
+
 @decorator_util.jit()
 def grid_remove_duplicates(grid):
+    """
+    Remove duplicate (y,x) coordinates from a grid, where two coordinates are duplicates if they are separated by less
+    than a tolerance of 1e-8. Of every set of duplicates the last coordinate is retained, and the retained
+    coordinates are returned in their input order.
+
+    Coordinates are paired to the cells of a square grid whose pixel-scale is the tolerance, such that every
+    coordinate is only compared to the coordinates in its own and its 8 neighboring cells (see
+    `grid_cells_sorted_from`). This scales as O(N log N) in the number of coordinates, as opposed to computing the
+    separations of all coordinates with one another.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The (y,x) coordinates from which duplicates are removed.
+    """
 
     tolerance = 1e-8
 
-    grid_no_duplicates = []
+    cells, sort_index = grid_cells_sorted_from(grid=grid, cell_size=tolerance)
 
-    separations = np.zeros((grid.shape[0], grid.shape[0]))
+    grid_no_duplicates = []
 
-    for i in range(grid.shape[0]):
-        for j in range(grid.shape[0]):
-            separations[i, j] = np.sqrt(
-                np.square(grid[i, 0] - grid[j, 0]) + np.square(grid[i, 1] - grid[j, 1])
-            )
-            separations[i, i] = tolerance * 2
+    for sorted_index in range(grid.shape[0]):
 
-    for i in range(grid.shape[0]):
+        i = sort_index[sorted_index]
 
         is_duplicate = False
 
-        for j in range(grid.shape[0]):
+        for cell_y in range(cells[sorted_index, 0] - 1, cells[sorted_index, 0] + 2):
+            for cell_x in range(
+                cells[sorted_index, 1] - 1, cells[sorted_index, 1] + 2
+            ):
 
-            if separations[i, j] < tolerance:
+                start = sorted_cells_index_from(
+                    cells=cells, cell_y=cell_y, cell_x=cell_x
+                )
+                end = sorted_cells_index_from(
+                    cells=cells, cell_y=cell_y, cell_x=cell_x + 1
+                )
 
-                is_duplicate = True
-                separations[i, j] = tolerance * 2
-                separations[j, i] = tolerance * 2
+                for j in sort_index[start:end]:
+
+                    if j > i and (
+                        np.sqrt(
+                            np.square(grid[i, 0] - grid[j, 0])
+                            + np.square(grid[i, 1] - grid[j, 1])
+                        )
+                        < tolerance
+                    ):
+                        is_duplicate = True
 
         if not is_duplicate:
-            grid_no_duplicates.append((grid[i, 0], grid[i, 1]))
+            grid_no_duplicates.append((i, grid[i, 0], grid[i, 1]))
+
+    grid_no_duplicates.sort()
+
+    return [(y, x) for i, y, x in grid_no_duplicates]
+
+
+@decorator_util.jit()
+def grid_cells_sorted_from(grid, cell_size):
+    """
+    Pair every (y,x) coordinate of a grid to a cell of a square grid of input pixel-scale, returning the integer (y,x)
+    index of every coordinate's cell sorted by y and then x, alongside the indexes which sort the grid.
+
+    This is a spatial hash of the grid: the coordinates within a distance cell_size of an input coordinate are all
+    in its own cell or the 8 cells neighboring it, whose coordinates are found by a binary search of the sorted cells
+    (see `sorted_cells_index_from`).
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The (y,x) coordinates which are paired to cells.
+    cell_size : float
+        The size of every square cell.
+    """
+    cells_unsorted = np.zeros(shape=(grid.shape[0], 2), dtype=np.int64)
+
+    for grid_index in range(grid.shape[0]):
+        cells_unsorted[grid_index, 0] = np.int64(
+            np.floor(grid[grid_index, 0] / cell_size)
+        )
+        cells_unsorted[grid_index, 1] = np.int64(
+            np.floor(grid[grid_index, 1] / cell_size)
+        )
+
+    sort_index = np.argsort(cells_unsorted[:, 1], kind="mergesort")
+    sort_index = sort_index[
+        np.argsort(cells_unsorted[sort_index, 0], kind="mergesort")
+    ]
+
+    cells = np.zeros(shape=(grid.shape[0], 2), dtype=np.int64)
+
+    for sorted_index in range(grid.shape[0]):
+        cells[sorted_index, :] = cells_unsorted[sort_index[sorted_index], :]
+
+    return cells, sort_index
+
+
+@decorator_util.jit()
+def sorted_cells_index_from(cells, cell_y, cell_x):
+    """
+    For cells sorted by y and then x (see `grid_cells_sorted_from`), use a binary search to find the index of the
+    first cell which is not before the input (y,x) cell.
 
-    return grid_no_duplicates
+    The coordinates paired to a cell (y,x) are therefore at the sorted indexes between this index for the cell (y,x)
+    and for the cell (y,x+1).
+
+    Parameters
+    ----------
+    cells : np.ndarray
+        The integer (y,x) indexes of cells sorted by y and then x.
+    cell_y : int
+        The y index of the cell that is searched for.
+    cell_x : int
+        The x index of the cell that is searched for.
+    """
+    lower = 0
+    upper = cells.shape[0]
+
+    while lower < upper:
+
+        middle = (lower + upper) // 2
+
+        if cells[middle, 0] < cell_y or (
+            cells[middle, 0] == cell_y and cells[middle, 1] < cell_x
+        ):
+            lower = middle + 1
+        else:
+            upper = middle
+
+    return lower
+
+
+@decorator_util.jit()
+def coordinates_within_distance_of_grid_from(coordinates, grid, distance):
+    """
+    Determine whether every (y,x) coordinate in an input array is within an input distance of any coordinate on a
+    grid, using the spatial hash of `grid_cells_sorted_from` such that every coordinate is only compared to the grid
+    coordinates in neighboring cells.
+
+    This is used to match the multiple images found by a positions solver to a set of known multiple images.
+
+    Parameters
+    ----------
+    coordinates : np.ndarray
+        The (y,x) coordinates which are tested.
+    grid : np.ndarray
+        The (y,x) coordinates the distance of every input coordinate is computed to.
+    distance : float
+        The distance within which a coordinate must be of a grid coordinate.
+    """
+    cells, sort_index = grid_cells_sorted_from(grid=grid, cell_size=distance)
+
+    within_distance = np.full(shape=coordinates.shape[0], fill_value=False)
+
+    for coordinate_index in range(coordinates.shape[0]):
+
+        coordinate_cell_y = np.int64(
+            np.floor(coordinates[coordinate_index, 0] / distance)
+        )
+        coordinate_cell_x = np.int64(
+            np.floor(coordinates[coordinate_index, 1] / distance)
+        )
+
+        for cell_y in range(coordinate_cell_y - 1, coordinate_cell_y + 2):
+            for cell_x in range(coordinate_cell_x - 1, coordinate_cell_x + 2):
+
+                start = sorted_cells_index_from(
+                    cells=cells, cell_y=cell_y, cell_x=cell_x
+                )
+                end = sorted_cells_index_from(
+                    cells=cells, cell_y=cell_y, cell_x=cell_x + 1
+                )
+
+                for j in sort_index[start:end]:
+
+                    if (
+                        np.sqrt(
+                            np.square(coordinates[coordinate_index, 0] - grid[j, 0])
+                            + np.square(coordinates[coordinate_index, 1] - grid[j, 1])
+                        )
+                        < distance
+                    ):
+                        within_distance[coordinate_index] = True
+
+    return within_distance
 
 
 @decorator_util.jit()
@@ -420,45 +840,93 @@ def grid_buffed_around_coordinate_from(
 
     grid_1d = np.zeros(shape=(total_coordinates, 2))
 
-    grid_index = 0
+    # Tuples are unpacked to scalars, which (unlike tuples) numba passes to the body of a parallel loop.
 
-    pixel_scales_upscaled = (
-        pixel_scales[0] / upscale_factor,
-        pixel_scales[1] / upscale_factor,
-    )
+    coordinate_y = coordinate[0]
+    coordinate_x = coordinate[1]
+
+    y_pixel_scale_upscaled = pixel_scales[0] / upscale_factor
+    x_pixel_scale_upscaled = pixel_scales[1] / upscale_factor
 
-    y_upscale_half = pixel_scales_upscaled[0] / 2
-    x_upscale_half = pixel_scales_upscaled[1] / 2
+    y_upscale_half = y_pixel_scale_upscaled / 2
+    x_upscale_half = x_pixel_scale_upscaled / 2
 
     edge = int(np.sqrt(total_coordinates))
 
     if edge % 2 != 0:
         edge_start = -int((edge - 1) / 2)
-        edge_end = int((edge - 1) / 2) + 1
         y_odd_pixel_scale = y_upscale_half
         x_odd_pixel_scale = x_upscale_half
     else:
         edge_start = -int(edge / 2)
-        edge_end = int(edge / 2)
         y_odd_pixel_scale = 0.0
         x_odd_pixel_scale = 0.0
 
-    for y in range(edge_start, edge_end):
-        for x in range(edge_start, edge_end):
+    for y_index in prange(edge):
+
+        y = edge_start + y_index
+
+        for x_index in range(edge):
+
+            x = edge_start + x_index
+
+            grid_index = y_index * edge + x_index
 
             grid_1d[grid_index, 0] = (
-                coordinate[0]
-                - y * pixel_scales_upscaled[0]
+                coordinate_y
+                - y * y_pixel_scale_upscaled
                 - y_upscale_half
                 + y_odd_pixel_scale
             )
             grid_1d[grid_index, 1] = (
-                coordinate[1]
-                + x * pixel_scales_upscaled[1]
+                coordinate_x
+                + x * x_pixel_scale_upscaled
                 + x_upscale_half
                 - x_odd_pixel_scale
             )
-            grid_index += 1
+
+    return grid_1d
+
+
+@decorator_util.jit()
+def grid_buffed_around_coordinates_from(
+    coordinates, pixel_scales, buffer, upscale_factor=1
+):
+    """
+    For a 1D grid of (y,x) coordinates, return the buffed and upscaled grid around every coordinate (see
+    `grid_buffed_around_coordinate_from`) concatenated in one 1D grid, such that the grid around the coordinate of
+    index i are the entries i * total_coordinates to (i + 1) * total_coordinates.
+
+    Parameters
+    ----------
+    coordinates : np.ndarray
+        The (y,x) Cartesian coordinates around which the buffed and upscaled grids are created.
+    pixel_scales : (float, float)
+        The pixel scale of the uniform grid before upscaling.
+    """
+
+    total_coordinates = (upscale_factor * (2 * buffer + 1)) ** 2
+
+    grid_1d = np.zeros(shape=(coordinates.shape[0] * total_coordinates, 2))
+
+    y_pixel_scale = pixel_scales[0]
+    x_pixel_scale = pixel_scales[1]
+
+    for coordinate_index in prange(coordinates.shape[0]):
+
+        grid_start = coordinate_index * total_coordinates
+
+        grid_1d[
+            grid_start : grid_start + total_coordinates, :
+        ] = grid_buffed_around_coordinate_from(
+            coordinate=(
+                coordinates[coordinate_index, 0],
+                coordinates[coordinate_index, 1],
+            ),
+            pixel_scales=(y_pixel_scale, x_pixel_scale),
+            buffer=buffer,
+            upscale_factor=upscale_factor,
+        )
 
     return grid_1d
 
@@ -474,7 +942,7 @@ def pair_coordinate_to_closest_pixel_on_grid(coordinate, grid_1d):
 
 
 @decorator_util.jit()
-def grid_square_neighbors_1d_from(shape_1d):
+def grid_square_neighbors_1d_from(shape_1d, total_grids=1):
     """
     From a (y,x) grid of coordinates, determine the 8 neighors of every coordinate on the grid which has 8
     neighboring (y,x) coordinates.
@@ -507,20 +975,24 @@ def grid_square_neighbors_1d_from(shape_1d):
     ----------
     shape_1d : np.ndarray
         The irregular 1D grid of (y,x) coordinates over which a square uniform grid is overlaid.
-    pixel_scales : (float, float)
-        The pixel scale of the uniform grid that laid over the irregular grid of (y,x) coordinates.
+    total_grids : int
+        The number of square grids of size shape_1d concatenated in 1D (e.g. by `grid_buffed_around_coordinates_from`),
+        where the neighbors of every pixel are on the same grid.
     """
 
     shape_of_edge = int(np.sqrt(shape_1d))
 
-    has_neighbors = np.full(shape=shape_1d, fill_value=False)
-    neighbors_1d = np.full(shape=(shape_1d, 8), fill_value=-1.0)
+    has_neighbors = np.full(shape=shape_1d * total_grids, fill_value=False)
+    neighbors_1d = np.full(shape=(shape_1d * total_grids, 8), fill_value=-1)
 
-    index = 0
+    for row in prange(shape_of_edge * total_grids):
+
+        y = row % shape_of_edge
 
-    for y in range(shape_of_edge):
         for x in range(shape_of_edge):
 
+            index = row * shape_of_edge + x
+
             if y > 0 and x > 0 and y < shape_of_edge - 1 and x < shape_of_edge - 1:
 
                 neighbors_1d[index, 0] = index - shape_of_edge - 1
@@ -534,8 +1006,6 @@ def grid_square_neighbors_1d_from(shape_1d):
 
                 has_neighbors[index] = True
 
-            index += 1
-
     return neighbors_1d, has_neighbors
 
 
@@ -559,9 +1029,9 @@ def grid_peaks_from(distance_1d, grid_1d, neighbors, has_neighbors):
         An array of bools, where `True` means a pixel has 8 neighbors and `False` means it has less than 8 and is not
         compared to the source distance.
     """
-    peaks_list = []
+    is_peak = np.full(shape=grid_1d.shape[0], fill_value=False)
 
-    for grid_index in range(grid_1d.shape[0]):
+    for grid_index in prange(grid_1d.shape[0]):
 
         if has_neighbors[grid_index]:
 
@@ -578,48 +1048,310 @@ def grid_peaks_from(distance_1d, grid_1d, neighbors, has_neighbors):
                 and distance <= distance_1d[neighbors[grid_index, 7]]
             ):
 
-                peaks_list.append(grid_1d[grid_index])
+                is_peak[grid_index] = True
 
-    return peaks_list
+    return grid_1d[is_peak]
 
 
 @decorator_util.jit()
 def grid_within_distance(distances_1d, grid_1d, within_distance):
 
-    grid_within_size = 0
+    is_within = np.full(shape=grid_1d.shape[0], fill_value=False)
+
+    for grid_index in prange(grid_1d.shape[0]):
+        is_within[grid_index] = distances_1d[grid_index] < within_distance
 
-    for grid_index in range(grid_1d.shape[0]):
-        if distances_1d[grid_index] < within_distance:
-            grid_within_size += 1
+    return grid_1d[is_within]
 
-    grid_within = np.zeros(shape=(grid_within_size, 2))
 
-    grid_within_index = 0
+@decorator_util.jit()
+def grid_outside_distance_mask_from(distances_1d, grid_1d, outside_distance):
 
-    for grid_index in range(grid_1d.shape[0]):
-        if distances_1d[grid_index] < within_distance:
+    is_outside = np.full(shape=grid_1d.shape[0], fill_value=False)
 
-            grid_within[grid_within_index, :] = grid_1d[grid_index, :]
-            grid_within_index += 1
+    for grid_index in prange(grid_1d.shape[0]):
+        is_outside[grid_index] = distances_1d[grid_index] > outside_distance
 
-    return grid_within
+    return grid_1d[is_outside]
 
 
 @decorator_util.jit()
-def grid_outside_distance_mask_from(distances_1d, grid_1d, outside_distance):
-    grid_outside_size = 0
+def grid_square_cells_from(grid_vertices):
+    """
+    From the integer (y,x) indexes of the coordinates of a uniform grid, determine the square cells of the mesh used
+    by the `PositionsFinderTriangles`, where a cell is every square of 4 neighboring grid coordinates.
+
+    Every cell is given by the (y,x) index of its top-left vertex, for example a grid of 3x3 coordinates has 2x2
+    cells with indexes [[0, 0], [0, 1], [1, 0], [1, 1]]. Cells with a vertex that is not on the grid (e.g. because
+    the grid was masked) are omitted.
+
+    Parameters
+    ----------
+    grid_vertices : np.ndarray
+        The integer (y,x) indexes of every coordinate on the grid, counting from the top-left coordinate.
+    """
+    in_grid = np.full(
+        shape=(np.max(grid_vertices[:, 0]) + 1, np.max(grid_vertices[:, 1]) + 1),
+        fill_value=False,
+    )
+
+    for vertex_index in range(grid_vertices.shape[0]):
+        in_grid[grid_vertices[vertex_index, 0], grid_vertices[vertex_index, 1]] = True
+
+    total_cells = 0
+
+    for y in range(in_grid.shape[0] - 1):
+        for x in range(in_grid.shape[1] - 1):
+            if (
+                in_grid[y, x]
+                and in_grid[y, x + 1]
+                and in_grid[y + 1, x]
+                and in_grid[y + 1, x + 1]
+            ):
+                total_cells += 1
+
+    cells = np.zeros(shape=(total_cells, 2), dtype=np.int64)
+
+    cell_index = 0
+
+    for y in range(in_grid.shape[0] - 1):
+        for x in range(in_grid.shape[1] - 1):
+            if (
+                in_grid[y, x]
+                and in_grid[y, x + 1]
+                and in_grid[y + 1, x]
+                and in_grid[y + 1, x + 1]
+            ):
+                cells[cell_index, 0] = y
+                cells[cell_index, 1] = x
+                cell_index += 1
+
+    return cells
+
+
+@decorator_util.jit()
+def cells_divided_from(cells):
+    """
+    Divide every square cell of the mesh used by the `PositionsFinderTriangles` into 4 cells of half its size.
+
+    A cell with top-left vertex (y,x) is divided into the cells with top-left vertices (2y, 2x), (2y, 2x+1),
+    (2y+1, 2x) and (2y+1, 2x+1), where the indexes of the divided cells are at twice the resolution of the input
+    cells.
+
+    Parameters
+    ----------
+    cells : np.ndarray
+        The integer (y,x) index of the top-left vertex of every cell.
+    """
+    cells_divided = np.zeros(shape=(4 * cells.shape[0], 2), dtype=np.int64)
+
+    for cell_index in range(cells.shape[0]):
+        for y in range(2):
+            for x in range(2):
+                divided_index = 4 * cell_index + 2 * y + x
+                cells_divided[divided_index, 0] = 2 * cells[cell_index, 0] + y
+                cells_divided[divided_index, 1] = 2 * cells[cell_index, 1] + x
+
+    return cells_divided
+
+
+@decorator_util.jit()
+def triangle_vertices_from(cells):
+    """
+    Split every square cell of the mesh used by the `PositionsFinderTriangles` into two triangles, returning the
+    integer (y,x) indexes of the 3 vertices of every triangle.
+
+    The triangles of the cell with index i are at indexes 2i and 2i + 1 of the returned array, the first using the
+    top-left, top-right and bottom-left vertices of the cell and the second the top-right, bottom-right and
+    bottom-left vertices.
+
+    Parameters
+    ----------
+    cells : np.ndarray
+        The integer (y,x) index of the top-left vertex of every cell.
+    """
+    triangle_vertices = np.zeros(shape=(2 * cells.shape[0], 3, 2), dtype=np.int64)
+
+    for cell_index in range(cells.shape[0]):
+
+        y = cells[cell_index, 0]
+        x = cells[cell_index, 1]
+
+        triangle_vertices[2 * cell_index, 0, 0] = y
+        triangle_vertices[2 * cell_index, 0, 1] = x
+        triangle_vertices[2 * cell_index, 1, 0] = y
+        triangle_vertices[2 * cell_index, 1, 1] = x + 1
+        triangle_vertices[2 * cell_index, 2, 0] = y + 1
+        triangle_vertices[2 * cell_index, 2, 1] = x
+
+        triangle_vertices[2 * cell_index + 1, 0, 0] = y
+        triangle_vertices[2 * cell_index + 1, 0, 1] = x + 1
+        triangle_vertices[2 * cell_index + 1, 1, 0] = y + 1
+        triangle_vertices[2 * cell_index + 1, 1, 1] = x + 1
+        triangle_vertices[2 * cell_index + 1, 2, 0] = y + 1
+        triangle_vertices[2 * cell_index + 1, 2, 1] = x
+
+    return triangle_vertices
+
+
+@decorator_util.jit()
+def triangles_contain_coordinate_from(triangles, coordinate):
+    """
+    Determine whether every triangle in an array of triangles contains an input (y,x) coordinate, including
+    coordinates on the edges of the triangle.
+
+    The triangles are ray-traced to the source-plane and may therefore be folded (e.g. when the triangle straddles a
+    critical curve), such that the test does not depend on the order of the vertices.
+
+    Parameters
+    ----------
+    triangles : np.ndarray
+        The (y,x) coordinates of the 3 vertices of every triangle, with shape [total_triangles, 3, 2].
+    coordinate : np.ndarray
+        The (y,x) coordinate that is tested.
+    """
+    contains_coordinate = np.full(shape=triangles.shape[0], fill_value=False)
+
+    for triangle_index in range(triangles.shape[0]):
+
+        has_negative = False
+        has_positive = False
+
+        for vertex_index in range(3):
+
+            y0 = triangles[triangle_index, vertex_index, 0]
+            x0 = triangles[triangle_index, vertex_index, 1]
+            y1 = triangles[triangle_index, (vertex_index + 1) % 3, 0]
+            x1 = triangles[triangle_index, (vertex_index + 1) % 3, 1]
+
+            cross = (x1 - x0) * (coordinate[0] - y0) - (y1 - y0) * (coordinate[1] - x0)
+
+            if cross < 0.0:
+                has_negative = True
+            elif cross > 0.0:
+                has_positive = True
+
+        contains_coordinate[triangle_index] = (has_negative or has_positive) and not (
+            has_negative and has_positive
+        )
+
+    return contains_coordinate
+
+
+@decorator_util.jit()
+def triangles_interpolated_coordinate_from(
+    image_plane_triangles, source_plane_triangles, coordinate
+):
+    """
+    For triangles in the image-plane and the source-plane triangles they are ray-traced to, estimate the image-plane
+    (y,x) coordinate which traces to an input source-plane coordinate by linearly interpolating the vertices.
+
+    The barycentric coordinates of the source-plane coordinate in every source-plane triangle are computed and used
+    to weight the image-plane vertices of the triangle.
+
+    Parameters
+    ----------
+    image_plane_triangles : np.ndarray
+        The (y,x) image-plane coordinates of the 3 vertices of every triangle, with shape [total_triangles, 3, 2].
+    source_plane_triangles : np.ndarray
+        The (y,x) source-plane coordinates of the 3 vertices of every triangle, with shape [total_triangles, 3, 2].
+    coordinate : np.ndarray
+        The (y,x) source-plane coordinate the image-plane coordinates trace to.
+    """
+    coordinates = np.zeros(shape=(image_plane_triangles.shape[0], 2))
+
+    for triangle_index in range(image_plane_triangles.shape[0]):
+
+        y0 = source_plane_triangles[triangle_index, 0, 0]
+        x0 = source_plane_triangles[triangle_index, 0, 1]
+
+        dy1 = source_plane_triangles[triangle_index, 1, 0] - y0
+        dx1 = source_plane_triangles[triangle_index, 1, 1] - x0
+        dy2 = source_plane_triangles[triangle_index, 2, 0] - y0
+        dx2 = source_plane_triangles[triangle_index, 2, 1] - x0
+
+        area = dx1 * dy2 - dy1 * dx2
+
+        if area == 0.0:
+            weight_1 = 1.0 / 3.0
+            weight_2 = 1.0 / 3.0
+        else:
+            weight_1 = (
+                (coordinate[1] - x0) * dy2 - (coordinate[0] - y0) * dx2
+            ) / area
+            weight_2 = (
+                dx1 * (coordinate[0] - y0) - dy1 * (coordinate[1] - x0)
+            ) / area
+
+        weight_0 = 1.0 - weight_1 - weight_2
+
+        for dim in range(2):
+            coordinates[triangle_index, dim] = (
+                weight_0 * image_plane_triangles[triangle_index, 0, dim]
+                + weight_1 * image_plane_triangles[triangle_index, 1, dim]
+                + weight_2 * image_plane_triangles[triangle_index, 2, dim]
+            )
+
+    return coordinates
 
-    for grid_index in range(grid_1d.shape[0]):
-        if distances_1d[grid_index] > outside_distance:
-            grid_outside_size += 1
 
-    grid_outside = np.zeros(shape=(grid_outside_size, 2))
+@decorator_util.jit()
+def grid_merge_within_distance(grid, distance):
+    """
+    Merge the (y,x) coordinates of a grid which are within an input distance of one another, returning the mean of
+    every group of merged coordinates.
+
+    The coordinates are merged in order, where a coordinate is merged into the first group whose mean is within the
+    distance of it, or otherwise starts a new group.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The (y,x) coordinates that are merged.
+    distance : float
+        The distance within which coordinates are merged.
+    """
+    grid_sum = np.zeros(shape=(grid.shape[0], 2))
+    grid_counts = np.zeros(shape=grid.shape[0])
+
+    total_merged = 0
+
+    for grid_index in range(grid.shape[0]):
+
+        merged = False
+
+        for merged_index in range(total_merged):
 
-    grid_outside_index = 0
+            y = grid_sum[merged_index, 0] / grid_counts[merged_index]
+            x = grid_sum[merged_index, 1] / grid_counts[merged_index]
 
-    for grid_index in range(grid_1d.shape[0]):
-        if distances_1d[grid_index] > outside_distance:
-            grid_outside[grid_outside_index, :] = grid_1d[grid_index, :]
-            grid_outside_index += 1
+            if (
+                np.sqrt(
+                    np.square(grid[grid_index, 0] - y)
+                    + np.square(grid[grid_index, 1] - x)
+                )
+                < distance
+            ):
+
+                grid_sum[merged_index, :] += grid[grid_index, :]
+                grid_counts[merged_index] += 1
+                merged = True
+                break
+
+        if not merged:
+
+            grid_sum[total_merged, :] = grid[grid_index, :]
+            grid_counts[total_merged] = 1
+            total_merged += 1
+
+    grid_merged = np.zeros(shape=(total_merged, 2))
+
+    for merged_index in range(total_merged):
+        grid_merged[merged_index, 0] = (
+            grid_sum[merged_index, 0] / grid_counts[merged_index]
+        )
+        grid_merged[merged_index, 1] = (
+            grid_sum[merged_index, 1] / grid_counts[merged_index]
+        )
 
-    return grid_outside
+    return grid_merged
@@ -1,19 +1,35 @@
 from abc import ABC
+from collections import OrderedDict
+from functools import lru_cache
 import pickle
 import numpy as np
 from os import path
 from astropy import cosmology as cosmo
+import scipy.spatial.qhull as qhull
+from autoconf import conf
+from autoarray import decorator_util
+from autoarray import exc
 from autoarray.inversion import pixelizations as pix
 from autoarray.inversion import inversions as inv
+from autoarray.operators import transformer as trans
+from autoarray.util import inversion_util
 from autoarray.structures import grids
+from autoarray.structures import visibilities as vis
 from autogalaxy import lensing
 from autogalaxy.galaxy import galaxy as g
+from autogalaxy.profiles import light_profiles as lp
+from autogalaxy.profiles import mass_profiles as mp
 from autogalaxy.plane import plane as pl
 from autogalaxy.util import cosmology_util
 from autogalaxy.util import plane_util
+from autolens.dataset import w_tilde as wt
 
 
 class AbstractTracer(lensing.LensingObject, ABC):
+
+    traced_grids_cache_size = 10
+    deflections_interpolate_accuracy = None
+
     def __init__(self, planes, cosmology):
         """Ray-tracer for a lens system with any number of planes.
 
@@ -42,10 +58,58 @@ class AbstractTracer(lensing.LensingObject, ABC):
         self.plane_redshifts = [plane.redshift for plane in planes]
         self.cosmology = cosmology
 
+        self._traced_grids_of_planes_cache = OrderedDict()
+        self.blurred_images_of_galaxies_cache = None
+        self.inversion_matrices_cache = None
+        self.deflections_of_galaxies_cache = None
+        self._mappers_of_planes_cache = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_traced_grids_of_planes_cache"] = OrderedDict()
+        state["blurred_images_of_galaxies_cache"] = None
+        state["inversion_matrices_cache"] = None
+        state["deflections_of_galaxies_cache"] = None
+        state["_mappers_of_planes_cache"] = None
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("_traced_grids_of_planes_cache", OrderedDict())
+        state.setdefault("blurred_images_of_galaxies_cache", None)
+        state.setdefault("inversion_matrices_cache", None)
+        state.setdefault("deflections_of_galaxies_cache", None)
+        state.setdefault("_mappers_of_planes_cache", None)
+        self.__dict__.update(state)
+
+    def share_traced_grids_of_planes_cache(self, tracer):
+        """
+        Use the cache of traced grids of planes of another tracer, such that grids traced by either tracer are traced
+        only once.
+
+        This is only valid if the deflection angles of both tracers are identical, for example the tracers of a
+        model-fit whose mass model is fixed.
+        """
+        self._traced_grids_of_planes_cache = tracer._traced_grids_of_planes_cache
+
     @property
     def total_planes(self):
         return len(self.plane_redshifts)
 
+    @property
+    def scaling_factors_of_planes(self):
+        """
+        The matrix of multi-plane ray-tracing scaling factors (often denoted beta) between every pair of planes in the
+        tracer, where entry [i, j] is the factor by which the deflection angles of plane j are scaled when tracing to
+        plane i (entries with j >= i are zero).
+
+        The scaling factors depend only on the plane redshifts and cosmology, so they are computed once and cached
+        for every tracer with the same plane redshifts and cosmology (see `scaling_factors_of_planes_from`).
+        """
+        return scaling_factors_of_planes_from(
+            plane_redshifts=tuple(self.plane_redshifts),
+            cosmology=CosmologyKey(cosmology=self.cosmology),
+        )
+
     @property
     def image_plane(self):
         return self.planes[0]
@@ -203,42 +267,349 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
 
 class AbstractTracerLensing(AbstractTracer, ABC):
-    @grids.grid_like_to_structure_list
     def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """
+        Ray-trace an input grid of (y,x) image-plane coordinates to every plane of the tracer, returning the traced
+        grid of every plane.
 
-        traced_grids = []
+        A fit traces the same grid (e.g. the masked imaging grid) via many different methods (the blurred image,
+        mappers, galaxy images, visualization). The traced grids of every grid are therefore cached by the tracer,
+        using the identity of the input grid, such that each grid is only deflected through the planes once. The
+        cache is bounded to the `traced_grids_cache_size` most recently traced grids. Grids which are traced should
+        therefore not be changed in-place after tracing.
+
+        Parameters
+        ----------
+        grid : aa.Grid or aa.GridIrregularGrouped
+            The image-plane grid which is ray-traced to every plane.
+        plane_index_limit : int or None
+            If input, the grid is only traced up to and including the plane with this index.
+        """
+        if plane_index_limit is None:
+            plane_index_limit = self.total_planes - 1
+
+        cached = self._traced_grids_of_planes_cache.get(id(grid))
+
+        if cached is not None:
+
+            cached_grid, cached_plane_index_limit, traced_grids_of_planes = cached
+
+            if cached_grid is grid and cached_plane_index_limit >= plane_index_limit:
+                self._traced_grids_of_planes_cache.move_to_end(id(grid))
+                return traced_grids_of_planes[: plane_index_limit + 1]
+
+        traced_grids_of_planes = self._traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=plane_index_limit
+        )
+
+        self._traced_grids_of_planes_cache[id(grid)] = (
+            grid,
+            plane_index_limit,
+            traced_grids_of_planes,
+        )
+        self._traced_grids_of_planes_cache.move_to_end(id(grid))
+
+        if len(self._traced_grids_of_planes_cache) > self.traced_grids_cache_size:
+            self._traced_grids_of_planes_cache.popitem(last=False)
+
+        return traced_grids_of_planes[:]
+
+    @grids.grid_like_to_structure_list
+    def _traced_grids_of_planes_from_grid(self, grid, plane_index_limit):
+        """
+        Ray-trace an input grid of (y,x) image-plane coordinates to every plane of the tracer up to and including the
+        plane with index `plane_index_limit`, without using the cache of traced grids.
+
+        The traced grids of all planes are stored in one buffer of shape [total_planes, total_coordinates, 2], with
+        the traced grid of every plane a view of this buffer which has the same structure as the input grid. The
+        scaled deflection angles of every previous plane are subtracted from each traced grid in place, such that no
+        temporary arrays are created.
+
+        Parameters
+        ----------
+        grid : aa.Grid or aa.GridIrregularGrouped
+            The image-plane grid which is ray-traced to every plane.
+        plane_index_limit : int
+            The grid is traced up to and including the plane with this index.
+        """
+        if isinstance(grid, grids.GridInterpolate):
+            return self._traced_grids_of_planes_via_interpolation_from_grid(
+                grid=grid, plane_index_limit=plane_index_limit
+            )
+
+        total_planes = plane_index_limit + 1
+
+        traced_grids_of_planes = np.empty_like(grid, shape=(total_planes,) + grid.shape)
         traced_deflections = []
 
-        for (plane_index, plane) in enumerate(self.planes):
+        for plane_index in range(total_planes):
 
-            scaled_grid = grid.copy()
+            traced_grid = traced_grids_of_planes[plane_index]
+            traced_grid[:] = grid
 
             if plane_index > 0:
+
+                scaling_factors = self.scaling_factors_of_planes[plane_index]
+
                 for previous_plane_index in range(plane_index):
-                    scaling_factor = cosmology_util.scaling_factor_between_redshifts_from(
-                        redshift_0=self.plane_redshifts[previous_plane_index],
-                        redshift_1=plane.redshift,
-                        redshift_final=self.plane_redshifts[-1],
-                        cosmology=self.cosmology,
+
+                    grid_subtract_scaled_deflections(
+                        grid=np.asarray(traced_grid).reshape(-1, 2),
+                        deflections=np.asarray(
+                            traced_deflections[previous_plane_index]
+                        ).reshape(-1, 2),
+                        scaling_factor=scaling_factors[previous_plane_index],
                     )
 
-                    scaled_deflections = (
-                        scaling_factor * traced_deflections[previous_plane_index]
+            if plane_index < total_planes - 1:
+                traced_deflections.append(
+                    self._deflections_of_plane_from_grid(
+                        plane_index=plane_index, traced_grid=traced_grid, grid=grid
                     )
+                )
+
+        return list(traced_grids_of_planes)
+
+    def _deflections_of_plane_from_grid(self, plane_index, traced_grid, grid):
+        """
+        Compute the deflection angles of a plane for ray-tracing, using the `deflections_of_galaxies_cache` if the
+        tracer has one.
+
+        The cache is shared by the tracers of a model-fit and stores the deflection angles of every galaxy (via the
+        indexes of its plane and of the galaxy in that plane) on every grid, alongside the types and parameters of
+        the galaxy's mass profiles. The deflection angles of a galaxy whose mass profiles and grid are unchanged are
+        reused, such that when a fit only varies part of the mass model (e.g. a subhalo added to a fixed macro lens
+        model) only the deflection angles of the galaxies that change are computed.
+
+        Galaxies in the first plane are cached on the image-plane grid, which is the same object for every
+        likelihood evaluation. The traced grids of later planes depend on the deflection angles of the first plane,
+        so their galaxies are only reused if their traced grids are the same objects.
+
+        Parameters
+        ----------
+        plane_index : int
+            The index of the plane whose deflection angles are computed.
+        traced_grid : aa.Grid
+            The grid traced to the plane, which the deflection angles are computed on.
+        grid : aa.Grid
+            The image-plane grid which is being ray-traced.
+        """
+        plane = self.planes[plane_index]
+
+        if self.deflections_of_galaxies_cache is None:
+            return plane.deflections_from_grid(grid=traced_grid)
 
-                    # TODO : Setup as GridInterpolate
+        cache = self.deflections_of_galaxies_cache
 
-                    scaled_grid -= scaled_deflections
+        key_grid = grid if plane_index == 0 else traced_grid
 
-            traced_grids.append(scaled_grid)
+        deflections = None
 
-            if plane_index_limit is not None:
-                if plane_index == plane_index_limit:
-                    return traced_grids
+        for galaxy_index, galaxy in enumerate(plane.galaxies):
+
+            if not galaxy.has_mass_profile:
+                continue
+
+            mass_profiles_key = profiles_key_from(profiles=galaxy.mass_profiles)
+
+            cache_key = (plane_index, galaxy_index, id(key_grid))
+            cached = cache.get(cache_key)
+
+            if (
+                mass_profiles_key is not None
+                and cached is not None
+                and cached[0] is key_grid
+                and cached[1] == mass_profiles_key
+            ):
+                cache.move_to_end(cache_key)
+                galaxy_deflections = cached[2]
+            else:
+                galaxy_deflections = np.asarray(
+                    galaxy.deflections_from_grid(grid=traced_grid)
+                )
+
+                cache[cache_key] = (key_grid, mass_profiles_key, galaxy_deflections)
+                cache.move_to_end(cache_key)
+
+                if len(cache) > self.traced_grids_cache_size * len(self.galaxies):
+                    cache.popitem(last=False)
+
+            if deflections is None:
+                deflections = galaxy_deflections
+            else:
+                deflections = deflections + galaxy_deflections
+
+        if deflections is None:
+            return plane.deflections_from_grid(grid=traced_grid)
+
+        return deflections
+
+    def _traced_grids_of_planes_via_interpolation_from_grid(
+        self, grid, plane_index_limit
+    ):
+        """
+        Ray-trace an input `GridInterpolate` of (y,x) image-plane coordinates to every plane of the tracer up to and
+        including the plane with index `plane_index_limit`, where the deflection angles of every plane may be
+        evaluated on the grid's interpolation grid and interpolated to the grid.
+
+        The interpolation grid is traced to every plane alongside the grid, and the traced grid of every plane is a
+        `GridInterpolate` whose interpolation grid is the traced interpolation grid. The deflection angles of every
+        mass profile set to use interpolation in the 'interpolate.ini' config file are therefore evaluated on the
+        interpolation grid in that plane's traced coordinates, and interpolated to the grid using the grid's
+        interpolation weights. These weights are computed once in the image-plane and are reused for every plane,
+        because the traced coordinates of a plane vary smoothly with the image-plane coordinates. Light profiles
+        evaluated on a traced grid via interpolation use the traced coordinates in the same way.
+
+        If the tracer's `deflections_interpolate_accuracy` is not None, the interpolated deflection angles of every
+        plane are compared to their exact values on a subset of the grid with as many coordinates as the
+        interpolation grid. If the largest difference exceeds this accuracy, the exact deflection angles of that
+        plane are computed on the full grid instead.
+
+        Parameters
+        ----------
+        grid : aa.GridInterpolate
+            The image-plane grid which is ray-traced to every plane.
+        plane_index_limit : int
+            The grid is traced up to and including the plane with this index.
+        """
+        total_planes = plane_index_limit + 1
+
+        grid_interp = grid.grid_interp
+
+        traced_grids = np.empty_like(grid, shape=(total_planes,) + grid.shape)
+        traced_grids_interp = np.empty_like(
+            grid_interp, shape=(total_planes,) + grid_interp.shape
+        )
+
+        deflections = np.zeros(shape=(total_planes,) + grid.shape)
+        deflections_interp = np.zeros(shape=(total_planes,) + grid_interp.shape)
+
+        traced_grids_of_planes = []
+
+        for plane_index in range(total_planes):
+
+            traced_grid = traced_grids[plane_index]
+            traced_grid[:] = grid
+
+            traced_grid_interp = traced_grids_interp[plane_index]
+            traced_grid_interp[:] = grid_interp
+
+            if plane_index > 0:
+
+                scaling_factors = self.scaling_factors_of_planes[plane_index]
+
+                for previous_plane_index in range(plane_index):
+
+                    grid_subtract_scaled_deflections(
+                        grid=np.asarray(traced_grid).reshape(-1, 2),
+                        deflections=deflections[previous_plane_index].reshape(-1, 2),
+                        scaling_factor=scaling_factors[previous_plane_index],
+                    )
+                    grid_subtract_scaled_deflections(
+                        grid=np.asarray(traced_grid_interp).reshape(-1, 2),
+                        deflections=deflections_interp[previous_plane_index].reshape(
+                            -1, 2
+                        ),
+                        scaling_factor=scaling_factors[previous_plane_index],
+                    )
+
+            traced_grid.grid_interp = traced_grid_interp
+            traced_grids_of_planes.append(traced_grid)
+
+            if plane_index == total_planes - 1:
+                break
+
+            plane = self.planes[plane_index]
+
+            deflections_interp[plane_index] = plane.deflections_from_grid(
+                grid=traced_grid_interp
+            )
+            deflections[plane_index] = plane.deflections_from_grid(grid=traced_grid)
+
+            if self.deflections_interpolate_accuracy is None:
+                continue
+
+            check_slice = slice(
+                None, None, max(grid.shape[0] // grid_interp.shape[0], 1)
+            )
+
+            deflections_check = plane.deflections_from_grid(
+                grid=grids.GridIrregular(grid=np.asarray(traced_grid)[check_slice])
+            )
+
+            deflections_error = np.max(
+                np.abs(deflections_check - deflections[plane_index][check_slice])
+            )
+
+            if deflections_error > self.deflections_interpolate_accuracy:
+
+                deflections[plane_index] = plane.deflections_from_grid(
+                    grid=grids.GridIrregular(grid=np.asarray(traced_grid))
+                )
+
+        return traced_grids_of_planes
+
+    def traced_grids_of_planes_via_grid_interpolate_from_grid(
+        self, grid, grid_interpolate
+    ):
+        """
+        Ray-trace an input grid of (y,x) image-plane coordinates (e.g. the sparse grid of a pixelization) to every
+        plane of the tracer, by interpolating the interpolation grid of a `GridInterpolate` traced to every plane.
+
+        The traced interpolation grids of the `GridInterpolate` are cached by the tracer alongside its traced grids,
+        such that no deflection angles are computed for the input grid. If any coordinate of the input grid is
+        outside the interpolation grid it cannot be interpolated, and the grid is ray-traced exactly.
+
+        Parameters
+        ----------
+        grid : aa.Grid or aa.GridVoronoi
+            The image-plane grid which is ray-traced to every plane.
+        grid_interpolate : aa.GridInterpolate
+            The grid whose traced interpolation grids are interpolated to the input grid.
+        """
+        vertices, weights = interpolation_weights_from(
+            grid_interp=grid_interpolate.grid_interp, grid=np.asarray(grid)
+        )
+
+        if np.any(vertices < 0):
+            return self.traced_grids_of_planes_from_grid(grid=grid)
+
+        traced_grids_of_planes = []
+
+        for traced_grid_interpolate in self.traced_grids_of_planes_from_grid(
+            grid=grid_interpolate
+        ):
+
+            traced_grid = np.empty_like(grid)
+            traced_grid[:] = grid_interpolated_from(
+                grid_interp=np.asarray(traced_grid_interpolate.grid_interp),
+                vertices=vertices,
+                weights=weights,
+            )
 
-            traced_deflections.append(plane.deflections_from_grid(grid=scaled_grid))
+            traced_grids_of_planes.append(traced_grid)
 
-        return traced_grids
+        return traced_grids_of_planes
+
+    def source_plane_coordinates_from_grid(self, grid):
+        """
+        Ray-trace an input grid of (y,x) image-plane coordinates to the source-plane (the final plane of the tracer),
+        returning the traced coordinates as a NumPy array of shape [total_coordinates, 2].
+
+        The grid is traced as a plain NumPy array, bypassing both the cache of traced grids and the creation of a
+        structure (e.g. a `GridIrregularGrouped`) for every plane. This is used by calculations which only require
+        the source-plane coordinates of a small number of points and are performed for every model, for example
+        checking whether the positions of a lens trace within a threshold of one another.
+
+        Parameters
+        ----------
+        grid : aa.Grid or aa.GridIrregularGrouped or np.ndarray
+            The image-plane (y,x) coordinates which are ray-traced to the source-plane.
+        """
+        return self._traced_grids_of_planes_from_grid(
+            grid=np.asarray(grid).reshape(-1, 2),
+            plane_index_limit=self.total_planes - 1,
+        )[-1]
 
     @grids.grid_like_to_structure
     def deflections_between_planes_from_grid(self, grid, plane_i=0, plane_j=-1):
@@ -330,7 +701,7 @@ class AbstractTracerLensing(AbstractTracer, ABC):
             if redshift < plane_redshift:
                 plane_index_insert = plane_index
 
-        planes = self.planes
+        planes = list(self.planes)
         planes.insert(plane_index_insert, pl.Plane(redshift=redshift, galaxies=[]))
 
         tracer = Tracer(planes=planes, cosmology=self.cosmology)
@@ -431,6 +802,11 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         if not self.has_light_profile:
             return np.zeros(shape=grid.shape_1d)
 
+        if self.blurred_images_of_galaxies_cache is not None:
+            return self._blurred_image_via_cache_from_grid_and_convolver(
+                grid=grid, convolver=convolver, blurring_grid=blurring_grid
+            )
+
         image = self.image_from_grid(grid=grid)
 
         blurring_image = self.image_from_grid(grid=blurring_grid)
@@ -439,6 +815,110 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             image=image, blurring_image=blurring_image
         )
 
+    def _blurred_image_via_cache_from_grid_and_convolver(
+        self, grid, convolver, blurring_grid
+    ):
+        """
+        Compute the blurred image of the tracer, reusing the blurred images of galaxies whose light is the same as
+        the previous tracer that used the `blurred_images_of_galaxies_cache`.
+
+        The cache is shared by the tracers of a model-fit and maps every galaxy (via the indexes of its plane and of
+        the galaxy in that plane) to the values of its light profiles and the grids its image was evaluated on. If
+        a galaxy's light profiles and grids are unchanged the next time it is fitted its light is fixed, so its
+        blurred image is computed once, stored and reused by every following tracer. The images of all other
+        galaxies are summed and blurred together, as in `blurred_image_from_grid_and_convolver`.
+
+        The image-plane grids are used for galaxies in the first plane, so the blurred image of a fixed lens light is
+        reused even when the mass model changes. Galaxies in later planes are only reused if their traced grids are
+        the same objects, which is the case when the traced grids of planes are preloaded for a fixed mass model.
+
+        Parameters
+        ----------
+        convolver : hyper_galaxies.imaging.convolution.ConvolverImage
+            Class which performs the PSF convolution of a masked image in 1D.
+        """
+        plane_index_limit = self.upper_plane_index_with_light_profile
+
+        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+            grid=grid, plane_index_limit=plane_index_limit
+        )
+        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
+            grid=blurring_grid, plane_index_limit=plane_index_limit
+        )
+
+        blurred_images = []
+        images = []
+        blurring_images = []
+
+        for plane_index in range(plane_index_limit + 1):
+
+            if plane_index == 0:
+                key_grids = (grid, blurring_grid, convolver)
+            else:
+                key_grids = (
+                    traced_grids_of_planes[plane_index],
+                    traced_blurring_grids_of_planes[plane_index],
+                    convolver,
+                )
+
+            for galaxy_index, galaxy in enumerate(self.planes[plane_index].galaxies):
+
+                if not galaxy.has_light_profile:
+                    continue
+
+                light_profiles_key = profiles_key_from(profiles=galaxy.light_profiles)
+
+                cached = self.blurred_images_of_galaxies_cache.get(
+                    (plane_index, galaxy_index)
+                )
+
+                if (
+                    light_profiles_key is not None
+                    and cached is not None
+                    and cached[0] == light_profiles_key
+                    and all(
+                        cached_grid is key_grid
+                        for cached_grid, key_grid in zip(cached[1], key_grids)
+                    )
+                ):
+
+                    if cached[2] is None:
+                        cached[2] = convolver.convolved_image_from_image_and_blurring_image(
+                            image=galaxy.image_from_grid(
+                                grid=traced_grids_of_planes[plane_index]
+                            ),
+                            blurring_image=galaxy.image_from_grid(
+                                grid=traced_blurring_grids_of_planes[plane_index]
+                            ),
+                        )
+
+                    blurred_images.append(cached[2])
+                    continue
+
+                self.blurred_images_of_galaxies_cache[(plane_index, galaxy_index)] = [
+                    light_profiles_key,
+                    key_grids,
+                    None,
+                ]
+
+                images.append(
+                    galaxy.image_from_grid(grid=traced_grids_of_planes[plane_index])
+                )
+                blurring_images.append(
+                    galaxy.image_from_grid(
+                        grid=traced_blurring_grids_of_planes[plane_index]
+                    )
+                )
+
+        if len(images) > 0:
+            blurred_images.append(
+                convolver.convolved_image_from_image_and_blurring_image(
+                    image=sum(images), blurring_image=sum(blurring_images)
+                )
+            )
+
+        return sum(blurred_images)
+
     def blurred_images_of_planes_from_grid_and_convolver(
         self, grid, convolver, blurring_grid
     ):
@@ -542,10 +1022,10 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
     ):
 
         images_of_planes = self.images_of_planes_from_grid(grid=grid)
-        return [
-            transformer.visibilities_from_image(image=image)
-            for image in images_of_planes
-        ]
+
+        return visibilities_of_images_from_transformer(
+            images=images_of_planes, transformer=transformer
+        )
 
     def sparse_image_plane_grids_of_planes_from_grid(
         self, grid, pixelization_setting=pix.SettingsPixelization()
@@ -586,6 +1066,12 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
 
             if sparse_image_plane_grids_of_planes[plane_index] is None:
                 traced_sparse_grids_of_planes.append(None)
+            elif isinstance(grid, grids.GridInterpolate):
+                traced_sparse_grids = self.traced_grids_of_planes_via_grid_interpolate_from_grid(
+                    grid=sparse_image_plane_grids_of_planes[plane_index],
+                    grid_interpolate=grid,
+                )
+                traced_sparse_grids_of_planes.append(traced_sparse_grids[plane_index])
             else:
                 traced_sparse_grids = self.traced_grids_of_planes_from_grid(
                     grid=sparse_image_plane_grids_of_planes[plane_index]
@@ -597,6 +1083,21 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
     def mappers_of_planes_from_grid(
         self, grid, settings_pixelization=pix.SettingsPixelization()
     ):
+        """
+        The mapper of every plane with a pixelization (and None for every other plane).
+
+        The mappers of the last grid and settings are cached, such that a mapper which is checked before an inversion
+        (see `SettingsLens.check_pixelization_coverage_via_tracer`) is reused by the inversion. Stochastic settings
+        are not cached, as every call must draw a new sparse grid.
+        """
+        cache = self._mappers_of_planes_cache
+
+        if (
+            cache is not None
+            and cache[0] is grid
+            and cache[1] is settings_pixelization
+        ):
+            return cache[2]
 
         mappers_of_planes = []
 
@@ -618,8 +1119,32 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
                 )
                 mappers_of_planes.append(mapper)
 
+        if not settings_pixelization.is_stochastic:
+            self._mappers_of_planes_cache = (
+                grid,
+                settings_pixelization,
+                mappers_of_planes,
+            )
+
         return mappers_of_planes
 
+    def pixelization_coverage_from_grid(
+        self, grid, settings_pixelization=pix.SettingsPixelization()
+    ):
+        """
+        The fraction of the source pixels of the last plane's mapper which at least one sub-pixel of the grid maps to.
+        """
+        mapper = self.mappers_of_planes_from_grid(
+            grid=grid, settings_pixelization=settings_pixelization
+        )[-1]
+
+        mapped_pixels = np.bincount(
+            np.asarray(mapper.pixelization_1d_index_for_sub_mask_1d_index),
+            minlength=mapper.pixels,
+        )
+
+        return np.count_nonzero(mapped_pixels) / mapper.pixels
+
     def inversion_imaging_from_grid_and_data(
         self,
         grid,
@@ -630,6 +1155,16 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         settings_inversion=inv.SettingsInversion(),
     ):
 
+        if self.inversion_matrices_cache is not None:
+            return self._inversion_imaging_via_cache_from_grid_and_data(
+                grid=grid,
+                image=image,
+                noise_map=noise_map,
+                convolver=convolver,
+                settings_pixelization=settings_pixelization,
+                settings_inversion=settings_inversion,
+            )
+
         mappers_of_planes = self.mappers_of_planes_from_grid(
             grid=grid, settings_pixelization=settings_pixelization
         )
@@ -643,6 +1178,115 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             settings=settings_inversion,
         )
 
+    def _inversion_imaging_via_cache_from_grid_and_data(
+        self,
+        grid,
+        image,
+        noise_map,
+        convolver,
+        settings_pixelization=pix.SettingsPixelization(),
+        settings_inversion=inv.SettingsInversion(),
+    ):
+        """
+        Perform the inversion of the tracer's pixelization, reusing the mapper, blurred mapping matrix and curvature
+        matrix of the previous tracer that used the `inversion_matrices_cache` if their inputs are unchanged.
+
+        The mapper and blurred mapping matrix depend only on the traced grid and traced sparse grid of the
+        pixelization's plane, the pixelization, its settings and the convolver, and the curvature matrix additionally
+        depends on the noise-map. When the mass model and pixelization are fixed (e.g. a hyper phase which only fits
+        the regularization or hyper noise) these are the same for every tracer, so each inversion only computes the
+        data vector and regularization matrix and solves the linear system.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The image-plane grid of the inversion, which is traced to the pixelization's plane.
+        """
+        cache = self.inversion_matrices_cache
+
+        traced_grid = self.traced_grids_of_planes_from_grid(grid=grid)[-1]
+        traced_sparse_grid = self.traced_sparse_grids_of_planes_from_grid(
+            grid=grid, settings_pixelization=settings_pixelization
+        )[-1]
+
+        pixelization_key = parameters_key_from(obj=self.pixelizations_of_planes[-1])
+        mapper_inputs = (traced_grid, traced_sparse_grid, convolver)
+
+        if (
+            pixelization_key is None
+            or cache.get("pixelization_key") != pixelization_key
+            or cache.get("settings_pixelization") is not settings_pixelization
+            or not all(
+                arrays_are_equal(array_0=cached_input, array_1=mapper_input)
+                for cached_input, mapper_input in zip(
+                    cache.get("mapper_inputs", (None, None, None)), mapper_inputs
+                )
+            )
+        ):
+
+            mapper = self.planes[-1].mapper_from_grid_and_sparse_grid(
+                grid=traced_grid,
+                sparse_grid=traced_sparse_grid,
+                settings_pixelization=settings_pixelization,
+            )
+
+            cache.clear()
+            cache["pixelization_key"] = pixelization_key
+            cache["settings_pixelization"] = settings_pixelization
+            cache["mapper_inputs"] = mapper_inputs
+            cache["mapper"] = mapper
+            cache["blurred_mapping_matrix"] = convolver.convolve_mapping_matrix(
+                mapping_matrix=mapper.mapping_matrix
+            )
+
+        if not arrays_are_equal(array_0=cache.get("noise_map"), array_1=noise_map):
+
+            cache["noise_map"] = noise_map
+            cache[
+                "curvature_matrix"
+            ] = inversion_util.curvature_matrix_via_mapping_matrix_from(
+                mapping_matrix=cache["blurred_mapping_matrix"], noise_map=noise_map
+            )
+
+        mapper = cache["mapper"]
+        blurred_mapping_matrix = cache["blurred_mapping_matrix"]
+        regularization = self.regularizations_of_planes[-1]
+
+        data_vector = inversion_util.data_vector_via_blurred_mapping_matrix_from(
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            image=image,
+            noise_map=noise_map,
+        )
+
+        regularization_matrix = regularization.regularization_matrix_from_mapper(
+            mapper=mapper
+        )
+
+        curvature_reg_matrix = np.add(cache["curvature_matrix"], regularization_matrix)
+
+        try:
+            reconstruction = np.linalg.solve(curvature_reg_matrix, data_vector)
+        except np.linalg.LinAlgError:
+            raise exc.InversionException()
+
+        if settings_inversion.check_solution:
+            if np.isclose(a=reconstruction[0], b=reconstruction[1], atol=1e-4).all():
+                if np.isclose(a=reconstruction[0], b=reconstruction, atol=1e-4).all():
+                    raise exc.InversionException()
+
+        return inv.InversionImagingMatrix(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver,
+            mapper=mapper,
+            regularization=regularization,
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=curvature_reg_matrix,
+            reconstruction=reconstruction,
+            settings=settings_inversion,
+        )
+
     def inversion_interferometer_from_grid_and_data(
         self,
         grid,
@@ -665,6 +1309,41 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             settings=settings_inversion,
         )
 
+    def inversion_interferometer_via_w_tilde_from_grid_and_image(
+        self,
+        grid,
+        image,
+        w_tilde,
+        noise_map,
+        transformer,
+        settings_pixelization=pix.SettingsPixelization(),
+        settings_inversion=inv.SettingsInversion(),
+    ):
+        """
+        Perform the inversion of interferometer visibilities via the w-tilde of their dataset, where the visibilities
+        are input as their noise weighted dirty image (see `WTildeInterferometer`).
+
+        Parameters
+        ----------
+        image : np.ndarray
+            The noise weighted dirty image of the visibilities that the inversion fits.
+        w_tilde : WTildeInterferometer
+            The w-tilde of the dataset, which gives the curvature matrix of the inversion.
+        """
+        mappers_of_planes = self.mappers_of_planes_from_grid(
+            grid=grid, settings_pixelization=settings_pixelization
+        )
+
+        return wt.InversionInterferometerWTilde.from_image_w_tilde_mapper_and_regularization(
+            image=image,
+            w_tilde=w_tilde,
+            noise_map=noise_map,
+            transformer=transformer,
+            mapper=mappers_of_planes[-1],
+            regularization=self.regularizations_of_planes[-1],
+            settings=settings_inversion,
+        )
+
     def hyper_noise_map_from_noise_map(self, noise_map):
         return sum(self.hyper_noise_maps_of_planes_from_noise_map(noise_map=noise_map))
 
@@ -724,23 +1403,28 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         self, grid, transformer
     ) -> {g.Galaxy: np.ndarray}:
         """
-        A dictionary associating galaxies with their corresponding model images
+        A dictionary associating galaxies with their corresponding model visibilities.
+
+        The images of all galaxies are Fourier transformed together (see `visibilities_of_images_from_transformer`).
         """
 
-        galaxy_profile_visibilities_image_dict = dict()
+        galaxies = []
+        images_of_galaxies = []
 
         traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
 
         for (plane_index, plane) in enumerate(self.planes):
-            profile_visibilities_of_galaxies = plane.profile_visibilities_of_galaxies_from_grid_and_transformer(
-                grid=traced_grids_of_planes[plane_index], transformer=transformer
+
+            galaxies += plane.galaxies
+            images_of_galaxies += plane.images_of_galaxies_from_grid(
+                grid=traced_grids_of_planes[plane_index]
             )
-            for (galaxy_index, galaxy) in enumerate(plane.galaxies):
-                galaxy_profile_visibilities_image_dict[
-                    galaxy
-                ] = profile_visibilities_of_galaxies[galaxy_index]
 
-        return galaxy_profile_visibilities_image_dict
+        profile_visibilities_of_galaxies = visibilities_of_images_from_transformer(
+            images=images_of_galaxies, transformer=transformer
+        )
+
+        return dict(zip(galaxies, profile_visibilities_of_galaxies))
 
 
 class Tracer(AbstractTracerData):
@@ -824,3 +1508,813 @@ class Tracer(AbstractTracerData):
             )
 
         return Tracer(planes=planes, cosmology=cosmology)
+
+
+class TracerTemplate:
+    def __init__(self, galaxies, cosmology=cosmo.Planck15, galaxy_attributes=None):
+        """
+        A template which creates tracers from lists of galaxies that have the same structure (the same number of
+        galaxies, in the same order, with the same redshifts), for example the galaxies of every model instance
+        fitted by a `NonLinearSearch`.
+
+        `Tracer.from_galaxies` determines the plane redshifts and groups the galaxies into planes every time it is
+        called. When the structure of the galaxies is fixed this is the same for every tracer, so the template
+        computes the index of every galaxy's plane once and creates tracers by placing the input galaxies in their
+        planes.
+
+        Attributes that are associated with galaxies of the model before they are fitted (e.g. the hyper images of a
+        previous phase) can also be set by the template, via the galaxy_attributes dictionary.
+
+        Parameters
+        ----------
+        galaxies : [Galaxy]
+            The galaxies whose structure the template is created from.
+        cosmology : astropy.cosmology
+            The cosmology of the tracers that are created.
+        galaxy_attributes : {int: {str: object}} or None
+            Dictionary mapping the index of a galaxy in the list of galaxies to a dictionary of the attributes that
+            are set on that galaxy whenever a tracer is created.
+        """
+        galaxies = list(galaxies)
+
+        self.galaxy_redshifts = tuple(galaxy.redshift for galaxy in galaxies)
+        self.plane_redshifts = plane_util.ordered_plane_redshifts_from(
+            galaxies=galaxies
+        )
+
+        self.plane_galaxy_indexes = [[] for _ in range(len(self.plane_redshifts))]
+
+        for galaxy_index, galaxy_redshift in enumerate(self.galaxy_redshifts):
+
+            plane_index = np.argmin(
+                np.abs(np.asarray(self.plane_redshifts) - galaxy_redshift)
+            )
+
+            self.plane_galaxy_indexes[plane_index].append(galaxy_index)
+
+        self.cosmology = cosmology
+        self.galaxy_attributes = galaxy_attributes or {}
+
+    def is_template_of(self, galaxies):
+        """
+        Returns whether the template can create the tracer of a list of galaxies, which requires the galaxies to have
+        the same redshifts as the galaxies the template was created from.
+        """
+        return (
+            tuple(galaxy.redshift for galaxy in galaxies) == self.galaxy_redshifts
+        )
+
+    def tracer_from_galaxies(self, galaxies):
+        """
+        Create the tracer of a list of galaxies with the same structure as the galaxies the template was created
+        from, which is equivalent to `Tracer.from_galaxies`.
+        """
+        galaxies = list(galaxies)
+
+        for galaxy_index, attributes in self.galaxy_attributes.items():
+            for name, value in attributes.items():
+                setattr(galaxies[galaxy_index], name, value)
+
+        planes = [
+            pl.Plane(
+                redshift=plane_redshift,
+                galaxies=[galaxies[galaxy_index] for galaxy_index in galaxy_indexes],
+            )
+            for plane_redshift, galaxy_indexes in zip(
+                self.plane_redshifts, self.plane_galaxy_indexes
+            )
+        ]
+
+        return Tracer(planes=planes, cosmology=self.cosmology)
+
+
+def images_of_tracers_from_grid(tracers, grid):
+    """
+    Compute the (binned) image of every tracer in a list of tracers on the same grid, for example the tracers of a
+    batch of model instances proposed by a non-linear search.
+
+    If every tracer has the same planes, galaxies and profile types, and every profile has a batched function in
+    `deflections_of_profiles_functions` or `images_of_profiles_functions`, the grid is ray-traced and the images are
+    computed for every tracer at once, with the parameters of every profile stacked over the tracers. This replaces
+    a loop over tracers, galaxies and profiles with one set of array operations per profile of the model. Otherwise
+    (or if the grid is not a `Grid`, e.g. a `GridIterate` or `GridInterpolate`) the image of every tracer is computed
+    individually.
+
+    Parameters
+    ----------
+    tracers : [Tracer]
+        The tracers whose images are computed.
+    grid : grids.Grid
+        The image-plane grid which is traced by every tracer.
+
+    Returns
+    -------
+    np.ndarray
+        The binned images of every tracer of shape [total_tracers, total_unmasked_pixels].
+    """
+    images = np.zeros(shape=(len(tracers), grid.shape_1d))
+
+    if len(tracers) == 0:
+        return images
+
+    if not tracers_are_batchable(tracers=tracers, grid=grid):
+
+        for tracer_index, tracer in enumerate(tracers):
+
+            if not tracer.has_light_profile:
+                continue
+
+            images[tracer_index, :] = tracer.image_from_grid(grid=grid).in_1d_binned
+
+        return images
+
+    grids_of_tracers = np.repeat(
+        np.asarray(grid)[None, :, :], repeats=len(tracers), axis=0
+    )
+
+    scaling_factors_of_planes = tracers[0].scaling_factors_of_planes
+
+    deflections_of_planes = []
+    images = np.zeros(shape=grids_of_tracers.shape[0:2])
+
+    for plane_index in range(tracers[0].total_planes):
+
+        traced_grids = grids_of_tracers.copy()
+
+        for previous_plane_index in range(plane_index):
+            traced_grids -= (
+                scaling_factors_of_planes[plane_index][previous_plane_index]
+                * deflections_of_planes[previous_plane_index]
+            )
+
+        profiles_of_plane = zip(
+            *[
+                [
+                    profile
+                    for galaxy in tracer.planes[plane_index].galaxies
+                    for profile in galaxy.mass_profiles + galaxy.light_profiles
+                ]
+                for tracer in tracers
+            ]
+        )
+
+        deflections = np.zeros(shape=traced_grids.shape)
+
+        for profiles in profiles_of_plane:
+
+            if isinstance(profiles[0], mp.MassProfile):
+                deflections += deflections_of_profiles_functions[type(profiles[0])](
+                    profiles=profiles, grids=traced_grids
+                )
+            else:
+                images += images_of_profiles_functions[type(profiles[0])](
+                    profiles=profiles, grids=traced_grids
+                )
+
+        deflections_of_planes.append(deflections)
+
+    sub_length = grid.sub_size ** 2
+
+    return images.reshape(len(tracers), -1, sub_length).mean(axis=2)
+
+
+def tracers_are_batchable(tracers, grid):
+    """
+    Whether the images of a list of tracers can be computed together by `images_of_tracers_from_grid`, which
+    requires that the grid is a `Grid` and that every tracer has the same plane redshifts, cosmology, galaxies and
+    profile types, which all have batched functions.
+    """
+    if type(grid) is not grids.Grid:
+        return False
+
+    def structure_key_from(tracer):
+        return (
+            tuple(tracer.plane_redshifts),
+            CosmologyKey(cosmology=tracer.cosmology),
+            tuple(
+                tuple(
+                    (
+                        tuple(type(profile) for profile in galaxy.mass_profiles),
+                        tuple(type(profile) for profile in galaxy.light_profiles),
+                    )
+                    for galaxy in plane.galaxies
+                )
+                for plane in tracer.planes
+            ),
+        )
+
+    structure_key = structure_key_from(tracer=tracers[0])
+
+    for plane_key in structure_key[2]:
+        for mass_profile_types, light_profile_types in plane_key:
+
+            if any(
+                profile_type not in deflections_of_profiles_functions
+                for profile_type in mass_profile_types
+            ):
+                return False
+
+            if any(
+                profile_type not in images_of_profiles_functions
+                for profile_type in light_profile_types
+            ):
+                return False
+
+    return all(structure_key_from(tracer=tracer) == structure_key for tracer in tracers)
+
+
+def profile_parameters_from(profiles, name):
+    """
+    Returns the parameter `name` of every profile in a list of profiles as an array of shape [total_profiles, 1],
+    such that it broadcasts over the coordinates of a stacked grid of shape [total_profiles, total_coordinates].
+    """
+    return np.asarray([getattr(profile, name) for profile in profiles])[:, None]
+
+
+def transformed_grids_from(profiles, grids):
+    """
+    Transform a stacked grid of (y,x) coordinates of shape [total_profiles, total_coordinates, 2] to the reference
+    frame of every profile, which is the batched equivalent of `transform_grid_to_reference_frame` followed by the
+    `relocate_to_radial_minimum` decorator of the profile.
+    """
+    centres = np.asarray([profile.centre for profile in profiles])
+
+    transformed_grids = grids - centres[:, None, :]
+
+    if not profiles[0].__class__.__name__.startswith("Spherical"):
+
+        radii = np.sqrt(np.sum(transformed_grids ** 2.0, axis=2))
+        thetas = np.arctan2(
+            transformed_grids[:, :, 0], transformed_grids[:, :, 1]
+        ) - np.radians(profile_parameters_from(profiles=profiles, name="phi"))
+
+        transformed_grids = np.stack(
+            (radii * np.sin(thetas), radii * np.cos(thetas)), axis=2
+        )
+
+    radial_minimum = conf.instance["grids"]["radial_minimum"]["radial_minimum"][
+        profiles[0].__class__.__name__
+    ]
+
+    with np.errstate(all="ignore"):
+
+        radii = np.sqrt(np.sum(transformed_grids ** 2.0, axis=2))
+
+        transformed_grids = transformed_grids * np.where(
+            radii < radial_minimum, radial_minimum / radii, 1.0
+        )[:, :, None]
+
+    return transformed_grids
+
+
+def rotated_grids_from(profiles, grids):
+    """
+    Rotate a stacked grid of (y,x) coordinates in the reference frame of every profile back to the original reference
+    frame, which is the batched equivalent of `rotate_grid_from_profile`.
+    """
+    phis = np.radians(profile_parameters_from(profiles=profiles, name="phi"))
+
+    cos_phis = np.cos(phis)
+    sin_phis = np.sin(phis)
+
+    return np.stack(
+        (
+            grids[:, :, 1] * sin_phis + grids[:, :, 0] * cos_phis,
+            grids[:, :, 1] * cos_phis - grids[:, :, 0] * sin_phis,
+        ),
+        axis=2,
+    )
+
+
+def deflections_of_elliptical_isothermals_from(profiles, grids):
+    """
+    Returns the deflection angles of a list of `EllipticalIsothermal` profiles on a stacked grid of shape
+    [total_profiles, total_coordinates, 2], where every profile is evaluated on its own grid.
+    """
+    grids = transformed_grids_from(profiles=profiles, grids=grids)
+
+    axis_ratios = profile_parameters_from(profiles=profiles, name="axis_ratio")
+    einstein_radii_rescaled = profile_parameters_from(
+        profiles=profiles, name="einstein_radius_rescaled"
+    )
+
+    factors = (
+        2.0 * einstein_radii_rescaled * axis_ratios / np.sqrt(1 - axis_ratios ** 2)
+    )
+
+    psis = np.sqrt(axis_ratios ** 2 * grids[:, :, 1] ** 2 + grids[:, :, 0] ** 2)
+
+    deflections = np.stack(
+        (
+            factors * np.arctanh(np.sqrt(1 - axis_ratios ** 2) * grids[:, :, 0] / psis),
+            factors * np.arctan(np.sqrt(1 - axis_ratios ** 2) * grids[:, :, 1] / psis),
+        ),
+        axis=2,
+    )
+
+    return rotated_grids_from(profiles=profiles, grids=deflections)
+
+
+def deflections_of_spherical_isothermals_from(profiles, grids):
+    """
+    Returns the deflection angles of a list of `SphericalIsothermal` profiles on a stacked grid of shape
+    [total_profiles, total_coordinates, 2], where every profile is evaluated on its own grid.
+    """
+    grids = transformed_grids_from(profiles=profiles, grids=grids)
+
+    radii = 2.0 * profile_parameters_from(
+        profiles=profiles, name="einstein_radius_rescaled"
+    )
+
+    thetas = np.arctan2(grids[:, :, 0], grids[:, :, 1]) - np.radians(
+        profile_parameters_from(profiles=profiles, name="phi")
+    )
+
+    return np.stack((radii * np.sin(thetas), radii * np.cos(thetas)), axis=2)
+
+
+def deflections_of_external_shears_from(profiles, grids):
+    """
+    Returns the deflection angles of a list of `ExternalShear` profiles on a stacked grid of shape
+    [total_profiles, total_coordinates, 2], where every profile is evaluated on its own grid.
+    """
+    grids = transformed_grids_from(profiles=profiles, grids=grids)
+
+    magnitudes = profile_parameters_from(profiles=profiles, name="magnitude")
+
+    deflections = np.stack(
+        (-magnitudes * grids[:, :, 0], magnitudes * grids[:, :, 1]), axis=2
+    )
+
+    return rotated_grids_from(profiles=profiles, grids=deflections)
+
+
+def images_of_sersics_from(profiles, grids):
+    """
+    Returns the images of a list of `EllipticalSersic` profiles (or its subclasses, e.g. `EllipticalExponential`)
+    on a stacked grid of shape [total_profiles, total_coordinates, 2], where every profile is evaluated on its own
+    grid.
+    """
+    grids = transformed_grids_from(profiles=profiles, grids=grids)
+
+    axis_ratios = profile_parameters_from(profiles=profiles, name="axis_ratio")
+    intensities = profile_parameters_from(profiles=profiles, name="intensity")
+    effective_radii = profile_parameters_from(
+        profiles=profiles, name="effective_radius"
+    )
+    sersic_indexes = profile_parameters_from(profiles=profiles, name="sersic_index")
+    sersic_constants = profile_parameters_from(
+        profiles=profiles, name="sersic_constant"
+    )
+
+    eccentric_radii = np.sqrt(axis_ratios) * np.sqrt(
+        grids[:, :, 1] ** 2 + (grids[:, :, 0] / axis_ratios) ** 2
+    )
+
+    with np.errstate(all="ignore"):
+        return intensities * np.exp(
+            -sersic_constants
+            * ((eccentric_radii / effective_radii) ** (1.0 / sersic_indexes) - 1.0)
+        )
+
+
+deflections_of_profiles_functions = {
+    mp.EllipticalIsothermal: deflections_of_elliptical_isothermals_from,
+    mp.SphericalIsothermal: deflections_of_spherical_isothermals_from,
+    mp.ExternalShear: deflections_of_external_shears_from,
+}
+
+images_of_profiles_functions = {
+    lp.EllipticalSersic: images_of_sersics_from,
+    lp.SphericalSersic: images_of_sersics_from,
+    lp.EllipticalExponential: images_of_sersics_from,
+    lp.SphericalExponential: images_of_sersics_from,
+    lp.EllipticalDevVaucouleurs: images_of_sersics_from,
+    lp.SphericalDevVaucouleurs: images_of_sersics_from,
+}
+
+
+def blurred_images_of_tracers_from_grid_and_convolver(tracers, grid, convolver, blurring_grid):
+    """
+    Compute the blurred image of every tracer in a list of tracers which share the same grid, blurring grid and
+    convolver, for example the tracers of a batch of model instances proposed by a non-linear search.
+
+    The (binned) image and blurring image of every tracer are stacked into 2D arrays, which are then blurred with the
+    PSF in a single pass over the convolver's frames. This amortizes the overhead of looping over the convolver's
+    frames, which is otherwise repeated for every tracer.
+
+    Parameters
+    ----------
+    tracers : [Tracer]
+        The tracers whose blurred images are computed.
+    grid : grids.Grid
+        The image-plane grid which is traced by every tracer.
+    convolver : hyper_galaxies.imaging.convolution.ConvolverImage
+        Class which performs the PSF convolution of a masked image in 1D.
+    blurring_grid : grids.Grid
+        The image-plane grid of pixels outside the mask whose light blurs into the mask.
+
+    Returns
+    -------
+    np.ndarray
+        The blurred images of every tracer of shape [total_tracers, total_unmasked_pixels].
+    """
+    images = images_of_tracers_from_grid(tracers=tracers, grid=grid)
+    blurring_images = images_of_tracers_from_grid(tracers=tracers, grid=blurring_grid)
+
+    return convolve_images_jit(
+        images=images,
+        image_frame_1d_indexes=convolver.image_frame_1d_indexes,
+        image_frame_1d_kernels=convolver.image_frame_1d_kernels,
+        image_frame_1d_lengths=convolver.image_frame_1d_lengths,
+        blurring_images=blurring_images,
+        blurring_frame_1d_indexes=convolver.blurring_frame_1d_indexes,
+        blurring_frame_1d_kernels=convolver.blurring_frame_1d_kernels,
+        blurring_frame_1d_lengths=convolver.blurring_frame_1d_lengths,
+    )
+
+
+def visibilities_of_images_from_transformer(images, transformer):
+    """
+    Fourier transform a list of images which share the same (real-space) mask to visibilities with a transformer, for
+    example the images of every plane or galaxy of a tracer.
+
+    For a `TransformerDFT` the images are stacked and transformed in a single pass over the image pixels and
+    visibilities, such that the sine and cosine of every pixel and visibility (or their preloaded values) are computed
+    (or read) once and applied to every image, as opposed to once per image.
+
+    For a `TransformerNUFFT` every image is transformed with the NUFFT plan of the transformer, which is made once
+    when the transformer is created and is shared by every image.
+
+    Parameters
+    ----------
+    images : [arrays.Array]
+        The images which are Fourier transformed.
+    transformer : TransformerDFT or TransformerNUFFT
+        The transformer which performs the Fourier transform.
+
+    Returns
+    -------
+    [vis.Visibilities]
+        The visibilities of every image.
+    """
+    if len(images) == 0:
+        return []
+
+    if not isinstance(transformer, trans.TransformerDFT):
+        return [transformer.visibilities_from_image(image=image) for image in images]
+
+    images_1d = np.stack([np.asarray(image.in_1d_binned) for image in images])
+
+    if transformer.preload_transform:
+
+        visibilities_of_images = visibilities_of_images_via_preload_jit_from(
+            images_1d=images_1d,
+            preloaded_reals=transformer.preload_real_transforms,
+            preloaded_imags=transformer.preload_imag_transforms,
+        )
+
+    else:
+
+        visibilities_of_images = visibilities_of_images_jit(
+            images_1d=images_1d,
+            grid_radians=np.asarray(transformer.grid),
+            uv_wavelengths=transformer.uv_wavelengths,
+        )
+
+    return [
+        vis.Visibilities(visibilities=visibilities)
+        for visibilities in visibilities_of_images
+    ]
+
+
+@decorator_util.jit()
+def visibilities_of_images_via_preload_jit_from(
+    images_1d, preloaded_reals, preloaded_imags
+):
+    """
+    The batched equivalent of *transformer_util.visibilities_via_preload_jit_from*, which reads every preloaded
+    transform value once and applies it to every image of shape [total_images, total_unmasked_pixels].
+    """
+    total_images = images_1d.shape[0]
+
+    visibilities = 0 + 0j * np.zeros(shape=(total_images, preloaded_reals.shape[1]))
+
+    for image_1d_index in range(images_1d.shape[1]):
+        for vis_1d_index in range(preloaded_reals.shape[1]):
+
+            preloaded_real = preloaded_reals[image_1d_index, vis_1d_index]
+            preloaded_imag = preloaded_imags[image_1d_index, vis_1d_index]
+
+            for image_index in range(total_images):
+
+                vis_real = images_1d[image_index, image_1d_index] * preloaded_real
+                vis_imag = images_1d[image_index, image_1d_index] * preloaded_imag
+                visibilities[image_index, vis_1d_index] += vis_real + 1j * vis_imag
+
+    return visibilities
+
+
+@decorator_util.jit()
+def visibilities_of_images_jit(images_1d, grid_radians, uv_wavelengths):
+    """
+    The batched equivalent of *transformer_util.visibilities_jit*, which computes the sine and cosine of every image
+    pixel and visibility once and applies them to every image of shape [total_images, total_unmasked_pixels].
+    """
+    total_images = images_1d.shape[0]
+
+    visibilities = 0 + 0j * np.zeros(shape=(total_images, uv_wavelengths.shape[0]))
+
+    for image_1d_index in range(images_1d.shape[1]):
+        for vis_1d_index in range(uv_wavelengths.shape[0]):
+
+            phase = (
+                -2.0
+                * np.pi
+                * (
+                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
+                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
+                )
+            )
+
+            cos_phase = np.cos(phase)
+            sin_phase = np.sin(phase)
+
+            for image_index in range(total_images):
+
+                vis_real = images_1d[image_index, image_1d_index] * cos_phase
+                vis_imag = images_1d[image_index, image_1d_index] * sin_phase
+                visibilities[image_index, vis_1d_index] += vis_real + 1j * vis_imag
+
+    return visibilities
+
+
+@decorator_util.jit()
+def convolve_images_jit(
+    images,
+    image_frame_1d_indexes,
+    image_frame_1d_kernels,
+    image_frame_1d_lengths,
+    blurring_images,
+    blurring_frame_1d_indexes,
+    blurring_frame_1d_kernels,
+    blurring_frame_1d_lengths,
+):
+    """
+    Convolve a stack of 1D images and blurring images with a PSF using the frames of a convolver, which is the
+    batched equivalent of *Convolver.convolve_jit*.
+
+    Every PSF frame is read once and applied to all images in the stack, with the images stored as the trailing
+    loop so that every kernel value is reused across the batch.
+
+    Parameters
+    ----------
+    images : np.ndarray
+        The 1D images which are blurred of shape [total_images, total_unmasked_pixels].
+    blurring_images : np.ndarray
+        The 1D blurring images which blur into the images of shape [total_images, total_blurring_pixels].
+    """
+    total_images = images.shape[0]
+
+    blurred_images = np.zeros(images.shape)
+
+    for image_1d_index in range(images.shape[1]):
+
+        frame_1d_indexes = image_frame_1d_indexes[image_1d_index]
+        frame_1d_kernel = image_frame_1d_kernels[image_1d_index]
+        frame_1d_length = image_frame_1d_lengths[image_1d_index]
+
+        for kernel_1d_index in range(frame_1d_length):
+
+            vector_index = frame_1d_indexes[kernel_1d_index]
+            kernel_value = frame_1d_kernel[kernel_1d_index]
+
+            for image_index in range(total_images):
+                blurred_images[image_index, vector_index] += (
+                    images[image_index, image_1d_index] * kernel_value
+                )
+
+    for blurring_1d_index in range(blurring_images.shape[1]):
+
+        frame_1d_indexes = blurring_frame_1d_indexes[blurring_1d_index]
+        frame_1d_kernel = blurring_frame_1d_kernels[blurring_1d_index]
+        frame_1d_length = blurring_frame_1d_lengths[blurring_1d_index]
+
+        for kernel_1d_index in range(frame_1d_length):
+
+            vector_index = frame_1d_indexes[kernel_1d_index]
+            kernel_value = frame_1d_kernel[kernel_1d_index]
+
+            for image_index in range(total_images):
+                blurred_images[image_index, vector_index] += (
+                    blurring_images[image_index, blurring_1d_index] * kernel_value
+                )
+
+    return blurred_images
+
+
+def parameters_key_from(obj):
+    """
+    Returns a hashable key of the type and parameters (attributes) of an object such as a light profile or
+    pixelization, which is equal for two objects if and only if they have the same type and parameters. If the
+    object has a parameter which is not hashable None is returned, such that quantities computed from the object are
+    never reused.
+
+    Parameters
+    ----------
+    obj : object
+        The object whose parameters the key is computed from.
+    """
+    parameters_key = (type(obj), tuple(sorted(vars(obj).items())))
+
+    try:
+        hash(parameters_key)
+    except TypeError:
+        return None
+
+    return parameters_key
+
+
+def profiles_key_from(profiles):
+    """
+    Returns a hashable key of the types and parameters of a list of profiles, for example the light or mass profiles
+    of a galaxy (see `parameters_key_from`), or None if a profile has a parameter which is not hashable.
+
+    Parameters
+    ----------
+    profiles : [LightProfile] or [MassProfile]
+        The profiles the key is computed from.
+    """
+    profiles_key = tuple(parameters_key_from(obj=profile) for profile in profiles)
+
+    if None in profiles_key:
+        return None
+
+    return profiles_key
+
+
+def arrays_are_equal(array_0, array_1):
+    """
+    Returns whether two inputs of a cached calculation are the same, which is the case if they are the same object or
+    are arrays with the same shape and values (e.g. sparse grids recomputed with the same KMeans seed).
+    """
+    if array_0 is array_1:
+        return True
+
+    if not isinstance(array_0, np.ndarray) or not isinstance(array_1, np.ndarray):
+        return False
+
+    return array_0.shape == array_1.shape and np.array_equal(array_0, array_1)
+
+
+class CosmologyKey:
+    def __init__(self, cosmology):
+        """
+        A cosmology wrapped such that it can be used as a cache key.
+
+        From astropy 5 onwards cosmologies define `__eq__` without `__hash__` and cannot be hashed, in which case the
+        key is the cosmology's class and `repr`, which lists all of its parameters. Hashable cosmologies (e.g. those
+        of earlier astropy versions) are their own key.
+
+        Parameters
+        ----------
+        cosmology : astropy.cosmology
+            The cosmology that is wrapped.
+        """
+        self.cosmology = cosmology
+
+        try:
+            hash(cosmology)
+            self.key = cosmology
+        except TypeError:
+            self.key = (type(cosmology), repr(cosmology))
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, CosmologyKey) and self.key == other.key
+
+
+@lru_cache(maxsize=128)
+def scaling_factors_of_planes_from(plane_redshifts, cosmology):
+    """
+    Compute the matrix of multi-plane ray-tracing scaling factors between every pair of planes, where entry [i, j]
+    is the factor by which the deflection angles of plane j are scaled when tracing to plane i. Only entries with
+    j < i are used by ray-tracing, all other entries are zero.
+
+    Every scaling factor requires multiple angular diameter distance calculations via astropy, which are expensive.
+    Because the plane redshifts of a lens model are typically fixed throughout a model-fit, this function is cached
+    on the input (plane_redshifts, cosmology) such that these calculations are only performed once.
+
+    Parameters
+    ----------
+    plane_redshifts : (float,)
+        The redshifts of the planes in ascending order, as a tuple so that they can be used as a cache key.
+    cosmology : CosmologyKey
+        The cosmology of the ray-tracing calculation, wrapped such that it can be used as a cache key.
+    """
+    total_planes = len(plane_redshifts)
+
+    scaling_factors = np.zeros(shape=(total_planes, total_planes))
+
+    for plane_index in range(1, total_planes):
+        for previous_plane_index in range(plane_index):
+            scaling_factors[
+                plane_index, previous_plane_index
+            ] = cosmology_util.scaling_factor_between_redshifts_from(
+                redshift_0=plane_redshifts[previous_plane_index],
+                redshift_1=plane_redshifts[plane_index],
+                redshift_final=plane_redshifts[-1],
+                cosmology=cosmology.cosmology,
+            )
+
+    scaling_factors.flags.writeable = False
+
+    return scaling_factors
+
+
+@decorator_util.jit()
+def grid_subtract_scaled_deflections(grid, deflections, scaling_factor):
+    """
+    Subtract deflection angles multiplied by a scaling factor from a grid of (y,x) coordinates in place, which is
+    used by multi-plane ray-tracing to trace a grid via the deflection angles of a previous plane.
+
+    This avoids creating the temporary arrays of the scaled deflections and subtracted grid that the equivalent
+    NumPy expression creates.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The grid of (y,x) coordinates of shape [total_coordinates, 2] which is updated in place.
+    deflections : np.ndarray
+        The deflection angles of a previous plane of shape [total_coordinates, 2].
+    scaling_factor : float
+        The factor by which the deflection angles are scaled before they are subtracted from the grid.
+    """
+    for grid_index in range(grid.shape[0]):
+        grid[grid_index, 0] -= scaling_factor * deflections[grid_index, 0]
+        grid[grid_index, 1] -= scaling_factor * deflections[grid_index, 1]
+
+    return grid
+
+
+def interpolation_weights_from(grid_interp, grid):
+    """
+    Compute the weights which linearly interpolate values evaluated on an interpolation grid to a grid of (y,x)
+    coordinates, using the Delaunay triangulation of the interpolation grid.
+
+    This follows *GridInterpolate.interp_weights*, returning the indexes of the 3 vertices of the Delaunay triangle
+    every coordinate is in and their barycentric weights. Coordinates outside the interpolation grid have vertex
+    indexes of -1.
+
+    Parameters
+    ----------
+    grid_interp : np.ndarray
+        The interpolation grid of (y,x) coordinates values are evaluated on.
+    grid : np.ndarray
+        The grid of (y,x) coordinates values are interpolated to.
+    """
+    delaunay = qhull.Delaunay(np.asarray(grid_interp))
+
+    simplices = delaunay.find_simplex(grid)
+
+    vertices = np.take(delaunay.simplices, simplices, axis=0)
+    vertices[simplices < 0] = -1
+
+    transform = np.take(delaunay.transform, simplices, axis=0)
+    barycentric = np.einsum("njk,nk->nj", transform[:, :2, :], grid - transform[:, 2])
+
+    weights = np.hstack((barycentric, 1 - barycentric.sum(axis=1, keepdims=True)))
+
+    return vertices, weights
+
+
+@decorator_util.jit()
+def grid_interpolated_from(grid_interp, vertices, weights):
+    """
+    Interpolate (y,x) values evaluated on an interpolation grid (e.g. deflection angles or traced coordinates) to
+    a grid, using the vertices and weights of the Delaunay triangle every grid coordinate is in (see
+    *GridInterpolate.interp_weights* and `interpolation_weights_from`).
+
+    Parameters
+    ----------
+    grid_interp : np.ndarray
+        The (y,x) values evaluated on the interpolation grid of shape [total_interpolation_coordinates, 2].
+    vertices : np.ndarray
+        The indexes of the 3 interpolation grid vertices of every grid coordinate, of shape [total_coordinates, 3].
+    weights : np.ndarray
+        The weights of the 3 vertices of every grid coordinate, of shape [total_coordinates, 3].
+    """
+    grid = np.zeros(shape=(vertices.shape[0], 2))
+
+    for grid_index in range(vertices.shape[0]):
+        for vertex_index in range(vertices.shape[1]):
+
+            weight = weights[grid_index, vertex_index]
+            vertex = vertices[grid_index, vertex_index]
+
+            grid[grid_index, 0] += weight * grid_interp[vertex, 0]
+            grid[grid_index, 1] += weight * grid_interp[vertex, 1]
+
+    return grid
@@ -14,6 +14,14 @@ class SettingsLens:
         stochastic_likelihood_resamples=None,
         stochastic_samples: int = 250,
         stochastic_histogram_bins: int = 10,
+        stochastic_number_of_cores: int = 1,
+        preload_traced_grids_of_planes: bool = False,
+        preload_blurred_images_of_galaxies: bool = False,
+        preload_inversion_matrices: bool = False,
+        preload_deflections_of_galaxies: bool = False,
+        deflections_interpolate_accuracy: float = None,
+        log_likelihood_threshold: float = None,
+        pixelization_minimum_coverage: float = None,
     ):
 
         self.positions_threshold = positions_threshold
@@ -22,13 +30,23 @@ class SettingsLens:
         self.stochastic_likelihood_resamples = stochastic_likelihood_resamples
         self.stochastic_samples = stochastic_samples
         self.stochastic_histogram_bins = stochastic_histogram_bins
+        self.stochastic_number_of_cores = stochastic_number_of_cores
+        self.preload_traced_grids_of_planes = preload_traced_grids_of_planes
+        self.preload_blurred_images_of_galaxies = preload_blurred_images_of_galaxies
+        self.preload_inversion_matrices = preload_inversion_matrices
+        self.preload_deflections_of_galaxies = preload_deflections_of_galaxies
+        self.deflections_interpolate_accuracy = deflections_interpolate_accuracy
+        self.log_likelihood_threshold = log_likelihood_threshold
+        self.pixelization_minimum_coverage = pixelization_minimum_coverage
 
     @property
     def tag(self):
         return (
             f"{conf.instance['notation']['settings_tags']['lens']['lens']}["
             f"{self.positions_threshold_tag}"
-            f"{self.stochastic_likelihood_resamples_tag}]"
+            f"{self.stochastic_likelihood_resamples_tag}"
+            f"{self.log_likelihood_threshold_tag}"
+            f"{self.pixelization_minimum_coverage_tag}]"
         )
 
     @property
@@ -68,6 +86,42 @@ class SettingsLens:
             f"{self.stochastic_likelihood_resamples}"
         )
 
+    @property
+    def log_likelihood_threshold_tag(self):
+        """Generate a log likelihood threshold tag, to customize phase names based on the threshold below which the \
+        upper bound of a model's log likelihood rejects it.
+
+        This changes the phase name 'name' as follows:
+
+        log_likelihood_threshold = None -> name
+        log_likelihood_threshold = -100.0 -> name__lh_threshold_-100.0
+        """
+
+        if self.log_likelihood_threshold is None:
+            return ""
+        return (
+            f'__{conf.instance["notation"]["settings_tags"]["lens"]["log_likelihood_threshold"]}_'
+            f"{self.log_likelihood_threshold}"
+        )
+
+    @property
+    def pixelization_minimum_coverage_tag(self):
+        """Generate a pixelization coverage tag, to customize phase names based on the minimum fraction of source \
+        pixels a model's mapper must map image pixels to.
+
+        This changes the phase name 'name' as follows:
+
+        pixelization_minimum_coverage = None -> name
+        pixelization_minimum_coverage = 0.5 -> name__pix_coverage_0.5
+        """
+
+        if self.pixelization_minimum_coverage is None:
+            return ""
+        return (
+            f'__{conf.instance["notation"]["settings_tags"]["lens"]["pixelization_minimum_coverage"]}_'
+            f"{self.pixelization_minimum_coverage}"
+        )
+
     def check_positions_trace_within_threshold_via_tracer(self, positions, tracer):
 
         if not tracer.has_mass_profile or len(tracer.planes) == 1:
@@ -75,17 +129,67 @@ class SettingsLens:
 
         if positions is not None and self.positions_threshold is not None:
 
-            positions_fit = fit_positions.FitPositionsSourcePlaneMaxSeparation(
-                positions=positions, tracer=tracer, noise_value=1.0
-            )
-
-            if not positions_fit.maximum_separation_within_threshold(
-                self.positions_threshold
+            if not fit_positions.positions_trace_within_threshold_via_tracer(
+                positions=positions, tracer=tracer, threshold=self.positions_threshold
             ):
                 raise exc.RayTracingException
 
+    def check_log_likelihood_upper_bound(self, log_likelihood_upper_bound):
+        """
+        Reject a model whose log likelihood cannot exceed the `log_likelihood_threshold`, given an upper bound on its
+        log likelihood that is computed before its fit (e.g. `fit.log_likelihood_upper_bound_imaging_from`).
+        """
+        if self.log_likelihood_threshold is None:
+            return
+
+        if not log_likelihood_upper_bound >= self.log_likelihood_threshold:
+            raise exc.LikelihoodException
+
+    def check_pixelization_coverage_via_tracer(
+        self, grid, tracer, settings_pixelization
+    ):
+        """
+        Reject a model whose mapper is degenerate before its inversion is performed, which is the case if the traced
+        grid maps to fewer than the `pixelization_minimum_coverage` fraction of its source pixels (e.g. a mass model
+        which demagnifies the source-plane grid such that most source pixels are unconstrained by the data).
+
+        The mapper is cached by the tracer, such that the inversion reuses it. The check is skipped if the tracer
+        reuses the matrices of a previous inversion (see `Tracer.inversion_matrices_cache`).
+        """
+        if (
+            self.pixelization_minimum_coverage is None
+            or not tracer.has_pixelization
+            or tracer.inversion_matrices_cache is not None
+        ):
+            return
+
+        if not (
+            tracer.pixelization_coverage_from_grid(
+                grid=grid, settings_pixelization=settings_pixelization
+            )
+            >= self.pixelization_minimum_coverage
+        ):
+            raise exc.PixelizationException
+
     def modify_positions_threshold(self, positions_threshold):
 
         settings = copy.copy(self)
         settings.positions_threshold = positions_threshold
         return settings
+
+    def modify_preload(
+        self,
+        preload_traced_grids_of_planes,
+        preload_blurred_images_of_galaxies=False,
+        preload_inversion_matrices=False,
+        preload_deflections_of_galaxies=False,
+    ):
+
+        settings = copy.copy(self)
+        settings.preload_traced_grids_of_planes = preload_traced_grids_of_planes
+        settings.preload_blurred_images_of_galaxies = (
+            preload_blurred_images_of_galaxies
+        )
+        settings.preload_inversion_matrices = preload_inversion_matrices
+        settings.preload_deflections_of_galaxies = preload_deflections_of_galaxies
+        return settings
@@ -5,16 +5,36 @@ from autolens.lens import positions_solver as pos
 
 
 class Result(result.Result):
+
+    _max_log_likelihood_tracer = None
+
+    def clear_cache(self):
+        """
+        Clear the maximum log likelihood tracer and fit cached by the result, and every quantity cached from them, such
+        that they are recomputed when next accessed.
+
+        The cache must be cleared if the result's instance or analysis are changed after these quantities are accessed.
+        """
+        self._max_log_likelihood_tracer = None
+
     @property
     def max_log_likelihood_plane(self):
         raise NotImplementedError()
 
     @property
     def max_log_likelihood_tracer(self):
+        """
+        The tracer of the maximum log likelihood instance, which is computed once and cached (see `clear_cache`).
+        """
+        if self._max_log_likelihood_tracer is None:
 
-        instance = self.analysis.associate_hyper_images(instance=self.instance)
+            instance = self.analysis.associate_hyper_images(instance=self.instance)
 
-        return self.analysis.tracer_for_instance(instance=instance)
+            self._max_log_likelihood_tracer = self.analysis.tracer_for_instance(
+                instance=instance
+            )
+
+        return self._max_log_likelihood_tracer
 
     @property
     def source_plane_light_profile_centres(self) -> grids.GridIrregularGrouped:
@@ -62,11 +82,9 @@ class Result(result.Result):
         These image-plane positions are used by the next phase in a pipeline if automatic position updating is turned
         on."""
 
-        # TODO : In the future, the multiple image positions functioon wil use an in-built adaptive grid.
-
         grid = self.analysis.masked_dataset.mask.geometry.unmasked_grid_sub_1
 
-        solver = pos.PositionsFinder(grid=grid, pixel_scale_precision=0.001)
+        solver = pos.PositionsFinderTriangles(grid=grid, pixel_scale_precision=0.001)
 
         try:
             multiple_images = [
@@ -1,21 +1,188 @@
 import autofit as af
+from autofit.exc import FitException
 from autolens.lens import ray_tracing
+from collections import OrderedDict
+from contextlib import contextmanager
 from os import path
 import os
 import pickle
 from typing import List
 import json
 import numpy as np
+import time
+
+
+class LikelihoodStages:
+    def __init__(self):
+        """
+        Records the number of calls, number of rejections and total run-time of every stage of a log likelihood
+        function, for example the positions check and the full fit. This allows the stages that a log likelihood
+        function performs before the (expensive) fit to be tuned.
+
+        The stages which precede the fit are cheap gates that reject a model before it is fitted:
+
+        - positions: the positions do not trace within the `positions_threshold` of the `SettingsLens`.
+        - upper_bound: an upper bound on the log likelihood, computed from the (hyper) noise-map, is below the
+          `log_likelihood_threshold` of the `SettingsLens`.
+        - pixelization_coverage: the mapper maps the grid to fewer than the `pixelization_minimum_coverage` fraction
+          of its source pixels, which is checked before the inversion is performed.
+
+        A rejection is counted whenever a stage raises a `FitException`.
+
+        The stages are recorded separately by every process of a parallel `NonLinearSearch`.
+        """
+        self.calls = OrderedDict()
+        self.rejections = OrderedDict()
+        self.times = OrderedDict()
+
+    @contextmanager
+    def stage(self, name):
+
+        if name not in self.calls:
+            self.calls[name] = 0
+            self.rejections[name] = 0
+            self.times[name] = 0.0
+
+        self.calls[name] += 1
+
+        start = time.time()
+
+        try:
+            yield
+        except FitException:
+            self.rejections[name] += 1
+            raise
+        finally:
+            self.times[name] += time.time() - start
+
+    @property
+    def summary(self):
+        return OrderedDict(
+            (
+                name,
+                {
+                    "calls": self.calls[name],
+                    "rejections": self.rejections[name],
+                    "time": self.times[name],
+                    "time_per_call": self.times[name] / self.calls[name],
+                },
+            )
+            for name in self.calls
+        )
+
+    def output_to_json(self, file_path):
+
+        with open(file_path, "w") as outfile:
+            json.dump(self.summary, outfile, indent=4)
 
 
 class Analysis:
+
+    tracer_template = None
+    preload_tracer = None
+    blurred_images_of_galaxies_cache = None
+    inversion_matrices_cache = None
+    deflections_of_galaxies_cache = None
+
     def plane_for_instance(self, instance):
         raise NotImplementedError()
 
     def tracer_for_instance(self, instance):
+        """
+        Create the tracer of the galaxies of a model instance, associating the hyper images of the previous phase
+        with its galaxies (see `associate_hyper_images`).
+
+        The planes the galaxies are grouped into and the hyper images associated with them are the same for every
+        instance fitted by a `NonLinearSearch`. They are therefore determined once and stored in a `TracerTemplate`,
+        which creates the tracer of every instance by filling in its galaxies. The template is created again if the
+        redshifts of an instance's galaxies do not match it.
+
+        If the mass model of the phase is fixed (see `PhaseDataset.mass_is_model`) the traced grids of planes are
+        preloaded: every tracer shares the cache of traced grids of the first tracer, such that the grid, blurring
+        grid and sparse grids are only ray-traced by the first likelihood evaluation.
+
+        If the model has a galaxy whose light is fixed (see `PhaseDataset.has_galaxy_with_fixed_light`) every tracer
+        shares a cache of the blurred images of its galaxies, such that the blurred image of this galaxy is only
+        computed once.
+
+        If the mass model is fixed and the model has a pixelization every tracer shares a cache of the mapper, blurred
+        mapping matrix and curvature matrix of its inversion, such that phases which only fit the regularization or
+        hyper noise (e.g. hyper phases) do not recompute them.
+
+        If the model has free mass profiles and a galaxy whose mass is fixed (e.g. a subhalo search with a fixed macro
+        lens model) every tracer shares a cache of the deflection angles of its galaxies, such that only the
+        deflection angles of the free mass profiles are computed.
+
+        The accuracy of deflection angles interpolated on a `GridInterpolate` is checked against the
+        `deflections_interpolate_accuracy` of the `SettingsLens` (see `Tracer.deflections_interpolate_accuracy`).
+        """
+        galaxies = list(instance.galaxies)
+
+        if self.tracer_template is None or not self.tracer_template.is_template_of(
+            galaxies=galaxies
+        ):
+            self.tracer_template = self.tracer_template_for_instance(instance=instance)
+
+        tracer = self.tracer_template.tracer_from_galaxies(galaxies=galaxies)
+
+        tracer.deflections_interpolate_accuracy = (
+            self.settings.settings_lens.deflections_interpolate_accuracy
+        )
+
+        if self.settings.settings_lens.preload_traced_grids_of_planes:
+
+            if self.preload_tracer is None:
+                self.preload_tracer = tracer
+            else:
+                tracer.share_traced_grids_of_planes_cache(tracer=self.preload_tracer)
+
+        if self.settings.settings_lens.preload_blurred_images_of_galaxies:
+
+            if self.blurred_images_of_galaxies_cache is None:
+                self.blurred_images_of_galaxies_cache = {}
+
+            tracer.blurred_images_of_galaxies_cache = (
+                self.blurred_images_of_galaxies_cache
+            )
+
+        if self.settings.settings_lens.preload_inversion_matrices:
+
+            if self.inversion_matrices_cache is None:
+                self.inversion_matrices_cache = {}
+
+            tracer.inversion_matrices_cache = self.inversion_matrices_cache
+
+        if self.settings.settings_lens.preload_deflections_of_galaxies:
+
+            if self.deflections_of_galaxies_cache is None:
+                self.deflections_of_galaxies_cache = OrderedDict()
+
+            tracer.deflections_of_galaxies_cache = self.deflections_of_galaxies_cache
+
+        return tracer
+
+    def tracer_template_for_instance(self, instance):
+        """
+        Create the `TracerTemplate` of a model instance, which stores the hyper images that `associate_hyper_images`
+        associates with each of its galaxies.
+        """
+        self.associate_hyper_images(instance=instance)
+
+        galaxies = list(instance.galaxies)
+
+        galaxy_attributes = {
+            galaxy_index: {
+                "hyper_model_image": galaxy.hyper_model_image,
+                "hyper_galaxy_image": galaxy.hyper_galaxy_image,
+            }
+            for galaxy_index, galaxy in enumerate(galaxies)
+            if getattr(galaxy, "hyper_galaxy_image", None) is not None
+        }
 
-        return ray_tracing.Tracer.from_galaxies(
-            galaxies=instance.galaxies, cosmology=self.cosmology
+        return ray_tracing.TracerTemplate(
+            galaxies=galaxies,
+            cosmology=self.cosmology,
+            galaxy_attributes=galaxy_attributes,
         )
 
     def stochastic_log_evidences_for_instance(self, instance) -> List[float]:
@@ -1,4 +1,5 @@
 import autoarray as aa
+import autofit as af
 import autogalaxy as ag
 from autolens.fit import fit_positions
 from autogalaxy.pipeline.phase import dataset
@@ -7,6 +8,7 @@ from autolens import exc
 import numpy as np
 
 import copy
+import inspect
 
 
 class PhaseDataset(dataset.PhaseDataset):
@@ -44,6 +46,15 @@ class PhaseDataset(dataset.PhaseDataset):
             preload_sparse_grids_of_planes=preload_sparse_grids_of_planes
         )
 
+        self.settings.settings_lens = self.settings.settings_lens.modify_preload(
+            preload_traced_grids_of_planes=not self.mass_is_model,
+            preload_blurred_images_of_galaxies=self.has_galaxy_with_fixed_light,
+            preload_inversion_matrices=self.has_pixelization
+            and not self.mass_is_model,
+            preload_deflections_of_galaxies=self.mass_is_model
+            and self.has_galaxy_with_fixed_mass,
+        )
+
     def updated_positions_from_positions_and_results(self, positions, results):
         """If automatic position updating is on, update the phase's positions using the results of the previous phase's
         lens model, by ray-tracing backwards the best-fit source centre(s) to the image-plane.
@@ -174,6 +185,86 @@ class PhaseDataset(dataset.PhaseDataset):
                     return results.last.max_log_likelihood_pixelization_grids_of_planes
         return None
 
+    @property
+    def mass_is_model(self):
+        """
+        Returns whether the deflection angles of the phase's lens model change between the instances fitted by the
+        `NonLinearSearch`, which is the case if a mass profile of any galaxy has free parameters or a galaxy's redshift
+        is free.
+
+        If the mass model is fixed (e.g. it is passed as an instance from a previous phase, or the phase is a hyper
+        phase), the traced grids of planes are the same for every instance and are preloaded by the `Analysis`.
+        """
+        if self.galaxies:
+            for galaxy in self.galaxies:
+
+                if not isinstance(galaxy, af.PriorModel):
+                    continue
+
+                if isinstance(galaxy.redshift, af.Prior):
+                    return True
+
+                for _, prior_model in galaxy.prior_model_tuples:
+
+                    cls = getattr(prior_model, "cls", None)
+
+                    if (
+                        inspect.isclass(cls)
+                        and issubclass(cls, ag.mp.MassProfile)
+                        and prior_model.prior_count > 0
+                    ):
+                        return True
+
+        return False
+
+    @property
+    def has_galaxy_with_fixed_light(self):
+        """
+        Returns whether the lens model has a galaxy with light profiles none of which have free parameters (e.g. a
+        lens light passed as an instance from a previous phase).
+
+        The blurred image of such a galaxy is the same for every instance fitted by the `NonLinearSearch` (provided
+        the grid it is traced to is also fixed) and is preloaded by the `Analysis`.
+        """
+        return self.has_galaxy_with_fixed_profiles(profile_cls=ag.lp.LightProfile)
+
+    @property
+    def has_galaxy_with_fixed_mass(self):
+        """
+        Returns whether the lens model has a galaxy with mass profiles none of which have free parameters (e.g. the
+        macro lens model of a subhalo search with `mass_is_model=False`).
+
+        If other mass profiles of the model are free, the deflection angles of such a galaxy are preloaded by the
+        `Analysis`, such that only the deflection angles of the free mass profiles are computed.
+        """
+        return self.has_galaxy_with_fixed_profiles(profile_cls=ag.mp.MassProfile)
+
+    def has_galaxy_with_fixed_profiles(self, profile_cls):
+        """
+        Returns whether the lens model has a galaxy with profiles of an input class (e.g. `LightProfile`) none of
+        which have free parameters.
+        """
+        if self.galaxies:
+            for galaxy in self.galaxies:
+
+                profiles = [
+                    value
+                    for value in vars(galaxy).values()
+                    if isinstance(value, profile_cls)
+                    or (
+                        inspect.isclass(getattr(value, "cls", None))
+                        and issubclass(value.cls, profile_cls)
+                    )
+                ]
+
+                if len(profiles) > 0 and all(
+                    not isinstance(profile, af.PriorModel) or profile.prior_count == 0
+                    for profile in profiles
+                ):
+                    return True
+
+        return False
+
     def check_positions(self, positions):
 
         if (
@@ -0,0 +1,326 @@
+import json
+import multiprocessing as mp
+import os
+from os import path
+
+import numpy as np
+import autofit as af
+from autolens import exc
+
+
+class GridSearchSubhalo(af.NonLinearSearchGridSearch):
+    def __init__(
+        self,
+        paths,
+        search,
+        number_of_steps=4,
+        number_of_cores=None,
+        einstein_radius=None,
+        centre=None,
+    ):
+        """
+        A grid search of a subhalo's centre, where the `NonLinearSearch` of every cell of the grid is an independent
+        fit of the same dataset.
+
+        The cells are fitted in a pool of processes sized to the machine. The analysis (and therefore the masked
+        dataset) is passed to every process once when it is created, as opposed to being copied with every cell.
+
+        The cells are fitted in order of the distance of their centre from the Einstein ring of the lens, such that
+        the cells where a subhalo is most detectable finish first.
+
+        Every completed cell is recorded in the output path of the grid search, such that a grid search which is
+        interrupted and run again loads the results of its completed cells as opposed to refitting them.
+
+        Parameters
+        ----------
+        number_of_cores : int or None
+            The number of processes the cells are fitted in. If None, the number of cpus of the machine is used. If 1,
+            the cells are fitted in the current process.
+        einstein_radius : float or None
+            The Einstein radius of the lens, which sets the order the cells are fitted in. If None, it is estimated
+            from the largest mass profile Einstein radius of the median model.
+        centre : (float, float) or None
+            The centre of the Einstein ring. If None, the centre of the mass profile used for the Einstein radius is
+            used.
+        """
+        super().__init__(
+            paths=paths, search=search, number_of_steps=number_of_steps, parallel=True
+        )
+
+        self.number_of_cores = number_of_cores or os.cpu_count()
+        self.einstein_radius = einstein_radius
+        self.centre = centre
+
+    @property
+    def completed_cells_path(self) -> str:
+        return path.join(self.paths.output_path, "completed_cells.json")
+
+    def completed_cells(self) -> dict:
+        """
+        The row of the results file of every cell completed by a previous run of the grid search, indexed by cell.
+        """
+        if not path.exists(self.completed_cells_path):
+            return {}
+
+        with open(self.completed_cells_path, "r") as f:
+            return {int(index): row for index, row in json.load(f).items()}
+
+    def record_completed_cells(self, completed_cells):
+
+        with open(self.completed_cells_path, "w+") as f:
+            json.dump(completed_cells, f)
+
+    def einstein_ring_from_model(self, model, grid_priors=()):
+        """
+        The Einstein radius and centre the cells of the grid are ordered by, where values not input to the grid search
+        are estimated from the mass profile with the largest Einstein radius of the model's median instance.
+
+        Galaxies which contain a grid prior (e.g. the subhalo) are omitted from this estimate.
+        """
+        einstein_radius = self.einstein_radius
+        centre = self.centre
+
+        if einstein_radius is None or centre is None:
+
+            instance = model.instance_from_prior_medians()
+
+            mass_profiles = [
+                mass_profile
+                for name, galaxy in model.galaxies.items()
+                if not any(
+                    prior in grid_priors for prior in getattr(galaxy, "priors", [])
+                )
+                for mass_profile in getattr(instance.galaxies, name).mass_profiles
+                if hasattr(mass_profile, "einstein_radius")
+            ]
+
+            if len(mass_profiles) > 0:
+
+                lens_mass = max(
+                    mass_profiles, key=lambda mass_profile: mass_profile.einstein_radius
+                )
+
+                if einstein_radius is None:
+                    einstein_radius = lens_mass.einstein_radius
+
+                if centre is None:
+                    centre = lens_mass.centre
+
+        if einstein_radius is None:
+            einstein_radius = 0.0
+
+        if centre is None:
+            centre = (0.0, 0.0)
+
+        return einstein_radius, centre
+
+    def cell_order_from(self, physical_lists, grid_priors, model) -> [int]:
+        """
+        The indexes of the cells of the grid, ordered by the distance of every cell centre from the Einstein ring.
+
+        The cells are ordered using the two priors of the grid search which are paired as the (y,x) centre of a
+        profile. If the grid search is not over a centre, the cells are in the order of the grid.
+        """
+        centre_priors = [
+            prior
+            for prior in grid_priors
+            if model.name_for_prior(prior).endswith(("centre_0", "centre_1"))
+        ]
+
+        if len(centre_priors) != 2:
+            return list(range(len(physical_lists)))
+
+        centre_priors = sorted(centre_priors, key=model.name_for_prior)
+
+        einstein_radius, centre = self.einstein_ring_from_model(
+            model=model, grid_priors=grid_priors
+        )
+
+        half_steps = [
+            0.5 * self.hyper_step_size * prior.width for prior in centre_priors
+        ]
+
+        distances = []
+
+        for values in physical_lists:
+
+            cell_centre = [
+                values[grid_priors.index(prior)] + half_step
+                for prior, half_step in zip(centre_priors, half_steps)
+            ]
+
+            radius = np.sqrt(
+                (cell_centre[0] - centre[0]) ** 2 + (cell_centre[1] - centre[1]) ** 2
+            )
+
+            distances.append(abs(radius - einstein_radius))
+
+        return [int(index) for index in np.argsort(distances, kind="stable")]
+
+    def fit(self, model, analysis, grid_priors):
+        """
+        Fit every cell of the grid that is not completed in a pool of processes, in order of their distance from the
+        Einstein ring, and load the results of the cells completed by a previous run of the grid search.
+
+        Parameters
+        ----------
+        analysis : autofit.non_linear.non_linear.Analysis
+            An analysis used to determine the fitness of a given model instance
+        grid_priors : [p.Prior]
+            A list of priors to be substituted for uniform priors across the grid.
+
+        Returns
+        -------
+        result: GridSearchResult
+            The results of every cell, in the order of the grid.
+        """
+        grid_priors = list(sorted(set(grid_priors), key=lambda prior: prior.id))
+        lists = self.make_lists(grid_priors)
+        physical_lists = self.make_physical_lists(grid_priors)
+
+        jobs = [
+            self.job_for_analysis_grid_priors_and_values(
+                analysis=None,
+                model=model,
+                grid_priors=grid_priors,
+                values=values,
+                index=index,
+            )
+            for index, values in enumerate(lists)
+        ]
+
+        completed_cells = self.completed_cells()
+
+        results = [None] * len(jobs)
+
+        for index in completed_cells:
+            results[index] = self.result_from_completed_job(job=jobs[index])
+
+        pending_jobs = [
+            jobs[index]
+            for index in self.cell_order_from(
+                physical_lists=physical_lists, grid_priors=grid_priors, model=model
+            )
+            if index not in completed_cells
+        ]
+
+        results_header = [
+            ["index"]
+            + list(map(model.name_for_prior, grid_priors))
+            + ["max_log_likelihood"]
+        ]
+
+        for index, job_result in self.job_results_from(
+            jobs=pending_jobs, analysis=analysis
+        ):
+
+            results[index] = job_result.result
+            completed_cells[index] = job_result.result_list_row
+
+            self.record_completed_cells(completed_cells=completed_cells)
+            self.write_results(
+                results_header
+                + [completed_cells[index] for index in sorted(completed_cells)]
+            )
+
+        return af.GridSearchResult(results, lists, physical_lists)
+
+    @staticmethod
+    def result_from_completed_job(job):
+        """
+        Load the result of a cell completed by a previous run of the grid search from the samples its
+        `NonLinearSearch` output, without calling the search or analysis.
+        """
+        search = job.search_instance
+
+        search.paths.restore()
+        samples = search.samples_via_csv_json_from_model(model=job.model)
+        search.paths.zip_remove()
+
+        return af.Result(samples=samples, previous_model=job.model, search=search)
+
+    def job_results_from(self, jobs, analysis):
+        """
+        Perform every job, yielding the index and result of every job as it completes.
+
+        The pool is made inside this function, as opposed to being an attribute of the grid search, so that the grid
+        search can still be pickled.
+
+        The processes of the pool are daemonic and cannot create processes of their own, thus the `NonLinearSearch` of
+        every cell must use 1 core if the cells are fitted in parallel.
+        """
+        number_of_cores = min(self.number_of_cores, len(jobs))
+
+        if number_of_cores <= 1:
+
+            for job in jobs:
+                job.analysis = analysis
+                yield job.index, job.perform()
+
+            return
+
+        for job in jobs:
+            if getattr(job.search_instance, "number_of_cores", 1) > 1:
+                raise exc.PhaseException(
+                    f"The NonLinearSearch of a GridSearchSubhalo fitted over {number_of_cores} cores uses "
+                    f"{job.search_instance.number_of_cores} cores, however the cells are fitted in daemonic "
+                    f"processes which cannot create processes of their own. Use number_of_cores=1 for the "
+                    f"NonLinearSearch, or number_of_cores=1 for the GridSearchSubhalo."
+                )
+
+        with mp.Pool(
+            processes=number_of_cores,
+            initializer=init_grid_search_process,
+            initargs=(analysis,),
+        ) as pool:
+
+            yield from pool.imap_unordered(perform_job_in_grid_search_process, jobs)
+
+
+grid_search_process_analysis = {}
+
+
+def init_grid_search_process(analysis):
+    """
+    Store the analysis in a process of the pool, such that it is passed to the process once as opposed to with every
+    cell of the grid.
+    """
+    grid_search_process_analysis.update(analysis=analysis)
+
+
+def perform_job_in_grid_search_process(job):
+    job.analysis = grid_search_process_analysis["analysis"]
+    return job.index, job.perform()
+
+
+def as_grid_search_subhalo(
+    phase_class, number_of_cores=None, einstein_radius=None, centre=None
+):
+    """
+    Returns a grid search phase class from a regular phase class, whose cells are fitted by a `GridSearchSubhalo`.
+
+    Parameters
+    ----------
+    phase_class
+        The original phase class
+    number_of_cores : int or None
+        The number of processes the cells are fitted in. If None, the number of cpus of the machine is used.
+    """
+
+    grid_search_phase_class = af.as_grid_search(phase_class=phase_class, parallel=True)
+
+    class GridSearchSubhaloExtension(grid_search_phase_class):
+        def __init__(self, *, search, number_of_steps=4, **kwargs):
+
+            super().__init__(search=search, number_of_steps=number_of_steps, **kwargs)
+
+            self.search = GridSearchSubhalo(
+                paths=self.paths,
+                search=search,
+                number_of_steps=number_of_steps,
+                number_of_cores=number_of_cores,
+                einstein_radius=einstein_radius,
+                centre=centre,
+            )
+
+    return GridSearchSubhaloExtension
@@ -5,12 +5,16 @@ from autoarray.exc import PixelizationException, InversionException, GridExcepti
 from autofit.exc import FitException
 from autogalaxy.pipeline.phase.dataset import analysis as ag_analysis
 from autolens.fit import fit
+from autolens.lens import ray_tracing
 from autolens.pipeline import visualizer
 from autolens.pipeline.phase.dataset import analysis as analysis_dataset
 from autogalaxy.pipeline.phase.imaging.analysis import Attributes as AgAttributes
 
 import numpy as np
 import copy
+import multiprocessing as mp
+import weakref
+from os import path
 
 
 class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
@@ -27,6 +31,19 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             masked_dataset=masked_imaging
         )
 
+        self.likelihood_stages = analysis_dataset.LikelihoodStages()
+
+        self.stochastic_pool = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["stochastic_pool"] = None
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("stochastic_pool", None)
+        self.__dict__.update(state)
+
     @property
     def masked_imaging(self):
         return self.masked_dataset
@@ -46,12 +63,12 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             A fractional value indicating how well this model fit and the model masked_imaging itself
         """
 
-        self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
 
-        self.settings.settings_lens.check_positions_trace_within_threshold_via_tracer(
-            tracer=tracer, positions=self.masked_dataset.positions
-        )
+        with self.likelihood_stages.stage("positions"):
+            self.settings.settings_lens.check_positions_trace_within_threshold_via_tracer(
+                tracer=tracer, positions=self.masked_dataset.positions
+            )
 
         hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
 
@@ -59,45 +76,35 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             instance=instance
         )
 
-        if self.settings.settings_lens.stochastic_likelihood_resamples is None:
-
-            try:
-                return self.masked_imaging_fit_for_tracer(
-                    tracer=tracer,
-                    hyper_image_sky=hyper_image_sky,
-                    hyper_background_noise=hyper_background_noise,
-                ).figure_of_merit
-            except (
-                PixelizationException,
-                InversionException,
-                GridException,
-                OverflowError,
-            ) as e:
-                raise FitException from e
+        self.check_log_likelihood_upper_bound_via_tracer(
+            tracer=tracer, hyper_background_noise=hyper_background_noise
+        )
 
-        else:
+        if self.settings.settings_lens.pixelization_minimum_coverage is not None:
 
-            figures_of_merit = []
+            with self.likelihood_stages.stage("pixelization_coverage"):
 
-            for i in range(self.settings.settings_lens.stochastic_likelihood_resamples):
+                try:
+                    self.settings.settings_lens.check_pixelization_coverage_via_tracer(
+                        grid=self.masked_dataset.grid_inversion,
+                        tracer=tracer,
+                        settings_pixelization=self.settings.settings_pixelization,
+                    )
+                except (PixelizationException, GridException, OverflowError) as e:
+                    raise FitException from e
 
-                settings_pixelization = copy.deepcopy(
-                    self.settings.settings_pixelization
-                )
+        if self.settings.settings_lens.stochastic_likelihood_resamples is None:
 
-                settings_pixelization.kmeans_seed = i
-                #       settings_pixelization.is_stochastic = True
+            with self.likelihood_stages.stage("fit"):
 
                 try:
-                    figures_of_merit.append(
-                        fit.FitImaging(
-                            masked_imaging=self.masked_dataset,
-                            tracer=tracer,
-                            hyper_image_sky=hyper_image_sky,
-                            hyper_background_noise=hyper_background_noise,
-                            settings_pixelization=settings_pixelization,
-                            settings_inversion=self.settings.settings_inversion,
-                        ).log_evidence
+                    return fit.figure_of_merit_imaging_from(
+                        masked_imaging=self.masked_dataset,
+                        tracer=tracer,
+                        hyper_image_sky=hyper_image_sky,
+                        hyper_background_noise=hyper_background_noise,
+                        settings_pixelization=self.settings.settings_pixelization,
+                        settings_inversion=self.settings.settings_inversion,
                     )
                 except (
                     PixelizationException,
@@ -107,8 +114,164 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
                 ) as e:
                     raise FitException from e
 
+        else:
+
+            settings_pixelizations = []
+
+            for i in range(self.settings.settings_lens.stochastic_likelihood_resamples):
+
+                settings_pixelization = copy.deepcopy(
+                    self.settings.settings_pixelization
+                )
+
+                settings_pixelization.kmeans_seed = i
+                #       settings_pixelization.is_stochastic = True
+
+                settings_pixelizations.append(settings_pixelization)
+
+            with self.likelihood_stages.stage("fit"):
+
+                figures_of_merit = self.log_evidences_for_tracer_and_settings_pixelizations(
+                    tracer=tracer,
+                    hyper_image_sky=hyper_image_sky,
+                    hyper_background_noise=hyper_background_noise,
+                    settings_pixelizations=settings_pixelizations,
+                )
+
+                if None in figures_of_merit:
+                    raise FitException
+
             return np.mean(figures_of_merit)
 
+    def log_likelihood_function_batch(self, instances):
+        """
+        Determine the log likelihoods of a batch of model instances, for example the live points or walkers proposed
+        by a non-linear search, which is equivalent to calling *log_likelihood_function* on every instance.
+
+        Instances whose tracer is purely parametric (no pixelization, hyper-galaxies, hyper-data or stochastic
+        resamples) have their images blurred and fitted together, such that the PSF convolution and chi-squared
+        are performed in one stacked pass over the batch. All other instances are fitted individually.
+
+        Instances which raise a *FitException* (e.g. their positions do not trace within the threshold) are given a
+        log likelihood of -np.inf, which is the value a non-linear search assigns to a failed fit. If the stacked pass
+        raises an exception (e.g. one instance's ray-tracing overflows), the batchable instances are fitted one by one,
+        such that only the instances which fail are given a log likelihood of -np.inf.
+
+        Parameters
+        ----------
+        instances : [af.ModelInstance]
+            The model instances which are fitted.
+
+        Returns
+        -------
+        np.ndarray
+            The log likelihood of every instance.
+        """
+        log_likelihoods = np.full(shape=len(instances), fill_value=-np.inf)
+
+        batch_indexes = []
+        batch_tracers = []
+
+        for index, instance in enumerate(instances):
+
+            try:
+
+                tracer = self.tracer_for_instance(instance=instance)
+
+                if not self.tracer_and_instance_are_batchable(
+                    tracer=tracer, instance=instance
+                ):
+                    log_likelihoods[index] = self.log_likelihood_function(
+                        instance=instance
+                    )
+                    continue
+
+                with self.likelihood_stages.stage("positions"):
+                    self.settings.settings_lens.check_positions_trace_within_threshold_via_tracer(
+                        tracer=tracer, positions=self.masked_dataset.positions
+                    )
+
+                self.check_log_likelihood_upper_bound_via_tracer(
+                    tracer=tracer, hyper_background_noise=None
+                )
+
+            except FitException:
+                continue
+
+            batch_indexes.append(index)
+            batch_tracers.append(tracer)
+
+        if len(batch_tracers) == 0:
+            return log_likelihoods
+
+        try:
+            log_likelihoods[batch_indexes] = self.log_likelihoods_of_batchable_tracers(
+                tracers=batch_tracers
+            )
+        except (GridException, OverflowError):
+
+            for index, tracer in zip(batch_indexes, batch_tracers):
+
+                try:
+                    log_likelihoods[index] = self.log_likelihoods_of_batchable_tracers(
+                        tracers=[tracer]
+                    )[0]
+                except (GridException, OverflowError):
+                    log_likelihoods[index] = -np.inf
+
+        return log_likelihoods
+
+    def check_log_likelihood_upper_bound_via_tracer(
+        self, tracer, hyper_background_noise
+    ):
+        """
+        Reject a model whose log likelihood cannot exceed the `log_likelihood_threshold` of the `SettingsLens`, using
+        an upper bound on its log likelihood which is computed from its (hyper) noise-map before the fit (see
+        `fit.log_likelihood_upper_bound_imaging_from`).
+        """
+        if self.settings.settings_lens.log_likelihood_threshold is None:
+            return
+
+        with self.likelihood_stages.stage("upper_bound"):
+            self.settings.settings_lens.check_log_likelihood_upper_bound(
+                log_likelihood_upper_bound=fit.log_likelihood_upper_bound_imaging_from(
+                    masked_imaging=self.masked_dataset,
+                    tracer=tracer,
+                    hyper_background_noise=hyper_background_noise,
+                )
+            )
+
+    def log_likelihoods_of_batchable_tracers(self, tracers):
+        """
+        Fit the masked imaging with the stacked blurred images of a list of purely parametric tracers, returning the
+        log likelihood of every tracer.
+        """
+        model_images = ray_tracing.blurred_images_of_tracers_from_grid_and_convolver(
+            tracers=tracers,
+            grid=self.masked_dataset.grid,
+            convolver=self.masked_dataset.convolver,
+            blurring_grid=self.masked_dataset.blurring_grid,
+        )
+
+        return fit.log_likelihoods_from_image_noise_map_and_model_images(
+            image=self.masked_dataset.image,
+            noise_map=self.masked_dataset.noise_map,
+            model_images=model_images,
+        )
+
+    def tracer_and_instance_are_batchable(self, tracer, instance):
+        """
+        Whether an instance can be fitted by the stacked pass of *log_likelihood_function_batch*, which requires
+        that the fit uses neither an inversion, hyper-galaxies, hyper-data nor stochastic likelihood resamples.
+        """
+        return (
+            not tracer.has_pixelization
+            and not tracer.has_hyper_galaxy
+            and self.hyper_image_sky_for_instance(instance=instance) is None
+            and self.hyper_background_noise_for_instance(instance=instance) is None
+            and self.settings.settings_lens.stochastic_likelihood_resamples is None
+        )
+
     def masked_imaging_fit_for_tracer(
         self, tracer, hyper_image_sky, hyper_background_noise, use_hyper_scalings=True
     ):
@@ -142,40 +305,107 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             instance=instance
         )
 
-        settings_pixelization = (
-            self.settings.settings_pixelization.settings_with_is_stochastic_true()
+        settings_pixelizations = []
+
+        for i in range(self.settings.settings_lens.stochastic_samples):
+
+            settings_pixelization = copy.deepcopy(self.settings.settings_pixelization)
+
+            # The seeds are drawn here, as opposed to setting is_stochastic=True, so that processes forked with the
+            # same random state do not draw the same seeds. Preloaded sparse grids are removed, as they would otherwise
+            # be used by every fit in place of the sparse grid of its seed.
+
+            settings_pixelization.is_stochastic = False
+            settings_pixelization.kmeans_seed = np.random.randint(low=1, high=2 ** 31)
+            settings_pixelization.preload_sparse_grids_of_planes = None
+
+            settings_pixelizations.append(settings_pixelization)
+
+        log_evidences = self.log_evidences_for_tracer_and_settings_pixelizations(
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+            settings_pixelizations=settings_pixelizations,
         )
 
-        log_evidences = []
+        log_evidences = [
+            log_evidence for log_evidence in log_evidences if log_evidence is not None
+        ]
 
-        for i in range(self.settings.settings_lens.stochastic_samples):
+        return log_evidences
 
-            try:
-                log_evidence = fit.FitImaging(
+    def log_evidences_for_tracer_and_settings_pixelizations(
+        self, tracer, hyper_image_sky, hyper_background_noise, settings_pixelizations
+    ):
+        """
+        Fit the masked imaging with a tracer once for every input *SettingsPixelization*, returning the log evidence of
+        every fit (or None if the fit raised an exception). This is used for the stochastic likelihood resamples and
+        stochastic log evidences, where every fit uses a different KMeans seed for the pixelization.
+
+        These fits are independent of one another, thus if the *SettingsLens* stochastic_number_of_cores is above 1 they
+        are performed in the pool of processes of the analysis (see `stochastic_pool_from`), such that only the tracer,
+        hyper data and *SettingsPixelization* of every fit are sent to the processes.
+
+        Processes of a pool are daemonic and cannot create a pool of their own, therefore if the analysis is used in
+        one (e.g. by a `NonLinearSearch` fitting in parallel) the fits are performed in the current process.
+
+        Parameters
+        ----------
+        settings_pixelizations : [SettingsPixelization]
+            The pixelization settings of every fit.
+        """
+        number_of_cores = self.settings.settings_lens.stochastic_number_of_cores
+
+        if number_of_cores == 1 or mp.current_process().daemon:
+
+            return [
+                log_evidence_from(
                     masked_imaging=self.masked_dataset,
                     tracer=tracer,
                     hyper_image_sky=hyper_image_sky,
                     hyper_background_noise=hyper_background_noise,
                     settings_pixelization=settings_pixelization,
                     settings_inversion=self.settings.settings_inversion,
-                ).log_evidence
-            except (
-                PixelizationException,
-                InversionException,
-                GridException,
-                OverflowError,
-            ) as e:
-                log_evidence = None
-
-            if log_evidence is not None:
-                log_evidences.append(log_evidence)
+                )
+                for settings_pixelization in settings_pixelizations
+            ]
+
+        return self.stochastic_pool_from(number_of_cores=number_of_cores).starmap(
+            log_evidence_in_stochastic_process,
+            [
+                (tracer, hyper_image_sky, hyper_background_noise, settings_pixelization)
+                for settings_pixelization in settings_pixelizations
+            ],
+        )
 
-        return log_evidences
+    def stochastic_pool_from(self, number_of_cores):
+        """
+        The pool of processes the stochastic fits are performed in, which is created the first time it is used and
+        reused by every later fit. The masked imaging is passed to every process once when the pool is created.
+
+        The pool is not pickled with the analysis and its processes are terminated when the analysis is garbage
+        collected.
+        """
+        if self.stochastic_pool is None:
+
+            self.stochastic_pool = mp.Pool(
+                processes=number_of_cores,
+                initializer=init_stochastic_process,
+                initargs=(self.masked_dataset, self.settings.settings_inversion),
+            )
+
+            weakref.finalize(self, self.stochastic_pool.terminate)
+
+        return self.stochastic_pool
 
     def visualize(self, paths: af.Paths, instance, during_analysis):
 
         self.visualizer.visualize_imaging(paths=paths)
 
+        self.likelihood_stages.output_to_json(
+            file_path=path.join(paths.output_path, "likelihood_stages.json")
+        )
+
         instance = self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
         hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
@@ -273,3 +503,58 @@ class Attributes(AgAttributes):
         )
 
         self.positions = positions
+
+
+def log_evidence_from(
+    masked_imaging,
+    tracer,
+    hyper_image_sky,
+    hyper_background_noise,
+    settings_pixelization,
+    settings_inversion,
+):
+    """
+    The log evidence of a fit to masked imaging, or None if the fit raises an exception (e.g. due to an ill-posed
+    inversion).
+    """
+    try:
+        return fit.figure_of_merit_imaging_from(
+            masked_imaging=masked_imaging,
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+            settings_pixelization=settings_pixelization,
+            settings_inversion=settings_inversion,
+        )
+    except (
+        PixelizationException,
+        InversionException,
+        GridException,
+        OverflowError,
+    ):
+        return None
+
+
+stochastic_process_fit_kwargs = {}
+
+
+def init_stochastic_process(masked_imaging, settings_inversion):
+    """
+    Store the inputs shared by every stochastic fit in a process of the pool, such that they are passed to the process
+    once as opposed to with every fit.
+    """
+    stochastic_process_fit_kwargs.update(
+        masked_imaging=masked_imaging, settings_inversion=settings_inversion
+    )
+
+
+def log_evidence_in_stochastic_process(
+    tracer, hyper_image_sky, hyper_background_noise, settings_pixelization
+):
+    return log_evidence_from(
+        tracer=tracer,
+        hyper_image_sky=hyper_image_sky,
+        hyper_background_noise=hyper_background_noise,
+        settings_pixelization=settings_pixelization,
+        **stochastic_process_fit_kwargs,
+    )
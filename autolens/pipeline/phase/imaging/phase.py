@@ -82,6 +82,9 @@ class PhaseImaging(dataset.PhaseDataset):
             imaging=dataset, mask=mask, settings=self.settings.settings_masked_imaging
         )
 
+        if self.settings.memmap_path is not None:
+            masked_imaging.memmap_arrays(directory=self.settings.memmap_path)
+
         self.output_phase_info()
 
         analysis = self.Analysis(
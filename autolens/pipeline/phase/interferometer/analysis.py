@@ -10,6 +10,8 @@ from autolens.fit import fit
 from autolens.pipeline import visualizer
 from autolens.pipeline.phase.dataset import analysis as analysis_dataset
 
+from os import path
+
 
 class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
     def __init__(self, masked_interferometer, settings, cosmology, results=None):
@@ -25,6 +27,8 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             masked_dataset=masked_interferometer
         )
 
+        self.likelihood_stages = analysis_dataset.LikelihoodStages()
+
         result = ag_analysis.last_result_with_use_as_hyper_dataset(results=results)
 
         if result is not None:
@@ -59,29 +63,71 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             A fractional value indicating how well this model fit and the model masked_interferometer itself
         """
 
-        self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
 
-        self.settings.settings_lens.check_positions_trace_within_threshold_via_tracer(
-            tracer=tracer, positions=self.masked_dataset.positions
-        )
+        with self.likelihood_stages.stage("positions"):
+            self.settings.settings_lens.check_positions_trace_within_threshold_via_tracer(
+                tracer=tracer, positions=self.masked_dataset.positions
+            )
 
         hyper_background_noise = self.hyper_background_noise_for_instance(
             instance=instance
         )
 
-        try:
-            fit = self.masked_interferometer_fit_for_tracer(
-                tracer=tracer, hyper_background_noise=hyper_background_noise
-            )
-            return fit.figure_of_merit
-        except (
-            PixelizationException,
-            InversionException,
-            GridException,
-            OverflowError,
-        ) as e:
-            raise FitException from e
+        if self.settings.settings_lens.log_likelihood_threshold is not None:
+
+            with self.likelihood_stages.stage("upper_bound"):
+                self.settings.settings_lens.check_log_likelihood_upper_bound(
+                    log_likelihood_upper_bound=fit.log_likelihood_upper_bound_interferometer_from(
+                        masked_interferometer=self.masked_dataset,
+                        hyper_background_noise=hyper_background_noise,
+                    )
+                )
+
+        if self.settings.settings_lens.pixelization_minimum_coverage is not None:
+
+            with self.likelihood_stages.stage("pixelization_coverage"):
+
+                try:
+                    self.settings.settings_lens.check_pixelization_coverage_via_tracer(
+                        grid=self.masked_dataset.grid_inversion,
+                        tracer=tracer,
+                        settings_pixelization=self.settings.settings_pixelization,
+                    )
+                except (PixelizationException, GridException, OverflowError) as e:
+                    raise FitException from e
+
+        # The dirty image is computed once for the noise-map of the dataset, thus a model whose hyper background
+        # noise changes the noise-map is fitted to the visibilities.
+
+        use_dirty_image = (
+            self.settings.use_dirty_image
+            and not tracer.has_pixelization
+            and hyper_background_noise is None
+        )
+
+        with self.likelihood_stages.stage("fit"):
+
+            try:
+                if use_dirty_image:
+                    return fit.FitInterferometerDirtyImage(
+                        masked_interferometer=self.masked_dataset, tracer=tracer
+                    ).figure_of_merit
+
+                return fit.figure_of_merit_interferometer_from(
+                    masked_interferometer=self.masked_dataset,
+                    tracer=tracer,
+                    hyper_background_noise=hyper_background_noise,
+                    settings_pixelization=self.settings.settings_pixelization,
+                    settings_inversion=self.settings.settings_inversion,
+                )
+            except (
+                PixelizationException,
+                InversionException,
+                GridException,
+                OverflowError,
+            ) as e:
+                raise FitException from e
 
     def associate_hyper_visibilities(
         self, instance: af.ModelInstance
@@ -160,13 +206,13 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
         for i in range(self.settings.settings_lens.stochastic_samples):
 
             try:
-                log_evidence = fit.FitInterferometer(
+                log_evidence = fit.figure_of_merit_interferometer_from(
                     masked_interferometer=self.masked_dataset,
                     tracer=tracer,
                     hyper_background_noise=hyper_background_noise,
                     settings_pixelization=settings_pixelization,
                     settings_inversion=self.settings.settings_inversion,
-                ).log_evidence
+                )
             except (
                 PixelizationException,
                 InversionException,
@@ -184,6 +230,10 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
         self.visualizer.visualize_interferometer(paths=paths)
 
+        self.likelihood_stages.output_to_json(
+            file_path=path.join(paths.output_path, "likelihood_stages.json")
+        )
+
         self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
 
@@ -1,6 +1,7 @@
 from os import path
 import autofit as af
 from astropy import cosmology as cosmo
+from autolens import exc
 from autolens.dataset import interferometer
 from autolens.pipeline.phase import dataset
 from autoarray.inversion import pixelizations as pix
@@ -86,6 +87,28 @@ class PhaseInterferometer(dataset.PhaseDataset):
             settings=self.settings.settings_masked_interferometer,
         )
 
+        if self.settings.visibilities_chunk_size is not None:
+
+            if self.has_pixelization and not self.settings.use_w_tilde:
+                raise exc.PhaseException(
+                    "A PhaseInterferometer whose visibilities are chunked (visibilities_chunk_size is not None) "
+                    "fits a model with a pixelization via the w-tilde of the dataset, however use_w_tilde is False. "
+                    "Set use_w_tilde=True in the SettingsPhaseInterferometer."
+                )
+
+            masked_interferometer.chunk_visibilities(
+                chunk_size=self.settings.visibilities_chunk_size
+            )
+
+        if self.settings.use_w_tilde:
+            masked_interferometer.preload_w_tilde(directory=self.settings.w_tilde_path)
+
+        if self.settings.use_dirty_image:
+            masked_interferometer.preload_dirty_image()
+
+        if self.settings.memmap_path is not None:
+            masked_interferometer.memmap_arrays(directory=self.settings.memmap_path)
+
         self.output_phase_info()
 
         return self.Analysis(
@@ -6,17 +6,37 @@ from autolens.pipeline.phase import dataset
 
 
 class Result(dataset.Result):
+
+    _max_log_likelihood_fit = None
+    _visibilities_galaxy_dict = None
+    _image_galaxy_dict = None
+
+    def clear_cache(self):
+
+        super().clear_cache()
+
+        self._max_log_likelihood_fit = None
+        self._visibilities_galaxy_dict = None
+        self._image_galaxy_dict = None
+
     @property
     def max_log_likelihood_fit(self):
+        """
+        The fit of the maximum log likelihood tracer, which is computed once and cached (see `clear_cache`), such
+        that its inversion is not performed again every time the result is used.
+        """
+        if self._max_log_likelihood_fit is None:
 
-        hyper_background_noise = self.analysis.hyper_background_noise_for_instance(
-            instance=self.instance
-        )
+            hyper_background_noise = self.analysis.hyper_background_noise_for_instance(
+                instance=self.instance
+            )
 
-        return self.analysis.masked_interferometer_fit_for_tracer(
-            tracer=self.max_log_likelihood_tracer,
-            hyper_background_noise=hyper_background_noise,
-        )
+            self._max_log_likelihood_fit = self.analysis.masked_interferometer_fit_for_tracer(
+                tracer=self.max_log_likelihood_tracer,
+                hyper_background_noise=hyper_background_noise,
+            )
+
+        return self._max_log_likelihood_fit
 
     @property
     def real_space_mask(self):
@@ -54,10 +74,18 @@ class Result(dataset.Result):
         """
         A dictionary associating galaxy names with model visibilities of those galaxies
         """
-        return {
-            galaxy_path: self.visibilities_for_galaxy(galaxy)
-            for galaxy_path, galaxy in self.path_galaxy_tuples
-        }
+        if self._visibilities_galaxy_dict is None:
+
+            galaxy_model_visibilities_dict = (
+                self.max_log_likelihood_fit.galaxy_model_visibilities_dict
+            )
+
+            self._visibilities_galaxy_dict = {
+                galaxy_path: galaxy_model_visibilities_dict[galaxy]
+                for galaxy_path, galaxy in self.path_galaxy_tuples
+            }
+
+        return self._visibilities_galaxy_dict
 
     @property
     def hyper_galaxy_visibilities_path_dict(self):
@@ -106,10 +134,16 @@ class Result(dataset.Result):
         """
         A dictionary associating galaxy names with model images of those galaxies
         """
-        return {
-            galaxy_path: self.image_for_galaxy(galaxy)
-            for galaxy_path, galaxy in self.path_galaxy_tuples
-        }
+        if self._image_galaxy_dict is None:
+
+            galaxy_model_image_dict = self.max_log_likelihood_fit.galaxy_model_image_dict
+
+            self._image_galaxy_dict = {
+                galaxy_path: galaxy_model_image_dict[galaxy]
+                for galaxy_path, galaxy in self.path_galaxy_tuples
+            }
+
+        return self._image_galaxy_dict
 
     @property
     def hyper_galaxy_image_path_dict(self):
@@ -125,7 +159,7 @@ class Result(dataset.Result):
 
         for path, galaxy in self.path_galaxy_tuples:
 
-            galaxy_image = self.image_galaxy_dict[path]
+            galaxy_image = self.image_galaxy_dict[path].copy()
 
             if not np.all(galaxy_image == 0):
                 minimum_galaxy_value = hyper_minimum_percent * max(galaxy_image)
@@ -13,7 +13,19 @@ class SettingsPhaseImaging(settings.SettingsPhaseImaging):
         settings_inversion=inv.SettingsInversion(),
         settings_lens=SettingsLens(),
         log_likelihood_cap=None,
+        memmap_path=None,
     ):
+        """
+        The settings of a phase, which customize how a model is fitted to data in a PyAutoLens `Phase`.
+
+        Parameters
+        ----------
+        memmap_path : str or None
+            If not None, the arrays of the masked imaging are stored in memory-mapped files in this directory when the
+            analysis is pickled, such that the processes of a parallel `NonLinearSearch` share them as opposed to
+            each holding a copy. The files are deleted when the masked dataset is garbage collected or the
+            interpreter exits (see `MemmapArraysMixin`).
+        """
 
         super().__init__(
             settings_masked_imaging=settings_masked_imaging,
@@ -23,6 +35,7 @@ class SettingsPhaseImaging(settings.SettingsPhaseImaging):
         )
 
         self.settings_lens = settings_lens
+        self.memmap_path = memmap_path
 
     @property
     def phase_tag_no_inversion(self):
@@ -54,7 +67,38 @@ class SettingsPhaseInterferometer(settings.SettingsPhaseInterferometer):
         settings_inversion=inv.SettingsInversion(),
         settings_lens=SettingsLens(),
         log_likelihood_cap=None,
+        memmap_path=None,
+        use_w_tilde=False,
+        w_tilde_path=None,
+        visibilities_chunk_size=None,
+        use_dirty_image=False,
     ):
+        """
+        The settings of a phase, which customize how a model is fitted to data in a PyAutoLens `Phase`.
+
+        Parameters
+        ----------
+        memmap_path : str or None
+            If not None, the arrays of the masked interferometer are stored in memory-mapped files in this directory when the
+            analysis is pickled, such that the processes of a parallel `NonLinearSearch` share them as opposed to
+            each holding a copy. The files are deleted when the masked dataset is garbage collected or the
+            interpreter exits (see `MemmapArraysMixin`).
+        use_w_tilde : bool
+            If `True`, the w-tilde of the masked interferometer is precomputed, such that the log likelihood of a model
+            with a pixelization is computed without touching the visibilities (see `WTildeInterferometer`).
+        w_tilde_path : str or None
+            If not None, the w-tilde is cached in this directory, such that it is computed once per dataset.
+        visibilities_chunk_size : int or None
+            If not None, the log likelihood of the masked interferometer is computed for chunks of this many
+            visibilities at a time, bounding the memory used by a fit of large (e.g. memory-mapped) datasets (see
+            `MaskedInterferometer.chunk_visibilities`).
+        use_dirty_image : bool
+            If `True`, the log likelihood of a model without a pixelization is approximated by fitting the dirty image
+            of the visibilities with the model image convolved with the dirty beam (see
+            `FitInterferometerDirtyImage`), which is intended for fast parametric phases that precede phases fitting
+            the visibilities exactly. Models with a hyper background noise are fitted to the visibilities, as the
+            dirty image is computed for the noise-map of the dataset.
+        """
 
         super().__init__(
             settings_masked_interferometer=settings_masked_interferometer,
@@ -64,6 +108,50 @@ class SettingsPhaseInterferometer(settings.SettingsPhaseInterferometer):
         )
 
         self.settings_lens = settings_lens
+        self.memmap_path = memmap_path
+        self.use_w_tilde = use_w_tilde
+        self.w_tilde_path = w_tilde_path
+        self.visibilities_chunk_size = visibilities_chunk_size
+        self.use_dirty_image = use_dirty_image
+
+    @property
+    def w_tilde_tag(self):
+        """Generate a tag if the log likelihood of a model with a pixelization is computed via the w-tilde.
+
+        This changes the phase settings folder as follows:
+
+        use_w_tilde = False -> settings
+        use_w_tilde = True -> settings__w_tilde
+        """
+        if not self.use_w_tilde:
+            return ""
+        return f"__{conf.instance['notation']['settings_tags']['phase']['use_w_tilde']}"
+
+    @property
+    def visibilities_chunk_size_tag(self):
+        """Generate a tag if the log likelihood of the phase is computed for chunks of the visibilities.
+
+        This changes the phase settings folder as follows:
+
+        visibilities_chunk_size = None -> settings
+        visibilities_chunk_size = 1000 -> settings__chunked
+        """
+        if self.visibilities_chunk_size is None:
+            return ""
+        return f"__{conf.instance['notation']['settings_tags']['phase']['visibilities_chunk_size']}"
+
+    @property
+    def dirty_image_tag(self):
+        """Generate a tag if the log likelihood of the phase is approximated via the dirty image.
+
+        This changes the phase settings folder as follows:
+
+        use_dirty_image = False -> settings
+        use_dirty_image = True -> settings__dirty
+        """
+        if not self.use_dirty_image:
+            return ""
+        return f"__{conf.instance['notation']['settings_tags']['phase']['dirty_image']}"
 
     @property
     def phase_tag_no_inversion(self):
@@ -72,6 +160,8 @@ class SettingsPhaseInterferometer(settings.SettingsPhaseInterferometer):
             f"{self.settings_masked_interferometer.tag_no_inversion}__"
             f"{self.settings_lens.tag}"
             f"{self.log_likelihood_cap_tag}"
+            f"{self.visibilities_chunk_size_tag}"
+            f"{self.dirty_image_tag}"
         )
 
     @property
@@ -84,6 +174,8 @@ class SettingsPhaseInterferometer(settings.SettingsPhaseInterferometer):
             f"{self.settings_pixelization.tag}__"
             f"{self.settings_inversion.tag}"
             f"{self.log_likelihood_cap_tag}"
+            f"{self.w_tilde_tag}"
+            f"{self.visibilities_chunk_size_tag}"
         )
 
 
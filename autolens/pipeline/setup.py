@@ -9,6 +9,7 @@ from autogalaxy.profiles import (
 )
 from autogalaxy.hyper import hyper_data as hd
 from autogalaxy.galaxy import galaxy as g
+from autolens.pipeline.phase.extensions import subhalo_grid_search
 
 from typing import Union, Optional
 
@@ -596,6 +597,7 @@ class SetupSubhalo(setup.AbstractSetup):
         grid_size: int = 5,
         grid_dimension_arcsec: float = 3.0,
         parallel: bool = False,
+        number_of_cores: int = None,
         subhalo_instance=None,
     ):
         """
@@ -625,6 +627,9 @@ class SetupSubhalo(setup.AbstractSetup):
         parallel : bool
             If `True` the `Python` `multiprocessing` module is used to parallelize the fitting over the cpus available
             on the system.
+        number_of_cores : int
+            If `parallel` is `True`, the number of processes the cells of the subhalo grid search are fitted in (see
+            `GridSearchSubhalo`). If `None`, the number of cpus of the system is used.
         subhalo_instance : ag.MassProfile
             An instance of the mass-profile used as a fixed model for a subhalo pipeline.
         """
@@ -640,6 +645,7 @@ class SetupSubhalo(setup.AbstractSetup):
         self.grid_size = grid_size
         self.grid_dimensions_arcsec = grid_dimension_arcsec
         self.parallel = parallel
+        self.number_of_cores = number_of_cores
         self.subhalo_instance = subhalo_instance
 
     @property
@@ -657,6 +663,25 @@ class SetupSubhalo(setup.AbstractSetup):
         """
         return conf.instance["notation"]["setup_tags"]["names"]["subhalo"]
 
+    def grid_search_phase_class_from(self, phase_class):
+        """
+        Returns the grid search phase class of the subhalo pipeline from a regular phase class, whose cells are
+        fitted by a `GridSearchSubhalo` such that they are fitted in order of their distance from the Einstein ring
+        and an interrupted grid search resumes from its completed cells.
+
+        If `parallel` is `True`, the cells of the grid are fitted in `number_of_cores` processes, else they are fitted
+        one after another in the current process.
+
+        Parameters
+        ----------
+        phase_class
+            The phase class (e.g. `PhaseImaging`) the cells of the grid search are fitted with.
+        """
+        return subhalo_grid_search.as_grid_search_subhalo(
+            phase_class=phase_class,
+            number_of_cores=self.number_of_cores if self.parallel else 1,
+        )
+
     @property
     def tag(self):
         return (
@@ -54,9 +54,6 @@ for i in range(iters):
         file_path=pickle_path, filename=f"positions_{str(i)}"
     )
 
-    minimum_separations = util.minimum_separations_from(
-        positions_true=positions, positions=positions_true
-    )
     in_positions_true = util.check_if_positions_in_positions_true(
         positions_true=positions_true, positions=positions, threshold=0.1
     )
@@ -64,7 +61,6 @@ for i in range(iters):
     print()
     print(positions_true.in_grouped_list)
     print(positions.in_grouped_list)
-    print(minimum_separations)
     print(in_positions_true)
 
     positions_plot = al.GridIrregularGrouped(
@@ -0,0 +1,41 @@
+# %%
+"""
+__Remove Duplicates Timer__
+
+This script times the removal of duplicate coordinates from grids of 10^2 to 10^5 candidate multiple images, which
+the `PositionsFinder` performs after every refinement of its peak coordinates.
+
+The coordinates are paired to the cells of a spatial hash and only compared to coordinates in neighboring cells, so
+the run time should scale close to linearly with the number of coordinates. Computing the separations of every pair
+of coordinates would need 80GB of memory for 10^5 coordinates.
+"""
+
+# %%
+from autolens.lens import positions_solver as pos
+import numpy as np
+import time
+
+# %%
+"""Every grid has half its coordinates duplicated, so half of them are removed."""
+
+# %%
+repeats = 5
+
+for total_coordinates in [10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5]:
+
+    grid = np.random.uniform(low=-3.0, high=3.0, size=(total_coordinates, 2))
+    grid[total_coordinates // 2 :] = grid[: total_coordinates - total_coordinates // 2]
+
+    """Call once so that numba compilation is not timed."""
+
+    pos.grid_remove_duplicates(grid=grid)
+
+    start = time.time()
+
+    for i in range(repeats):
+        grid_no_duplicates = pos.grid_remove_duplicates(grid=grid)
+
+    print(
+        f"Coordinates = {total_coordinates}, Unique = {len(grid_no_duplicates)}, "
+        f"Time = {(time.time() - start) / repeats} s"
+    )
@@ -61,9 +61,6 @@ for i in range(40, 41):
     )
 
     if positions is not None:
-        minimum_separations = util.minimum_separations_from(
-            positions_true=positions_true, positions=positions
-        )
 
         in_positions_true = util.check_if_positions_in_positions_true(
             positions_true=positions_true, positions=positions, threshold=0.1
@@ -78,7 +75,6 @@ for i in range(40, 41):
 
     else:
 
-        minimum_separations = None
         in_positions_true = None
 
         positions_plot = al.GridIrregularGrouped(
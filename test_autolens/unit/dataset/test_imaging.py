@@ -1,5 +1,8 @@
 import autolens as al
+import gc
 import numpy as np
+import os
+import pickle
 
 
 class TestMaskedImaging:
@@ -44,6 +47,114 @@ class TestMaskedImaging:
         assert (masked_imaging_7x7.blurring_grid.in_1d == blurring_grid_7x7).all()
         assert (masked_imaging_7x7.blurring_grid == blurring_grid).all()
 
+    def test__memmap_arrays__pickled_arrays_are_memory_mapped_files(
+        self, imaging_7x7, sub_mask_7x7, tmp_path
+    ):
+
+        masked_imaging_7x7 = al.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+        masked_imaging_7x7.memmap_minimum_bytes = 0
+        masked_imaging_7x7.memmap_arrays(directory=str(tmp_path))
+
+        loaded = pickle.loads(pickle.dumps(masked_imaging_7x7))
+
+        total_files = len(os.listdir(str(tmp_path)))
+
+        assert total_files > 0
+
+        assert isinstance(loaded.image, al.Array)
+        assert isinstance(loaded.image.base, np.memmap)
+        assert (loaded.image.in_2d == masked_imaging_7x7.image.in_2d).all()
+        assert (loaded.noise_map == masked_imaging_7x7.noise_map).all()
+        assert isinstance(loaded.grid, al.Grid)
+        assert (loaded.grid == masked_imaging_7x7.grid).all()
+        assert (loaded.blurring_grid == masked_imaging_7x7.blurring_grid).all()
+        assert (
+            loaded.convolver.image_frame_1d_kernels
+            == masked_imaging_7x7.convolver.image_frame_1d_kernels
+        ).all()
+
+        pickle.loads(pickle.dumps(masked_imaging_7x7))
+        pickle.loads(pickle.dumps(loaded))
+
+        assert len(os.listdir(str(tmp_path))) == total_files
+
+    def test__memmap_arrays__array_changed_in_place__written_to_new_file(
+        self, imaging_7x7, sub_mask_7x7, tmp_path
+    ):
+
+        masked_imaging_7x7 = al.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+        masked_imaging_7x7.memmap_minimum_bytes = 0
+        masked_imaging_7x7.memmap_arrays(directory=str(tmp_path))
+
+        pickle.dumps(masked_imaging_7x7)
+
+        total_files = len(os.listdir(str(tmp_path)))
+
+        masked_imaging_7x7.image[0] = 100.0
+
+        loaded = pickle.loads(pickle.dumps(masked_imaging_7x7))
+
+        assert len(os.listdir(str(tmp_path))) == total_files + 1
+        assert loaded.image[0] == 100.0
+        assert (loaded.image == masked_imaging_7x7.image).all()
+
+    def test__memmap_arrays__files_removed_by_remove_memmap_files_and_garbage_collection(
+        self, imaging_7x7, sub_mask_7x7, tmp_path
+    ):
+
+        masked_imaging_7x7 = al.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+        masked_imaging_7x7.memmap_minimum_bytes = 0
+        masked_imaging_7x7.memmap_arrays(directory=str(tmp_path))
+
+        loaded = pickle.loads(pickle.dumps(masked_imaging_7x7))
+
+        assert len(os.listdir(str(tmp_path))) > 0
+
+        loaded.remove_memmap_files()
+
+        assert len(os.listdir(str(tmp_path))) > 0
+
+        masked_imaging_7x7.remove_memmap_files()
+
+        assert len(os.listdir(str(tmp_path))) == 0
+
+        pickle.loads(pickle.dumps(masked_imaging_7x7))
+
+        assert len(os.listdir(str(tmp_path))) > 0
+
+        del masked_imaging_7x7
+        gc.collect()
+
+        assert len(os.listdir(str(tmp_path))) == 0
+
+    def test__memmap_arrays__fit_is_unchanged(
+        self, imaging_7x7, sub_mask_7x7, tmp_path
+    ):
+
+        masked_imaging_7x7 = al.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=0.1),
+                    mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                ),
+                al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic(intensity=0.2)),
+            ]
+        )
+
+        fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        masked_imaging_7x7.memmap_minimum_bytes = 0
+        masked_imaging_7x7.memmap_arrays(directory=str(tmp_path))
+
+        loaded = pickle.loads(pickle.dumps(masked_imaging_7x7))
+
+        fit_loaded = al.FitImaging(masked_imaging=loaded, tracer=tracer)
+
+        assert fit_loaded.log_likelihood == fit.log_likelihood
+
 
 class TestSimulatorImaging:
     def test__from_tracer_and_grid__same_as_tracer_image(self):
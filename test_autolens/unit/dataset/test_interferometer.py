@@ -1,6 +1,11 @@
 import autolens as al
 import numpy as np
+import os
+from os import path
+import pickle
 import pytest
+import subprocess
+import sys
 
 
 class TestMaskedInterferometer:
@@ -123,6 +128,241 @@ class TestMaskedInterferometer:
 
         assert masked_interferometer_7.noise_map[0] == 10.0 + 0.0j
 
+    def test__memmap_arrays__pickled_arrays_are_memory_mapped_files(
+        self, interferometer_7, sub_mask_7x7, visibilities_mask_7, tmp_path
+    ):
+
+        masked_interferometer_7 = al.MaskedInterferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7,
+            real_space_mask=sub_mask_7x7,
+            settings=al.SettingsMaskedInterferometer(
+                transformer_class=al.TransformerDFT
+            ),
+        )
+        masked_interferometer_7.memmap_minimum_bytes = 0
+        masked_interferometer_7.memmap_arrays(directory=str(tmp_path))
+
+        loaded = pickle.loads(pickle.dumps(masked_interferometer_7))
+
+        assert isinstance(loaded.visibilities, al.Visibilities)
+        assert isinstance(loaded.visibilities.base, np.memmap)
+        assert (loaded.visibilities == masked_interferometer_7.visibilities).all()
+        assert (loaded.noise_map == masked_interferometer_7.noise_map).all()
+        assert (loaded.grid == masked_interferometer_7.grid).all()
+        assert (
+            loaded.transformer.uv_wavelengths
+            == masked_interferometer_7.transformer.uv_wavelengths
+        ).all()
+
+    def test__preload_w_tilde__same_as_transformed_identity_matrix__cached_to_disk(
+        self, interferometer_7, sub_mask_7x7, visibilities_mask_7, tmp_path
+    ):
+
+        masked_interferometer_7 = al.MaskedInterferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7,
+            real_space_mask=sub_mask_7x7,
+            settings=al.SettingsMaskedInterferometer(
+                transformer_class=al.TransformerDFT
+            ),
+        )
+
+        assert masked_interferometer_7.w_tilde is None
+
+        masked_interferometer_7.preload_w_tilde(directory=str(tmp_path))
+
+        w_tilde = masked_interferometer_7.w_tilde
+
+        transformer = masked_interferometer_7.transformer
+        noise_map = masked_interferometer_7.noise_map
+        visibilities = masked_interferometer_7.visibilities
+
+        transformed_identity = transformer.transformed_mapping_matrix_from_mapping_matrix(
+            mapping_matrix=np.eye(transformer.total_image_pixels)
+        )
+
+        w_matrix = np.dot(
+            transformed_identity.real.T,
+            transformed_identity.real / noise_map.real[:, None] ** 2.0,
+        ) + np.dot(
+            transformed_identity.imag.T,
+            transformed_identity.imag / noise_map.imag[:, None] ** 2.0,
+        )
+
+        dirty_image = np.dot(
+            transformed_identity.real.T, visibilities.real / noise_map.real ** 2.0
+        ) + np.dot(
+            transformed_identity.imag.T, visibilities.imag / noise_map.imag ** 2.0
+        )
+
+        assert w_tilde.w_matrix == pytest.approx(w_matrix, 1.0e-4)
+        assert w_tilde.dirty_image == pytest.approx(dirty_image, 1.0e-4)
+        assert w_tilde.data_chi_squared == pytest.approx(
+            np.sum((visibilities.real / noise_map.real) ** 2.0)
+            + np.sum((visibilities.imag / noise_map.imag) ** 2.0),
+            1.0e-8,
+        )
+
+        assert path.exists(w_tilde.file_path)
+        assert isinstance(w_tilde.w_matrix, np.memmap)
+        assert len(os.listdir(str(tmp_path))) == 2
+
+        masked_interferometer_7.preload_w_tilde(directory=str(tmp_path))
+
+        assert masked_interferometer_7.w_tilde.file_path == w_tilde.file_path
+        assert (
+            masked_interferometer_7.w_tilde.dirty_image == w_tilde.dirty_image
+        ).all()
+
+        loaded = pickle.loads(pickle.dumps(masked_interferometer_7))
+
+        assert isinstance(loaded.w_tilde.w_matrix, np.memmap)
+        assert (loaded.w_tilde.w_matrix == w_tilde.w_matrix).all()
+
+    def test__preload_dirty_image__chunked_visibilities_give_same_dirty_image_and_beam(
+        self, interferometer_7, sub_mask_7x7, visibilities_mask_7
+    ):
+
+        masked_interferometer_7 = al.MaskedInterferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7,
+            real_space_mask=sub_mask_7x7,
+            settings=al.SettingsMaskedInterferometer(
+                transformer_class=al.TransformerDFT
+            ),
+        )
+
+        assert masked_interferometer_7.dirty_image_interferometer is None
+
+        masked_interferometer_7.preload_dirty_image()
+
+        dirty_image_interferometer = masked_interferometer_7.dirty_image_interferometer
+
+        assert dirty_image_interferometer.dirty_beam.shape == (5, 5)
+        assert dirty_image_interferometer.dirty_beam[2, 2] == pytest.approx(1.0, 1.0e-8)
+        assert dirty_image_interferometer.dirty_beam == pytest.approx(
+            dirty_image_interferometer.dirty_beam[::-1, ::-1], 1.0e-8
+        )
+        assert dirty_image_interferometer.dirty_image_array.shape_2d == (7, 7)
+
+        masked_interferometer_7.chunk_visibilities(chunk_size=3)
+        masked_interferometer_7.preload_dirty_image()
+
+        assert masked_interferometer_7.dirty_image_interferometer.dirty_image == pytest.approx(
+            dirty_image_interferometer.dirty_image, 1.0e-8
+        )
+        assert masked_interferometer_7.dirty_image_interferometer.dirty_beam == pytest.approx(
+            dirty_image_interferometer.dirty_beam, 1.0e-8
+        )
+
+    def test__interferometer_via_memmap__chunked_transformer_same_as_dft(
+        self, interferometer_7, sub_mask_7x7, visibilities_mask_7, tmp_path
+    ):
+
+        np.save(path.join(tmp_path, "visibilities.npy"), interferometer_7.visibilities)
+        np.save(path.join(tmp_path, "noise_map.npy"), interferometer_7.noise_map)
+        np.save(
+            path.join(tmp_path, "uv_wavelengths.npy"), interferometer_7.uv_wavelengths
+        )
+
+        interferometer = al.interferometer_via_memmap_from(
+            visibilities_path=path.join(tmp_path, "visibilities.npy"),
+            noise_map_path=path.join(tmp_path, "noise_map.npy"),
+            uv_wavelengths_path=path.join(tmp_path, "uv_wavelengths.npy"),
+        )
+
+        assert isinstance(interferometer.visibilities.base, np.memmap)
+        assert isinstance(interferometer.noise_map, np.memmap)
+        assert isinstance(interferometer.uv_wavelengths, np.memmap)
+        assert (interferometer.visibilities == interferometer_7.visibilities).all()
+        assert (interferometer.noise_map == interferometer_7.noise_map).all()
+
+        masked_interferometer_chunked = al.MaskedInterferometer(
+            interferometer=interferometer,
+            visibilities_mask=visibilities_mask_7,
+            real_space_mask=sub_mask_7x7,
+            settings=al.SettingsMaskedInterferometer(
+                transformer_class=al.TransformerDFTChunked
+            ),
+        )
+
+        masked_interferometer_chunked.chunk_visibilities(chunk_size=3)
+
+        assert masked_interferometer_chunked.visibilities_chunk_size == 3
+        assert masked_interferometer_chunked.transformer.chunk_size == 3
+        assert isinstance(
+            masked_interferometer_chunked.transformer.uv_wavelengths, np.memmap
+        )
+
+        transformer = al.TransformerDFT(
+            uv_wavelengths=interferometer_7.uv_wavelengths, real_space_mask=sub_mask_7x7
+        )
+
+        image = al.Array.manual_mask(array=np.arange(9.0), mask=sub_mask_7x7.mask_sub_1)
+
+        assert masked_interferometer_chunked.transformer.visibilities_from_image(
+            image=image
+        ) == pytest.approx(transformer.visibilities_from_image(image=image), 1.0e-8)
+
+        mapping_matrix = np.ones(shape=(transformer.total_image_pixels, 2))
+
+        assert masked_interferometer_chunked.transformer.transformed_mapping_matrix_from_mapping_matrix(
+            mapping_matrix=mapping_matrix
+        ) == pytest.approx(
+            transformer.transformed_mapping_matrix_from_mapping_matrix(
+                mapping_matrix=mapping_matrix
+            ),
+            1.0e-8,
+        )
+
+    def test__interferometer_via_memmap__peak_resident_memory_below_size_of_dataset(
+        self, tmp_path
+    ):
+
+        resource = pytest.importorskip("resource")
+
+        total_visibilities = 2 ** 20
+
+        np.save(
+            path.join(tmp_path, "visibilities.npy"),
+            np.ones(shape=total_visibilities, dtype="complex128"),
+        )
+        np.save(
+            path.join(tmp_path, "noise_map.npy"),
+            np.ones(shape=total_visibilities, dtype="complex128"),
+        )
+        np.save(
+            path.join(tmp_path, "uv_wavelengths.npy"),
+            np.ones(shape=(total_visibilities, 2)),
+        )
+
+        # The peak resident memory of the test process includes that of every earlier test, so the dataset is
+        # loaded in a new process and the increase of its peak resident memory (in kilobytes) is printed.
+
+        directory = str(tmp_path)
+
+        script = "\n".join(
+            [
+                "import resource",
+                "from os import path",
+                "import autolens as al",
+                "peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss",
+                "interferometer = al.interferometer_via_memmap_from(",
+                f"    visibilities_path=path.join({directory!r}, 'visibilities.npy'),",
+                f"    noise_map_path=path.join({directory!r}, 'noise_map.npy'),",
+                f"    uv_wavelengths_path=path.join({directory!r}, 'uv_wavelengths.npy'),",
+                ")",
+                "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - peak)",
+            ]
+        )
+
+        peak_increase = int(
+            subprocess.check_output([sys.executable, "-c", script]).split()[-1]
+        )
+
+        assert peak_increase < 16 * 1024
+
 
 class TestSimulatorInterferometer:
     def test__from_tracer__same_as_tracer_input(self):
@@ -163,6 +403,54 @@ class TestSimulatorInterferometer:
         ).all()
         assert (interferometer.noise_map == interferometer_via_image.noise_map).all()
 
+    def test__from_tracer__chunked_transformer__same_as_dft(self, monkeypatch):
+
+        grid = al.Grid.uniform(shape_2d=(20, 20), pixel_scales=0.05, sub_size=1)
+
+        lens_galaxy = al.Galaxy(
+            redshift=0.5, mass=al.mp.EllipticalIsothermal(einstein_radius=1.6)
+        )
+
+        source_galaxy = al.Galaxy(
+            redshift=1.0, light=al.lp.EllipticalSersic(intensity=0.3)
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[lens_galaxy, source_galaxy])
+
+        uv_wavelengths = np.array(
+            [[0.04, 200.0], [0.3, 30000.0], [5000.0, 30.0], [-300.0, 1000.0]] * 2
+        )
+
+        simulator = al.SimulatorInterferometer(
+            uv_wavelengths=uv_wavelengths,
+            exposure_time=10000.0,
+            background_sky_level=100.0,
+            transformer_class=al.TransformerDFT,
+            noise_sigma=0.1,
+            noise_seed=1,
+        )
+
+        simulator_chunked = al.SimulatorInterferometer(
+            uv_wavelengths=uv_wavelengths,
+            exposure_time=10000.0,
+            background_sky_level=100.0,
+            transformer_class=al.TransformerDFTChunked,
+            noise_sigma=0.1,
+            noise_seed=1,
+        )
+
+        monkeypatch.setattr(al.TransformerDFTChunked, "chunk_size", 3)
+
+        interferometer = simulator.from_tracer_and_grid(tracer=tracer, grid=grid)
+        interferometer_chunked = simulator_chunked.from_tracer_and_grid(
+            tracer=tracer, grid=grid
+        )
+
+        assert interferometer_chunked.visibilities == pytest.approx(
+            interferometer.visibilities, 1.0e-8
+        )
+        assert (interferometer_chunked.noise_map == interferometer.noise_map).all()
+
     def test__from_deflections_and_galaxies__same_as_calculation_using_tracer(self):
 
         grid = al.Grid.uniform(shape_2d=(20, 20), pixel_scales=0.05, sub_size=1)
@@ -0,0 +1,116 @@
+import json
+from os import path
+
+import autolens as al
+import numpy as np
+import pytest
+
+
+class TestUVBinnedInterferometer:
+    def test__cells_smaller_than_uv_spacing__visibilities_unchanged(self):
+
+        interferometer = al.Interferometer(
+            visibilities=al.Visibilities.manual_1d(
+                visibilities=[1.0 + 2.0j, 3.0 + 4.0j, 5.0 + 6.0j]
+            ),
+            noise_map=al.VisibilitiesNoiseMap.manual_1d(
+                visibilities=[1.0 + 1.0j, 2.0 + 2.0j, 3.0 + 3.0j]
+            ),
+            uv_wavelengths=np.array([[0.5, 0.5], [10.5, 0.5], [0.5, 10.5]]),
+        )
+
+        binned, report = al.uv_binned_interferometer_and_report_from(
+            interferometer=interferometer, uv_cell_size=1.0
+        )
+
+        assert report["total_visibilities"] == 3
+        assert report["total_binned_visibilities"] == 3
+        assert report["compression_factor"] == 1.0
+        assert report["max_uv_offset"] == 0.0
+
+        order = np.lexsort(
+            (interferometer.uv_wavelengths[:, 1], interferometer.uv_wavelengths[:, 0])
+        )
+
+        assert binned.visibilities == pytest.approx(
+            np.asarray(interferometer.visibilities)[order], 1.0e-8
+        )
+        assert binned.noise_map == pytest.approx(
+            np.asarray(interferometer.noise_map)[order], 1.0e-8
+        )
+        assert binned.uv_wavelengths == pytest.approx(
+            interferometer.uv_wavelengths[order], 1.0e-8
+        )
+
+    def test__visibilities_in_one_cell__inverse_variance_weighted_average(self):
+
+        interferometer = al.Interferometer(
+            visibilities=al.Visibilities.manual_1d(
+                visibilities=[1.0 + 1.0j, 3.0 + 4.0j, 7.0 + 7.0j]
+            ),
+            noise_map=al.VisibilitiesNoiseMap.manual_1d(
+                visibilities=[1.0 + 1.0j, 1.0 + 2.0j, 2.0 + 2.0j]
+            ),
+            uv_wavelengths=np.array([[1.0, 1.0], [2.0, 1.0], [1.0, 4.0]]),
+        )
+
+        binned, report = al.uv_binned_interferometer_and_report_from(
+            interferometer=interferometer, uv_cell_size=5.0
+        )
+
+        weights_real = np.array([1.0, 1.0, 0.25])
+        weights_imag = np.array([1.0, 0.25, 0.25])
+        weights = weights_real + weights_imag
+
+        assert binned.visibilities.shape == (1,)
+        assert binned.visibilities[0].real == pytest.approx(
+            np.sum(weights_real * np.array([1.0, 3.0, 7.0])) / np.sum(weights_real),
+            1.0e-8,
+        )
+        assert binned.visibilities[0].imag == pytest.approx(
+            np.sum(weights_imag * np.array([1.0, 4.0, 7.0])) / np.sum(weights_imag),
+            1.0e-8,
+        )
+        assert binned.noise_map[0].real == pytest.approx(
+            1.0 / np.sqrt(np.sum(weights_real)), 1.0e-8
+        )
+        assert binned.noise_map[0].imag == pytest.approx(
+            1.0 / np.sqrt(np.sum(weights_imag)), 1.0e-8
+        )
+        assert binned.uv_wavelengths[0, 0] == pytest.approx(
+            np.sum(weights * np.array([1.0, 2.0, 1.0])) / np.sum(weights), 1.0e-8
+        )
+
+        assert report["total_binned_visibilities"] == 1
+        assert report["compression_factor"] == 3.0
+        assert report["max_uv_offset"] > 0.0
+
+    def test__real_space_mask__smearing_error_in_report__output_to_files(
+        self, interferometer_7, mask_7x7, tmp_path
+    ):
+
+        binned, report = al.uv_binned_interferometer_and_report_from(
+            interferometer=interferometer_7,
+            uv_cell_size=1.0e6,
+            real_space_mask=mask_7x7,
+        )
+
+        assert report["real_space_radius"] == pytest.approx(np.sqrt(2.0), 1.0e-4)
+        assert report["max_phase_error"] > 0.0
+        assert 0.0 < report["amplitude_loss"] < 1.0
+
+        al.output_uv_binned_interferometer(
+            interferometer=binned, report=report, output_path=str(tmp_path)
+        )
+
+        loaded = al.Interferometer.from_fits(
+            visibilities_path=path.join(tmp_path, "visibilities.fits"),
+            noise_map_path=path.join(tmp_path, "noise_map.fits"),
+            uv_wavelengths_path=path.join(tmp_path, "uv_wavelengths.fits"),
+        )
+
+        assert loaded.visibilities == pytest.approx(binned.visibilities, 1.0e-4)
+        assert loaded.uv_wavelengths == pytest.approx(binned.uv_wavelengths, 1.0e-4)
+
+        with open(path.join(tmp_path, "uv_binning.json")) as f:
+            assert json.load(f) == report
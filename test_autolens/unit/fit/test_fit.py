@@ -2732,3 +2732,224 @@ class TestFitInterferometer:
             )
 
             assert hyper_noise_map.in_1d == pytest.approx(fit.noise_map.in_1d)
+
+
+class TestFitInterferometerDirtyImage:
+    def test__dirty_model_image_is_w_matrix_of_image__same_as_manual_log_likelihood(
+        self, interferometer_7, visibilities_mask_7, mask_7x7
+    ):
+
+        # The dirty beam is exact when the real and imaginary noise of every visibility are equal.
+
+        interferometer_7 = al.Interferometer(
+            visibilities=interferometer_7.visibilities,
+            noise_map=al.VisibilitiesNoiseMap(
+                visibilities=np.array([1.0 + 1.0j, 2.0 + 2.0j] * 3 + [1.0 + 1.0j])
+            ),
+            uv_wavelengths=interferometer_7.uv_wavelengths,
+        )
+
+        masked_interferometer_7 = al.MaskedInterferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7,
+            real_space_mask=mask_7x7,
+            settings=al.SettingsMaskedInterferometer(
+                sub_size=1, transformer_class=al.TransformerDFT
+            ),
+        )
+
+        masked_interferometer_7.preload_w_tilde()
+        masked_interferometer_7.preload_dirty_image()
+
+        w_tilde = masked_interferometer_7.w_tilde
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light])
+
+        fit = al.FitInterferometerDirtyImage(
+            masked_interferometer=masked_interferometer_7, tracer=tracer
+        )
+
+        image = tracer.image_from_grid(grid=masked_interferometer_7.grid).in_1d_binned
+
+        beam_peak = 0.5 * np.sum(
+            1.0 / masked_interferometer_7.noise_map.real ** 2.0
+            + 1.0 / masked_interferometer_7.noise_map.imag ** 2.0
+        )
+
+        assert fit.dirty_image.in_1d == pytest.approx(
+            w_tilde.dirty_image / beam_peak, 1.0e-4
+        )
+        assert fit.dirty_model_image.in_1d == pytest.approx(
+            np.dot(w_tilde.w_matrix, image) / beam_peak, 1.0e-4
+        )
+        assert fit.noise_map.in_1d == pytest.approx(
+            np.full(9, 1.0 / np.sqrt(beam_peak)), 1.0e-4
+        )
+
+        chi_squared = np.sum(
+            ((fit.dirty_image.in_1d - fit.dirty_model_image.in_1d) * np.sqrt(beam_peak))
+            ** 2.0
+        )
+        noise_normalization = 9.0 * np.log(2.0 * np.pi / beam_peak)
+
+        assert fit.log_likelihood == pytest.approx(
+            -0.5 * (chi_squared + noise_normalization), 1.0e-4
+        )
+        assert fit.figure_of_merit == fit.log_likelihood
+
+
+class TestFigureOfMerit:
+    def test__imaging__same_as_fit_imaging_figure_of_merit(self, masked_imaging_7x7):
+
+        hyper_image_sky = al.hyper_data.HyperImageSky(sky_scale=1.0)
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        pix = al.pix.Rectangular(shape=(3, 3))
+        reg = al.reg.Constant(coefficient=1.0)
+        galaxy_pix = al.Galaxy(redshift=1.0, pixelization=pix, regularization=reg)
+
+        for galaxies in [[galaxy_light], [galaxy_light, galaxy_pix]]:
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            for hyper_kwargs in [
+                {},
+                dict(
+                    hyper_image_sky=hyper_image_sky,
+                    hyper_background_noise=hyper_background_noise,
+                ),
+            ]:
+
+                fit = al.FitImaging(
+                    masked_imaging=masked_imaging_7x7, tracer=tracer, **hyper_kwargs
+                )
+
+                figure_of_merit = al.fit.fit.figure_of_merit_imaging_from(
+                    masked_imaging=masked_imaging_7x7, tracer=tracer, **hyper_kwargs
+                )
+
+                assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+    def test__interferometer__same_as_fit_interferometer_figure_of_merit(
+        self, masked_interferometer_7
+    ):
+
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        pix = al.pix.Rectangular(shape=(3, 3))
+        reg = al.reg.Constant(coefficient=1.0)
+        galaxy_pix = al.Galaxy(redshift=1.0, pixelization=pix, regularization=reg)
+
+        for galaxies in [[galaxy_light], [galaxy_light, galaxy_pix]]:
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            for hyper_background_noise in [None, hyper_background_noise]:
+
+                fit = al.FitInterferometer(
+                    masked_interferometer=masked_interferometer_7,
+                    tracer=tracer,
+                    hyper_background_noise=hyper_background_noise,
+                )
+
+                figure_of_merit = al.fit.fit.figure_of_merit_interferometer_from(
+                    masked_interferometer=masked_interferometer_7,
+                    tracer=tracer,
+                    hyper_background_noise=hyper_background_noise,
+                )
+
+                assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+    def test__interferometer_via_w_tilde__same_as_fit_interferometer_figure_of_merit(
+        self, interferometer_7, visibilities_mask_7, mask_7x7
+    ):
+
+        masked_interferometer_7 = al.MaskedInterferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7,
+            real_space_mask=mask_7x7,
+            settings=al.SettingsMaskedInterferometer(
+                sub_size=2, transformer_class=al.TransformerDFT
+            ),
+        )
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        pix = al.pix.Rectangular(shape=(3, 3))
+        reg = al.reg.Constant(coefficient=1.0)
+        galaxy_pix = al.Galaxy(redshift=1.0, pixelization=pix, regularization=reg)
+
+        for galaxies in [[galaxy_pix], [galaxy_light, galaxy_pix]]:
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            fit = al.FitInterferometer(
+                masked_interferometer=masked_interferometer_7, tracer=tracer
+            )
+
+            masked_interferometer_7.preload_w_tilde()
+
+            figure_of_merit = al.fit.fit.figure_of_merit_interferometer_from(
+                masked_interferometer=masked_interferometer_7, tracer=tracer
+            )
+
+            masked_interferometer_7.w_tilde = None
+
+            assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+    def test__interferometer_via_chunks__same_as_fit_interferometer_figure_of_merit(
+        self, interferometer_7, visibilities_mask_7, mask_7x7
+    ):
+
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light])
+
+        for transformer_class in [al.TransformerDFT, al.TransformerNUFFT]:
+
+            masked_interferometer_7 = al.MaskedInterferometer(
+                interferometer=interferometer_7,
+                visibilities_mask=visibilities_mask_7,
+                real_space_mask=mask_7x7,
+                settings=al.SettingsMaskedInterferometer(
+                    sub_size=2, transformer_class=transformer_class
+                ),
+            )
+
+            for hyper_background_noise in [None, hyper_background_noise]:
+
+                fit = al.FitInterferometer(
+                    masked_interferometer=masked_interferometer_7,
+                    tracer=tracer,
+                    hyper_background_noise=hyper_background_noise,
+                )
+
+                masked_interferometer_7.chunk_visibilities(chunk_size=3)
+
+                figure_of_merit = al.fit.fit.figure_of_merit_interferometer_from(
+                    masked_interferometer=masked_interferometer_7,
+                    tracer=tracer,
+                    hyper_background_noise=hyper_background_noise,
+                )
+
+                masked_interferometer_7.visibilities_chunk_size = None
+
+                assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
@@ -1,6 +1,7 @@
 import autolens as al
 import numpy as np
 import pytest
+from autolens.fit import fit_positions
 
 
 class MockTracerPositions:
@@ -192,3 +193,84 @@ class TestFitPositionsSourcePlane:
             ),
             1e-4,
         )
+
+
+class TestPositionsTraceWithinThresholdViaTracer:
+    def test__same_result_as_fit_positions_with_real_tracer(self):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(
+                    redshift=0.75, mass=al.mp.SphericalIsothermal(einstein_radius=0.1)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        positions = al.GridIrregularGrouped(
+            [[(1.2, 0.0), (-1.0, 0.0)], [(0.0, 1.1), (0.0, -1.1), (0.5, 0.5)]]
+        )
+
+        fit = al.FitPositionsSourcePlaneMaxSeparation(
+            positions=positions, tracer=tracer, noise_value=1.0
+        )
+
+        for threshold in [0.01, 0.1, 0.2, 0.5, 1.0, 2.0]:
+            assert fit_positions.positions_trace_within_threshold_via_tracer(
+                positions=positions, tracer=tracer, threshold=threshold
+            ) == fit.maximum_separation_within_threshold(threshold=threshold)
+
+        assert tracer.source_plane_coordinates_from_grid(grid=positions) == pytest.approx(
+            np.asarray(tracer.traced_grids_of_planes_from_grid(grid=positions)[-1]),
+            1.0e-8,
+        )
+
+    def test__grouped_kernels__separations_of_each_group(self):
+
+        grid = np.array([[0.0, 0.0], [0.0, 1.0], [0.0, 0.5], [0.0, 0.0], [3.0, 3.0]])
+        upper_indexes = np.array([3, 5])
+
+        max_separations = fit_positions.max_separations_of_grouped_grid_from(
+            grid=grid, upper_indexes=upper_indexes
+        )
+
+        assert max_separations == pytest.approx(np.array([1.0, np.sqrt(18.0)]), 1.0e-8)
+
+        assert fit_positions.grouped_grid_max_separation_within_threshold_from(
+            grid=grid, upper_indexes=upper_indexes, threshold=4.5
+        )
+        assert not fit_positions.grouped_grid_max_separation_within_threshold_from(
+            grid=grid, upper_indexes=upper_indexes, threshold=4.0
+        )
+
+    def test__grouped_kernels__nan_positions__separation_nan_and_not_within_threshold(
+        self
+    ):
+
+        grid = np.array([[0.0, 0.0], [0.0, 1.0], [0.0, 0.0], [np.nan, np.nan]])
+        upper_indexes = np.array([2, 4])
+
+        max_separations = fit_positions.max_separations_of_grouped_grid_from(
+            grid=grid, upper_indexes=upper_indexes
+        )
+
+        assert max_separations[0] == 1.0
+        assert np.isnan(max_separations[1])
+
+        assert not fit_positions.grouped_grid_max_separation_within_threshold_from(
+            grid=grid, upper_indexes=upper_indexes, threshold=100.0
+        )
+
+        positions = al.GridIrregularGrouped([[(0.0, 0.0), (np.nan, np.nan)]])
+
+        fit = al.FitPositionsSourcePlaneMaxSeparation(
+            positions=positions,
+            tracer=MockTracerPositions(positions=positions),
+            noise_value=1.0,
+        )
+
+        assert np.isnan(fit.maximum_separations[0])
+        assert not fit.maximum_separation_within_threshold(threshold=100.0)
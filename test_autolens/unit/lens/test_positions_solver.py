@@ -1,6 +1,7 @@
 import autolens as al
 from autolens.lens import positions_solver as pos
 
+import numba
 import numpy as np
 
 import pytest
@@ -213,6 +214,251 @@ class TestPositionFinder:
         assert position_manual_0.in_grouped_list[0] == positions.in_grouped_list[0]
         assert position_manual_1.in_grouped_list[0] == positions.in_grouped_list[1]
 
+    def test__refined_coordinates_from_coordinates__same_as_every_coordinate_individually(
+        self
+    ):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = pos.PositionsFinder(grid=grid, pixel_scale_precision=0.01)
+
+        coordinates = np.array([[0.0, -0.9], [0.0, 1.1], [0.9, 0.0]])
+
+        refined_coordinates = solver.refined_coordinates_from_coordinates(
+            coordinates=coordinates,
+            pixel_scale=0.05,
+            lensing_obj=sis,
+            source_plane_coordinate=(0.0, 0.11),
+        )
+
+        refined_coordinates_manual = []
+
+        for coordinate in coordinates:
+
+            grid = solver.grid_buffed_and_upscaled_around_coordinate_from(
+                coordinate=tuple(coordinate),
+                pixel_scales=(0.05, 0.05),
+                buffer=4,
+                upscale_factor=solver.upscale_factor,
+            )
+
+            grid = solver.grid_peaks_from(
+                lensing_obj=sis, grid=grid, source_plane_coordinate=(0.0, 0.11)
+            )
+
+            refined_coordinates_manual += [tuple(coordinate) for coordinate in grid]
+
+        assert refined_coordinates.shape[0] > 0
+        assert refined_coordinates == pytest.approx(
+            np.asarray(refined_coordinates_manual), 1.0e-8
+        )
+
+        refined_coordinates = solver.refined_coordinates_from_coordinates(
+            coordinates=np.zeros(shape=(0, 2)),
+            pixel_scale=0.05,
+            lensing_obj=sis,
+            source_plane_coordinate=(0.0, 0.11),
+        )
+
+        assert refined_coordinates.shape == (0, 2)
+
+
+class TestPositionsFinderTriangles:
+    def test__positions_found_for_simple_mass_profiles(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.PositionsFinderTriangles(grid=grid, pixel_scale_precision=0.01)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert positions.in_grouped_list[0][0] == pytest.approx((0.0, -0.89), 1.0e-4)
+        assert positions.in_grouped_list[0][1] == pytest.approx((0.0, 1.11), 1.0e-4)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        g1 = al.Galaxy(redshift=1.0)
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        solver = pos.PositionsFinderTriangles(grid=grid, pixel_scale_precision=0.01)
+
+        coordinates = solver.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.0)
+        )
+
+        assert len(coordinates.in_grouped_list[0]) == 4
+
+        source_plane_coordinates = tracer.traced_grids_of_planes_from_grid(
+            grid=coordinates
+        )[-1]
+
+        assert np.asarray(source_plane_coordinates) == pytest.approx(
+            np.zeros((4, 2)), abs=1.0e-4
+        )
+
+    def test__same_positions_as_positions_finder(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+        solver = pos.PositionsFinderTriangles(grid=grid, pixel_scale_precision=0.001)
+
+        coordinates = solver.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.0)
+        )
+
+        solver = pos.PositionsFinder(grid=grid, pixel_scale_precision=0.001)
+
+        coordinates_manual = solver.solve(
+            lensing_obj=tracer, source_plane_coordinate=(0.0, 0.0)
+        )
+
+        assert np.asarray(coordinates) == pytest.approx(
+            np.asarray(coordinates_manual), abs=1.0e-3
+        )
+
+    def test__masked_grid_and_no_multiple_images(self):
+
+        mask = al.Mask2D.circular(shape_2d=(100, 100), pixel_scales=0.05, radius=1.0)
+
+        grid = al.Grid.from_mask(mask=mask)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = pos.PositionsFinderTriangles(grid=grid, pixel_scale_precision=0.01)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert positions.in_grouped_list[0] == [pytest.approx((0.0, -0.89), 1.0e-4)]
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(5.0, 5.0))
+
+        assert len(positions) == 0
+
+    def test__deflections_of_shared_vertices_computed_once(self):
+
+        grid = al.Grid.uniform(shape_2d=(3, 3), pixel_scales=1.0)
+
+        solver = pos.PositionsFinderTriangles(grid=grid, pixel_scale_precision=0.5)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        traced_vertices = {}
+
+        solver.source_plane_vertices_from(
+            lensing_obj=sis,
+            vertices=np.array([[0, 0], [0, 2], [2, 0], [0, 2]]),
+            traced_vertices=traced_vertices,
+        )
+
+        assert len(traced_vertices) == 3
+
+        source_plane_vertices = solver.source_plane_vertices_from(
+            lensing_obj=sis,
+            vertices=np.array([[0, 2], [0, 1]]),
+            traced_vertices=traced_vertices,
+        )
+
+        assert len(traced_vertices) == 4
+        assert source_plane_vertices[0] == pytest.approx((0.0, 0.0), abs=1.0e-4)
+
+
+class TestGridSquareCells:
+    def test__cells_of_grid_and_cells_divided(self):
+
+        grid_vertices = np.array(
+            [[0, 0], [0, 1], [0, 2], [1, 0], [1, 1], [1, 2], [2, 0], [2, 1]]
+        )
+
+        cells = pos.grid_square_cells_from(grid_vertices=grid_vertices)
+
+        assert (cells == np.array([[0, 0], [0, 1], [1, 0]])).all()
+
+        cells = pos.cells_divided_from(cells=np.array([[0, 1]]))
+
+        assert (cells == np.array([[0, 2], [0, 3], [1, 2], [1, 3]])).all()
+
+    def test__triangle_vertices_of_cells(self):
+
+        triangle_vertices = pos.triangle_vertices_from(cells=np.array([[1, 2]]))
+
+        assert (
+            triangle_vertices
+            == np.array([[[1, 2], [1, 3], [2, 2]], [[1, 3], [2, 3], [2, 2]]])
+        ).all()
+
+
+class TestTrianglesContainCoordinate:
+    def test__coordinates_inside_on_edge_and_outside_triangles(self):
+
+        triangles = np.array(
+            [
+                [[0.0, 0.0], [0.0, 1.0], [1.0, 0.0]],
+                [[0.0, 1.0], [0.0, 0.0], [1.0, 0.0]],
+                [[0.0, 0.0], [0.0, 1.0], [-1.0, 0.0]],
+                [[0.5, 0.5], [0.5, 0.5], [0.5, 0.5]],
+            ]
+        )
+
+        contains_coordinate = pos.triangles_contain_coordinate_from(
+            triangles=triangles, coordinate=np.array([0.25, 0.25])
+        )
+
+        assert (contains_coordinate == np.array([True, True, False, False])).all()
+
+        contains_coordinate = pos.triangles_contain_coordinate_from(
+            triangles=triangles, coordinate=np.array([0.0, 0.5])
+        )
+
+        assert (contains_coordinate == np.array([True, True, True, False])).all()
+
+    def test__interpolated_coordinates_of_triangles(self):
+
+        image_plane_triangles = np.array([[[0.0, 0.0], [0.0, 2.0], [2.0, 0.0]]])
+        source_plane_triangles = np.array([[[0.0, 0.0], [0.0, 1.0], [1.0, 0.0]]])
+
+        coordinates = pos.triangles_interpolated_coordinate_from(
+            image_plane_triangles=image_plane_triangles,
+            source_plane_triangles=source_plane_triangles,
+            coordinate=np.array([0.25, 0.5]),
+        )
+
+        assert coordinates == pytest.approx(np.array([[0.5, 1.0]]), 1.0e-4)
+
+
+class TestGridMergeWithinDistance:
+    def test__coordinates_within_distance_merged_to_their_mean(self):
+
+        grid = np.array([[1.0, 1.0], [1.1, 1.1], [3.0, 3.0], [1.0, 1.2]])
+
+        grid = pos.grid_merge_within_distance(grid=grid, distance=0.5)
+
+        assert grid == pytest.approx(
+            np.array([[1.033333, 1.1], [3.0, 3.0]]), 1.0e-4
+        )
+
 
 class TestGridRemoveDuplicates:
     def test__remove_duplicates_from_grid_within_tolerance(self):
@@ -250,6 +496,48 @@ class TestGridRemoveDuplicates:
         assert grid == [(1.0, 1.0), (2.0, 2.0), (4.0, 4.0), (5.0, 5.0), (3.0, 3.0)]
 
 
+    def test__large_grid_with_duplicates__same_as_unique_coordinates(self):
+
+        grid = np.random.uniform(low=-1.0, high=1.0, size=(10000, 2))
+
+        grid_no_duplicates = pos.grid_remove_duplicates(
+            grid=np.concatenate((grid, grid[:5000]))
+        )
+
+        assert len(grid_no_duplicates) == 10000
+        assert np.asarray(grid_no_duplicates) == pytest.approx(
+            np.concatenate((grid[5000:], grid[:5000])), 1.0e-8
+        )
+
+
+class TestGridCellsSorted:
+    def test__cells_sorted_by_y_then_x(self):
+
+        grid = np.array([[1.5, 0.5], [0.5, 1.5], [0.5, 0.5], [-0.5, 2.5]])
+
+        cells, sort_index = pos.grid_cells_sorted_from(grid=grid, cell_size=1.0)
+
+        assert (cells == np.array([[-1, 2], [0, 0], [0, 1], [1, 0]])).all()
+        assert (sort_index == np.array([3, 2, 1, 0])).all()
+
+        assert pos.sorted_cells_index_from(cells=cells, cell_y=0, cell_x=0) == 1
+        assert pos.sorted_cells_index_from(cells=cells, cell_y=0, cell_x=1) == 2
+        assert pos.sorted_cells_index_from(cells=cells, cell_y=0, cell_x=5) == 3
+        assert pos.sorted_cells_index_from(cells=cells, cell_y=2, cell_x=0) == 4
+
+    def test__coordinates_within_distance_of_grid(self):
+
+        grid = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]])
+
+        within_distance = pos.coordinates_within_distance_of_grid_from(
+            coordinates=np.array([[0.05, 0.0], [1.0, 1.2], [2.0, 1.95], [-0.1, 0.1]]),
+            grid=grid,
+            distance=0.1,
+        )
+
+        assert (within_distance == np.array([True, False, True, False])).all()
+
+
 class TestGridBuffedAroundCoordinate:
     def test__single_point_grid_buffed_correctly__upscale_factor_1(self):
         grid_buffed_1d = pos.grid_buffed_around_coordinate_from(
@@ -586,6 +874,32 @@ class TestGridBuffedAroundCoordinate:
         )
 
 
+class TestGridBuffedAroundCoordinates:
+    def test__grids_of_every_coordinate_concatenated(self):
+
+        coordinates = np.array([[0.0, 0.0], [1.0, -1.0]])
+
+        grid_buffed_1d = pos.grid_buffed_around_coordinates_from(
+            coordinates=coordinates, pixel_scales=(1.0, 1.0), buffer=1, upscale_factor=2
+        )
+
+        assert grid_buffed_1d.shape == (72, 2)
+
+        for coordinate_index in range(2):
+
+            grid_buffed_of_coordinate = pos.grid_buffed_around_coordinate_from(
+                coordinate=tuple(coordinates[coordinate_index]),
+                pixel_scales=(1.0, 1.0),
+                buffer=1,
+                upscale_factor=2,
+            )
+
+            assert (
+                grid_buffed_1d[36 * coordinate_index : 36 * (coordinate_index + 1)]
+                == grid_buffed_of_coordinate
+            ).all()
+
+
 class TestGridNeighbors1d:
     def test__creates_numpy_array_with_correct_neighbors(self):
 
@@ -663,6 +977,83 @@ class TestGridNeighbors1d:
             )
         ).all()
 
+    def test__multiple_grids__neighbors_offset_to_their_grid(self):
+
+        neighbors_1d, has_neighbors = pos.grid_square_neighbors_1d_from(
+            shape_1d=9, total_grids=2
+        )
+
+        assert neighbors_1d.shape == (18, 8)
+
+        assert (neighbors_1d[4] == np.array([0, 1, 2, 3, 5, 6, 7, 8])).all()
+        assert (neighbors_1d[13] == np.array([9, 10, 11, 12, 14, 15, 16, 17])).all()
+
+        assert (
+            has_neighbors
+            == np.array(
+                [False, False, False, False, True, False, False, False, False] * 2
+            )
+        ).all()
+
+
+class TestParallel:
+    def test__kernels_compiled_in_parallel__same_as_serial(self):
+
+        def parallel(kernel):
+            return numba.njit(parallel=True)(kernel.py_func)
+
+        coordinates = np.array([[1.0, 2.0], [0.0, 0.0]])
+
+        grid_buffed = pos.grid_buffed_around_coordinates_from(
+            coordinates=coordinates, pixel_scales=(0.5, 0.5), buffer=2, upscale_factor=2
+        )
+
+        assert (
+            parallel(pos.grid_buffed_around_coordinate_from)(
+                (1.0, 2.0), (0.5, 0.5), 2, 2
+            )
+            == grid_buffed[0:100]
+        ).all()
+        assert (
+            parallel(pos.grid_buffed_around_coordinates_from)(
+                coordinates, (0.5, 0.5), 2, 2
+            )
+            == grid_buffed
+        ).all()
+
+        neighbors, has_neighbors = pos.grid_square_neighbors_1d_from(
+            shape_1d=100, total_grids=2
+        )
+
+        neighbors_parallel, has_neighbors_parallel = parallel(
+            pos.grid_square_neighbors_1d_from
+        )(100, 2)
+
+        assert (has_neighbors_parallel == has_neighbors).all()
+        assert (neighbors_parallel[has_neighbors] == neighbors[has_neighbors]).all()
+
+        distances = np.random.RandomState(seed=1).uniform(size=200)
+
+        assert (
+            parallel(pos.grid_peaks_from)(
+                distances, grid_buffed, neighbors, has_neighbors
+            )
+            == pos.grid_peaks_from(
+                distance_1d=distances,
+                grid_1d=grid_buffed,
+                neighbors=neighbors,
+                has_neighbors=has_neighbors,
+            )
+        ).all()
+        assert (
+            parallel(pos.grid_within_distance)(distances, grid_buffed, 0.5)
+            == grid_buffed[distances < 0.5]
+        ).all()
+        assert (
+            parallel(pos.grid_outside_distance_mask_from)(distances, grid_buffed, 0.5)
+            == grid_buffed[distances > 0.5]
+        ).all()
+
 
 class TestPairCoordinateToGrid:
     def test__coordinate_paired_to_closest_pixel_on_grid(self):
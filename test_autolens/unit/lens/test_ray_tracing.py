@@ -3,10 +3,13 @@ import numpy as np
 import pytest
 import os
 from os import path
+import pickle
+from collections import OrderedDict
 import shutil
 from astropy import cosmology as cosmo
 from skimage import measure
 from autoarray.mock import mock as mock_inv
+from autolens.lens import ray_tracing
 
 
 test_path = path.join(
@@ -1191,6 +1194,406 @@ class TestAbstractTracerLensing:
 
             assert len(traced_grids_of_planes) == 2
 
+        def test__traced_grids_have_grid_structure_and_do_not_share_memory_with_grid(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    gal_x1_mp,
+                    al.Galaxy(
+                        redshift=0.75,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=0.5),
+                    ),
+                    al.Galaxy(redshift=1.0),
+                ]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert len(traced_grids_of_planes) == 3
+
+            for traced_grid in traced_grids_of_planes:
+                assert isinstance(traced_grid, al.Grid)
+                assert traced_grid.shape == sub_grid_7x7.shape
+                assert (traced_grid.mask == sub_grid_7x7.mask).all()
+
+            assert not np.shares_memory(traced_grids_of_planes[0], sub_grid_7x7)
+            assert (traced_grids_of_planes[0] == sub_grid_7x7).all()
+
+    class TestTracedGridsCache:
+        def test__same_grid_traced_twice__deflections_computed_once(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            traced_grids_of_planes_cached = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert traced_grids_of_planes_cached[0] is traced_grids_of_planes[0]
+            assert traced_grids_of_planes_cached[1] is traced_grids_of_planes[1]
+
+            traced_grids_of_planes_limit = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=0
+            )
+
+            assert len(traced_grids_of_planes_limit) == 1
+            assert traced_grids_of_planes_limit[0] is traced_grids_of_planes[0]
+
+            traced_grids_of_planes_copy = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7.copy()
+            )
+
+            assert traced_grids_of_planes_copy[1] is not traced_grids_of_planes[1]
+            assert (traced_grids_of_planes_copy[1] == traced_grids_of_planes[1]).all()
+
+        def test__cache_is_bounded_and_not_pickled(self, sub_grid_7x7, gal_x1_mp):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            grid_list = [
+                sub_grid_7x7.copy() for _ in range(tracer.traced_grids_cache_size + 1)
+            ]
+
+            for grid in grid_list:
+                tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+            assert (
+                len(tracer._traced_grids_of_planes_cache)
+                == tracer.traced_grids_cache_size
+            )
+            assert id(grid_list[0]) not in tracer._traced_grids_of_planes_cache
+
+            tracer = pickle.loads(pickle.dumps(tracer))
+
+            assert len(tracer._traced_grids_of_planes_cache) == 0
+
+        def test__deflections_of_galaxies_cache__fixed_galaxy_deflections_reused(
+            self, sub_grid_7x7
+        ):
+
+            cache = OrderedDict()
+
+            def tracer_from(subhalo_einstein_radius):
+
+                return al.Tracer.from_galaxies(
+                    galaxies=[
+                        al.Galaxy(
+                            redshift=0.5,
+                            mass=al.mp.EllipticalIsothermal(
+                                elliptical_comps=(0.1, 0.0), einstein_radius=1.0
+                            ),
+                        ),
+                        al.Galaxy(
+                            redshift=0.5,
+                            subhalo=al.mp.SphericalIsothermal(
+                                centre=(0.5, 0.5),
+                                einstein_radius=subhalo_einstein_radius,
+                            ),
+                        ),
+                        al.Galaxy(redshift=1.0),
+                    ]
+                )
+
+            lens_deflections = None
+
+            for subhalo_einstein_radius in [0.1, 0.2, 0.3]:
+
+                tracer = tracer_from(subhalo_einstein_radius=subhalo_einstein_radius)
+
+                traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                    grid=sub_grid_7x7
+                )
+
+                tracer = tracer_from(subhalo_einstein_radius=subhalo_einstein_radius)
+                tracer.deflections_of_galaxies_cache = cache
+
+                traced_grids_of_planes_via_cache = tracer.traced_grids_of_planes_from_grid(
+                    grid=sub_grid_7x7
+                )
+
+                assert traced_grids_of_planes_via_cache[1] == pytest.approx(
+                    traced_grids_of_planes[1], 1.0e-8
+                )
+
+                if lens_deflections is not None:
+                    assert cache[(0, 0, id(sub_grid_7x7))][2] is lens_deflections
+
+                lens_deflections = cache[(0, 0, id(sub_grid_7x7))][2]
+
+            subhalo_mass_profiles_key = cache[(0, 1, id(sub_grid_7x7))][1]
+
+            assert ("einstein_radius", 0.3) in subhalo_mass_profiles_key[0][1]
+
+    class TestTracedGridsInterpolate:
+        @pytest.fixture(autouse=True)
+        def interpolate_spherical_cored_isothermal_deflections(self, config):
+            config["grids"]["interpolate"]["deflections_from_grid"][
+                "SphericalCoredIsothermal"
+            ] = True
+
+        def test__grid_interpolate__deflections_interpolated_from_traced_interpolation_grid(
+            self,
+        ):
+
+            mask = al.Mask2D.circular(
+                shape_2d=(30, 30), pixel_scales=0.1, radius=1.2, sub_size=2
+            )
+
+            grid = al.Grid.from_mask(mask=mask)
+            grid_interpolate = al.GridInterpolate.from_mask(
+                mask=mask, pixel_scales_interp=0.2
+            )
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalCoredIsothermal(
+                    einstein_radius=1.0, core_radius=0.3
+                ),
+            )
+            g1 = al.Galaxy(
+                redshift=0.75,
+                mass=al.mp.SphericalCoredIsothermal(
+                    centre=(0.2, 0.2), einstein_radius=0.3, core_radius=0.3
+                ),
+            )
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=grid
+            )
+            traced_grids_of_planes_interpolate = tracer.traced_grids_of_planes_from_grid(
+                grid=grid_interpolate
+            )
+            traced_grids_of_planes_interp = tracer.traced_grids_of_planes_from_grid(
+                grid=grid_interpolate.grid_interp
+            )
+
+            for plane_index in range(3):
+
+                traced_grid_interpolate = traced_grids_of_planes_interpolate[
+                    plane_index
+                ]
+
+                assert isinstance(traced_grid_interpolate, al.GridInterpolate)
+                assert np.asarray(traced_grid_interpolate) == pytest.approx(
+                    np.asarray(traced_grids_of_planes[plane_index]), abs=2.0e-2
+                )
+                assert np.asarray(
+                    traced_grid_interpolate.grid_interp
+                ) == pytest.approx(
+                    np.asarray(traced_grids_of_planes_interp[plane_index]), 1.0e-8
+                )
+
+            assert (
+                np.asarray(traced_grids_of_planes_interpolate[2])
+                != np.asarray(traced_grids_of_planes[2])
+            ).any()
+
+        def test__deflections_interpolate_accuracy__exact_deflections_if_not_met(
+            self,
+        ):
+
+            mask = al.Mask2D.circular(
+                shape_2d=(30, 30), pixel_scales=0.1, radius=1.2, sub_size=2
+            )
+
+            grid = al.Grid.from_mask(mask=mask)
+            grid_interpolate = al.GridInterpolate.from_mask(
+                mask=mask, pixel_scales_interp=0.2
+            )
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalCoredIsothermal(
+                    einstein_radius=1.0, core_radius=0.3
+                ),
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+            tracer.deflections_interpolate_accuracy = 1.0
+
+            traced_grids_of_planes_interpolate = tracer.traced_grids_of_planes_from_grid(
+                grid=grid_interpolate
+            )
+
+            assert (
+                np.asarray(traced_grids_of_planes_interpolate[1])
+                != np.asarray(tracer.traced_grids_of_planes_from_grid(grid=grid)[1])
+            ).any()
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, al.Galaxy(redshift=1.0)])
+
+            tracer.deflections_interpolate_accuracy = 1.0e-8
+
+            traced_grids_of_planes_interpolate = tracer.traced_grids_of_planes_from_grid(
+                grid=grid_interpolate
+            )
+
+            assert np.asarray(traced_grids_of_planes_interpolate[1]) == pytest.approx(
+                np.asarray(tracer.traced_grids_of_planes_from_grid(grid=grid)[1]),
+                1.0e-8,
+            )
+
+        def test__sparse_grid_traced_via_traced_interpolation_grid(self):
+
+            mask = al.Mask2D.circular(
+                shape_2d=(30, 30), pixel_scales=0.1, radius=1.2, sub_size=2
+            )
+
+            grid = al.Grid.from_mask(mask=mask)
+            grid_interpolate = al.GridInterpolate.from_mask(
+                mask=mask, pixel_scales_interp=0.2
+            )
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalCoredIsothermal(
+                    einstein_radius=1.0, core_radius=0.3
+                ),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                pixelization=al.pix.VoronoiMagnification(shape=(5, 5)),
+                regularization=al.reg.Constant(),
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            traced_sparse_grids_of_planes = tracer.traced_sparse_grids_of_planes_from_grid(
+                grid=grid
+            )
+            traced_sparse_grids_of_planes_interpolate = tracer.traced_sparse_grids_of_planes_from_grid(
+                grid=grid_interpolate
+            )
+
+            assert traced_sparse_grids_of_planes_interpolate[0] is None
+            assert isinstance(
+                traced_sparse_grids_of_planes_interpolate[1], al.GridVoronoi
+            )
+            assert np.asarray(
+                traced_sparse_grids_of_planes_interpolate[1]
+            ) == pytest.approx(np.asarray(traced_sparse_grids_of_planes[1]), abs=1.0e-2)
+
+            grid_outside = al.GridIrregular(grid=[(0.0, 0.0), (5.0, 5.0)])
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_via_grid_interpolate_from_grid(
+                grid=grid_outside, grid_interpolate=grid_interpolate
+            )
+
+            assert np.asarray(traced_grids_of_planes[1]) == pytest.approx(
+                np.asarray(tracer.traced_grids_of_planes_from_grid(grid=grid_outside)[1]),
+                1.0e-8,
+            )
+
+    class TestScalingFactors:
+        def test__4_planes__scaling_factors_match_independent_calculation(self):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(redshift=0.1),
+                    al.Galaxy(redshift=1.0),
+                    al.Galaxy(redshift=2.0),
+                    al.Galaxy(redshift=3.0),
+                ],
+                cosmology=cosmo.Planck15,
+            )
+
+            scaling_factors = tracer.scaling_factors_of_planes
+
+            # The scaling factors are as follows and were computed independently from the test_autoarray.
+            assert scaling_factors[1, 0] == pytest.approx(0.9348, 1.0e-4)
+            assert scaling_factors[2, 0] == pytest.approx(0.9839601, 1.0e-4)
+            assert scaling_factors[2, 1] == pytest.approx(0.7539734, 1.0e-4)
+            assert scaling_factors[3, 0] == pytest.approx(1.0, 1.0e-4)
+            assert scaling_factors[3, 1] == pytest.approx(1.0, 1.0e-4)
+            assert scaling_factors[3, 2] == pytest.approx(1.0, 1.0e-4)
+            assert (np.triu(scaling_factors) == 0.0).all()
+
+        def test__tracers_with_same_redshifts_and_cosmology__share_cached_scaling_factors(
+            self,
+        ):
+
+            tracer_0 = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)],
+                cosmology=cosmo.Planck15,
+            )
+
+            tracer_1 = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)],
+                cosmology=cosmo.Planck15,
+            )
+
+            assert (
+                tracer_0.scaling_factors_of_planes is tracer_1.scaling_factors_of_planes
+            )
+
+            tracer_2 = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)],
+                cosmology=cosmo.WMAP9,
+            )
+
+            assert (
+                tracer_0.scaling_factors_of_planes
+                is not tracer_2.scaling_factors_of_planes
+            )
+
+        def test__unhashable_cosmology__cached_on_its_parameters(self):
+
+            # From astropy 5 onwards, cosmologies define __eq__ without __hash__.
+
+            class UnhashableFlatLambdaCDM(cosmo.FlatLambdaCDM):
+                __hash__ = None
+
+            galaxies = [al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+
+            tracer_0 = al.Tracer.from_galaxies(
+                galaxies=galaxies,
+                cosmology=UnhashableFlatLambdaCDM(H0=67.7, Om0=0.307),
+            )
+
+            tracer_1 = al.Tracer.from_galaxies(
+                galaxies=galaxies,
+                cosmology=UnhashableFlatLambdaCDM(H0=67.7, Om0=0.307),
+            )
+
+            tracer_2 = al.Tracer.from_galaxies(
+                galaxies=galaxies,
+                cosmology=UnhashableFlatLambdaCDM(H0=70.0, Om0=0.3),
+            )
+
+            tracer_manual = al.Tracer.from_galaxies(
+                galaxies=galaxies,
+                cosmology=cosmo.FlatLambdaCDM(H0=67.7, Om0=0.307),
+            )
+
+            assert (
+                tracer_0.scaling_factors_of_planes is tracer_1.scaling_factors_of_planes
+            )
+            assert (
+                tracer_0.scaling_factors_of_planes
+                is not tracer_2.scaling_factors_of_planes
+            )
+            assert tracer_0.scaling_factors_of_planes == pytest.approx(
+                tracer_manual.scaling_factors_of_planes, 1.0e-8
+            )
+
     class TestProfileImages:
         def test__x1_plane__single_plane_tracer(self, sub_grid_7x7):
             g0 = al.Galaxy(
@@ -2506,6 +2909,213 @@ class TestAbstractTracerData:
             assert (blurred_image_dict[g2].in_1d == g2_blurred_image.in_1d).all()
             assert (blurred_image_dict[g3].in_1d == g3_blurred_image.in_1d).all()
 
+        def test__blurred_images_of_tracers_from_grid_and_convolver__matches_each_tracer(
+            self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
+        ):
+
+            tracer_0 = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                        mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        light_profile=al.lp.EllipticalSersic(intensity=2.0),
+                    ),
+                ]
+            )
+
+            tracer_1 = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light_profile=al.lp.EllipticalSersic(intensity=3.0),
+                        mass_profile=al.mp.SphericalIsothermal(einstein_radius=0.5),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        light_profile=al.lp.EllipticalSersic(intensity=0.5),
+                    ),
+                ]
+            )
+
+            tracer_2 = al.Tracer.from_galaxies(
+                galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+            )
+
+            blurred_images = ray_tracing.blurred_images_of_tracers_from_grid_and_convolver(
+                tracers=[tracer_0, tracer_1, tracer_2],
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            )
+
+            assert blurred_images.shape == (3, 9)
+
+            for tracer, blurred_image in zip(
+                [tracer_0, tracer_1, tracer_2], blurred_images
+            ):
+
+                assert blurred_image == pytest.approx(
+                    np.asarray(
+                        tracer.blurred_image_from_grid_and_convolver(
+                            grid=sub_grid_7x7,
+                            convolver=convolver_7x7,
+                            blurring_grid=blurring_grid_7x7,
+                        )
+                    ),
+                    1.0e-8,
+                )
+
+        def test__images_of_tracers_from_grid__batched_profiles__matches_each_tracer(
+            self, sub_grid_7x7
+        ):
+
+            tracers = [
+                al.Tracer.from_galaxies(
+                    galaxies=[
+                        al.Galaxy(
+                            redshift=0.5,
+                            light=al.lp.EllipticalSersic(
+                                centre=(0.1, 0.0),
+                                elliptical_comps=(0.1, 0.05 * i),
+                                intensity=1.0 + i,
+                            ),
+                            mass=al.mp.EllipticalIsothermal(
+                                centre=(0.0, 0.1 * i),
+                                elliptical_comps=(0.1 * i, 0.05),
+                                einstein_radius=1.0 + 0.1 * i,
+                            ),
+                            shear=al.mp.ExternalShear(
+                                elliptical_comps=(0.02 * i, 0.01)
+                            ),
+                        ),
+                        al.Galaxy(
+                            redshift=0.75,
+                            light=al.lp.SphericalExponential(intensity=0.5),
+                            mass=al.mp.SphericalIsothermal(einstein_radius=0.1 * i),
+                        ),
+                        al.Galaxy(
+                            redshift=1.0,
+                            light=al.lp.EllipticalExponential(
+                                elliptical_comps=(0.2, 0.1 * i)
+                            ),
+                            bulge=al.lp.SphericalDevVaucouleurs(intensity=0.2 * i),
+                        ),
+                    ]
+                )
+                for i in range(3)
+            ]
+
+            assert ray_tracing.tracers_are_batchable(tracers=tracers, grid=sub_grid_7x7)
+
+            images = ray_tracing.images_of_tracers_from_grid(
+                tracers=tracers, grid=sub_grid_7x7
+            )
+
+            assert images.shape == (3, 9)
+
+            for tracer, image in zip(tracers, images):
+                assert image == pytest.approx(
+                    tracer.image_from_grid(grid=sub_grid_7x7).in_1d_binned, 1.0e-8
+                )
+
+            tracers[2] = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(redshift=0.5, mass=al.mp.PointMass()),
+                    al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic()),
+                ]
+            )
+
+            assert not ray_tracing.tracers_are_batchable(
+                tracers=tracers, grid=sub_grid_7x7
+            )
+
+            images = ray_tracing.images_of_tracers_from_grid(
+                tracers=tracers, grid=sub_grid_7x7
+            )
+
+            for tracer, image in zip(tracers, images):
+                assert image == pytest.approx(
+                    tracer.image_from_grid(grid=sub_grid_7x7).in_1d_binned, 1.0e-8
+                )
+
+        def test__blurred_image_from_grid_and_convolver__blurred_images_of_galaxies_cache(
+            self, sub_grid_7x7, blurring_grid_7x7, convolver_7x7
+        ):
+
+            cache = {}
+
+            def tracer_from(source_intensity):
+
+                tracer = al.Tracer.from_galaxies(
+                    galaxies=[
+                        al.Galaxy(
+                            redshift=0.5,
+                            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                            mass_profile=al.mp.SphericalIsothermal(
+                                einstein_radius=source_intensity
+                            ),
+                        ),
+                        al.Galaxy(
+                            redshift=1.0,
+                            light_profile=al.lp.EllipticalSersic(
+                                intensity=source_intensity
+                            ),
+                        ),
+                    ]
+                )
+
+                blurred_image = tracer.blurred_image_from_grid_and_convolver(
+                    grid=sub_grid_7x7,
+                    convolver=convolver_7x7,
+                    blurring_grid=blurring_grid_7x7,
+                )
+
+                tracer.blurred_images_of_galaxies_cache = cache
+
+                return tracer, blurred_image
+
+            for source_intensity in [1.0, 2.0, 3.0]:
+
+                tracer, blurred_image = tracer_from(source_intensity=source_intensity)
+
+                blurred_image_via_cache = tracer.blurred_image_from_grid_and_convolver(
+                    grid=sub_grid_7x7,
+                    convolver=convolver_7x7,
+                    blurring_grid=blurring_grid_7x7,
+                )
+
+                assert blurred_image_via_cache.in_1d == pytest.approx(
+                    blurred_image.in_1d, 1.0e-4
+                )
+
+            lens_blurred_image = cache[(0, 0)][2]
+
+            lens_galaxy = tracer.planes[0].galaxies[0]
+
+            assert lens_blurred_image.in_1d == pytest.approx(
+                lens_galaxy.blurred_image_from_grid_and_convolver(
+                    grid=sub_grid_7x7,
+                    convolver=convolver_7x7,
+                    blurring_grid=blurring_grid_7x7,
+                ).in_1d,
+                1.0e-4,
+            )
+            assert cache[(1, 0)][2] is None
+
+            tracer, blurred_image = tracer_from(source_intensity=3.0)
+
+            tracer.blurred_image_from_grid_and_convolver(
+                grid=sub_grid_7x7,
+                convolver=convolver_7x7,
+                blurring_grid=blurring_grid_7x7,
+            )
+
+            assert cache[(0, 0)][2] is lens_blurred_image
+
     class TestUnmaskedBlurredProfileImages:
         def test__unmasked_images_of_tracer_planes_and_galaxies(self):
 
@@ -2745,6 +3355,54 @@ class TestAbstractTracerData:
             assert (visibilities_dict[g2] == g2_visibilities).all()
             assert (visibilities_dict[g3] == g3_visibilities).all()
 
+        def test__visibilities_of_images_from_transformer__same_as_transforming_every_image(
+            self, sub_grid_7x7, transformer_7x7_7, mask_7x7
+        ):
+
+            uv_wavelengths_7 = transformer_7x7_7.uv_wavelengths
+
+            images = [
+                al.lp.EllipticalSersic(intensity=1.0).image_from_grid(grid=sub_grid_7x7),
+                al.lp.EllipticalSersic(intensity=2.0, centre=(0.1, 0.1)).image_from_grid(
+                    grid=sub_grid_7x7
+                ),
+                al.Galaxy(redshift=0.5).image_from_grid(grid=sub_grid_7x7),
+            ]
+
+            for transformer in [
+                al.TransformerDFT(
+                    uv_wavelengths=uv_wavelengths_7, real_space_mask=mask_7x7
+                ),
+                al.TransformerDFT(
+                    uv_wavelengths=uv_wavelengths_7,
+                    real_space_mask=mask_7x7,
+                    preload_transform=False,
+                ),
+                al.TransformerNUFFT(
+                    uv_wavelengths=uv_wavelengths_7, real_space_mask=mask_7x7
+                ),
+            ]:
+
+                visibilities_of_images = al.lens.ray_tracing.visibilities_of_images_from_transformer(
+                    images=images, transformer=transformer
+                )
+
+                assert len(visibilities_of_images) == 3
+
+                for image, visibilities in zip(images, visibilities_of_images):
+
+                    assert isinstance(visibilities, al.Visibilities)
+                    assert visibilities == pytest.approx(
+                        transformer.visibilities_from_image(image=image), 1.0e-8
+                    )
+
+            assert (
+                al.lens.ray_tracing.visibilities_of_images_from_transformer(
+                    images=[], transformer=transformer
+                )
+                == []
+            )
+
     class TestGridIrregularsOfPlanes:
         def test__x2_planes__traced_grid_setup_correctly(self, sub_grid_7x7):
             galaxy_pix = al.Galaxy(
@@ -3034,6 +3692,84 @@ class TestAbstractTracerData:
                 masked_imaging_7x7.image, 1.0e-2
             )
 
+        def test__inversion_imaging__inversion_matrices_cache_reuses_mapper_and_matrices(
+            self, sub_grid_7x7, masked_imaging_7x7
+        ):
+
+            cache = {}
+            settings_pixelization = al.SettingsPixelization(use_border=False)
+
+            def inversion_from(coefficient, noise_map, use_cache):
+
+                tracer = al.Tracer.from_galaxies(
+                    galaxies=[
+                        al.Galaxy(
+                            redshift=0.5,
+                            mass=al.mp.SphericalIsothermal(einstein_radius=0.5),
+                        ),
+                        al.Galaxy(
+                            redshift=1.0,
+                            pixelization=al.pix.Rectangular(shape=(3, 3)),
+                            regularization=al.reg.Constant(coefficient=coefficient),
+                        ),
+                    ]
+                )
+
+                if use_cache:
+                    tracer.inversion_matrices_cache = cache
+
+                return tracer.inversion_imaging_from_grid_and_data(
+                    grid=sub_grid_7x7,
+                    image=masked_imaging_7x7.image,
+                    noise_map=noise_map,
+                    convolver=masked_imaging_7x7.convolver,
+                    settings_pixelization=settings_pixelization,
+                )
+
+            mapper = None
+
+            for coefficient in [0.5, 1.0, 2.0]:
+
+                inversion = inversion_from(
+                    coefficient=coefficient,
+                    noise_map=masked_imaging_7x7.noise_map,
+                    use_cache=False,
+                )
+                inversion_via_cache = inversion_from(
+                    coefficient=coefficient,
+                    noise_map=masked_imaging_7x7.noise_map,
+                    use_cache=True,
+                )
+
+                assert inversion_via_cache.reconstruction == pytest.approx(
+                    inversion.reconstruction, 1.0e-8
+                )
+                assert inversion_via_cache.curvature_reg_matrix == pytest.approx(
+                    inversion.curvature_reg_matrix, 1.0e-8
+                )
+
+                if mapper is not None:
+                    assert inversion_via_cache.mapper is mapper
+
+                mapper = inversion_via_cache.mapper
+
+            curvature_matrix = cache["curvature_matrix"]
+
+            noise_map = 2.0 * masked_imaging_7x7.noise_map
+
+            inversion = inversion_from(
+                coefficient=1.0, noise_map=noise_map, use_cache=False
+            )
+            inversion_via_cache = inversion_from(
+                coefficient=1.0, noise_map=noise_map, use_cache=True
+            )
+
+            assert inversion_via_cache.curvature_reg_matrix == pytest.approx(
+                inversion.curvature_reg_matrix, 1.0e-8
+            )
+            assert inversion_via_cache.mapper is mapper
+            assert cache["curvature_matrix"] is not curvature_matrix
+
         def test__x1_inversion_interferometer_in_tracer__performs_inversion_correctly(
             self, sub_grid_7x7, masked_interferometer_7
         ):
@@ -3225,6 +3961,59 @@ class TestTracer:
         )
 
 
+class TestTracerTemplate:
+    def test__tracer_from_galaxies__same_planes_as_tracer_from_galaxies(self):
+
+        galaxies = [
+            al.Galaxy(redshift=1.0, light=al.lp.SphericalSersic(intensity=1.0)),
+            al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)),
+            al.Galaxy(redshift=2.0),
+            al.Galaxy(redshift=0.5, light=al.lp.SphericalSersic(intensity=2.0)),
+        ]
+
+        tracer_template = ray_tracing.TracerTemplate(galaxies=galaxies)
+
+        assert tracer_template.plane_redshifts == [0.5, 1.0, 2.0]
+        assert tracer_template.plane_galaxy_indexes == [[1, 3], [0], [2]]
+
+        tracer = tracer_template.tracer_from_galaxies(galaxies=galaxies)
+        tracer_via_galaxies = al.Tracer.from_galaxies(galaxies=galaxies)
+
+        assert tracer.plane_redshifts == tracer_via_galaxies.plane_redshifts
+
+        for plane, plane_via_galaxies in zip(tracer.planes, tracer_via_galaxies.planes):
+            assert plane.galaxies == plane_via_galaxies.galaxies
+
+    def test__galaxy_attributes__set_on_galaxies_of_tracer(self):
+
+        galaxies = [al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+
+        tracer_template = ray_tracing.TracerTemplate(
+            galaxies=galaxies, galaxy_attributes={1: {"hyper_galaxy_image": 2.0}}
+        )
+
+        galaxies = [al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+
+        tracer = tracer_template.tracer_from_galaxies(galaxies=galaxies)
+
+        assert tracer.planes[0].galaxies[0].hyper_galaxy_image is None
+        assert tracer.planes[1].galaxies[0].hyper_galaxy_image == 2.0
+
+    def test__is_template_of__false_if_redshifts_differ(self):
+
+        tracer_template = ray_tracing.TracerTemplate(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+
+        assert tracer_template.is_template_of(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+        assert not tracer_template.is_template_of(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=2.0)]
+        )
+        assert not tracer_template.is_template_of(galaxies=[al.Galaxy(redshift=0.5)])
+
+
 class TestTacerFixedSlices:
     def test__6_galaxies__tracer_planes_are_correct(self, sub_grid_7x7):
         lens_g0 = al.Galaxy(redshift=0.5)
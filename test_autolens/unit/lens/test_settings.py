@@ -21,6 +21,20 @@ class TestTags:
         settings = al.SettingsLens(stochastic_likelihood_resamples=3)
         assert settings.stochastic_likelihood_resamples_tag == "__lh_resamples_3"
 
+    def test__log_likelihood_threshold_tag(self):
+
+        settings = al.SettingsLens(log_likelihood_threshold=None)
+        assert settings.log_likelihood_threshold_tag == ""
+        settings = al.SettingsLens(log_likelihood_threshold=-100.0)
+        assert settings.log_likelihood_threshold_tag == "__lh_threshold_-100.0"
+
+    def test__pixelization_minimum_coverage_tag(self):
+
+        settings = al.SettingsLens(pixelization_minimum_coverage=None)
+        assert settings.pixelization_minimum_coverage_tag == ""
+        settings = al.SettingsLens(pixelization_minimum_coverage=0.5)
+        assert settings.pixelization_minimum_coverage_tag == "__pix_coverage_0.5"
+
     def test__tag(self):
 
         settings = al.SettingsLens(
@@ -38,6 +52,13 @@ class TestTags:
         )
         assert settings.tag == "lens[pos_on__lh_resamples_2]"
 
+        settings = al.SettingsLens(
+            positions_threshold=1.0,
+            log_likelihood_threshold=-100.0,
+            pixelization_minimum_coverage=0.5,
+        )
+        assert settings.tag == "lens[pos_on__lh_threshold_-100.0__pix_coverage_0.5]"
+
 
 class TestCheckPositionsTrace:
     def test__positions_do_not_trace_within_threshold__raises_exception(self,):
@@ -80,3 +101,100 @@ class TestCheckPositionsTrace:
         settings.check_positions_trace_within_threshold_via_tracer(
             tracer=tracer, positions=al.GridIrregularGrouped([[(1.0, 1.0), (2.0, 2.0)]])
         )
+
+
+class TestCheckLogLikelihoodUpperBound:
+    def test__upper_bound_below_threshold__raises_exception(self):
+
+        settings = al.SettingsLens(log_likelihood_threshold=None)
+        settings.check_log_likelihood_upper_bound(log_likelihood_upper_bound=-1.0e8)
+
+        settings = al.SettingsLens(log_likelihood_threshold=-100.0)
+        settings.check_log_likelihood_upper_bound(log_likelihood_upper_bound=-99.0)
+
+        with pytest.raises(exc.LikelihoodException):
+            settings.check_log_likelihood_upper_bound(log_likelihood_upper_bound=-101.0)
+
+        with pytest.raises(exc.LikelihoodException):
+            settings.check_log_likelihood_upper_bound(
+                log_likelihood_upper_bound=float("nan")
+            )
+
+
+class TestCheckPixelizationCoverage:
+    def test__mapper_covers_too_few_source_pixels__raises_exception(
+        self, sub_grid_7x7
+    ):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.5),
+                al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(3, 3)),
+                    regularization=al.reg.Constant(),
+                ),
+            ]
+        )
+
+        settings_pixelization = al.SettingsPixelization()
+
+        assert tracer.pixelization_coverage_from_grid(
+            grid=sub_grid_7x7, settings_pixelization=settings_pixelization
+        ) == pytest.approx(1.0, 1.0e-4)
+
+        settings = al.SettingsLens(pixelization_minimum_coverage=0.5)
+        settings.check_pixelization_coverage_via_tracer(
+            grid=sub_grid_7x7,
+            tracer=tracer,
+            settings_pixelization=settings_pixelization,
+        )
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.5),
+                al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(30, 30)),
+                    regularization=al.reg.Constant(),
+                ),
+            ]
+        )
+
+        coverage = tracer.pixelization_coverage_from_grid(
+            grid=sub_grid_7x7, settings_pixelization=settings_pixelization
+        )
+
+        assert coverage < 0.5
+
+        with pytest.raises(exc.PixelizationException):
+            settings.check_pixelization_coverage_via_tracer(
+                grid=sub_grid_7x7,
+                tracer=tracer,
+                settings_pixelization=settings_pixelization,
+            )
+
+        # The mapper which is checked is reused by the inversion.
+
+        mappers_of_planes = tracer.mappers_of_planes_from_grid(
+            grid=sub_grid_7x7, settings_pixelization=settings_pixelization
+        )
+
+        assert (
+            tracer.mappers_of_planes_from_grid(
+                grid=sub_grid_7x7, settings_pixelization=settings_pixelization
+            )
+            is mappers_of_planes
+        )
+
+        # No pixelization - doesnt raise exception
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+
+        settings.check_pixelization_coverage_via_tracer(
+            grid=sub_grid_7x7,
+            tracer=tracer,
+            settings_pixelization=settings_pixelization,
+        )
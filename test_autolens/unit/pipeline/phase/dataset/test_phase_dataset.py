@@ -480,6 +480,313 @@ class TestAutoPositions:
         assert analysis.settings.settings_lens.positions_threshold == None
 
 
+class TestPreloads:
+    def test__mass_is_model__true_if_mass_profile_or_redshift_has_free_parameters(
+        self
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal),
+                source=al.Galaxy(redshift=1.0),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        assert phase_imaging_7x7.mass_is_model is True
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic,
+                    mass=al.mp.SphericalIsothermal(),
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            settings=al.SettingsPhaseImaging(),
+            search=mock.MockSearch(),
+        )
+
+        assert phase_imaging_7x7.mass_is_model is False
+
+        lens = al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal())
+        lens.redshift = af.UniformPrior(lower_limit=0.1, upper_limit=0.9)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(lens=lens, source=al.Galaxy(redshift=1.0)),
+            search=mock.MockSearch(),
+        )
+
+        assert phase_imaging_7x7.mass_is_model is True
+
+    def test__modify_settings__preloads_traced_grids_if_mass_is_fixed(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            settings=al.SettingsPhaseImaging(),
+            search=mock.MockSearch(),
+        )
+
+        phase_imaging_7x7.modify_settings(
+            dataset=imaging_7x7, results=mock.MockResults()
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.settings.settings_lens.preload_traced_grids_of_planes is True
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([0.5] * 7)
+
+        tracer_0 = analysis.tracer_for_instance(instance=instance)
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([0.6] * 7)
+
+        tracer_1 = analysis.tracer_for_instance(instance=instance)
+
+        assert (
+            tracer_0._traced_grids_of_planes_cache
+            is tracer_1._traced_grids_of_planes_cache
+        )
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal),
+                source=al.Galaxy(redshift=1.0),
+            ),
+            settings=al.SettingsPhaseImaging(),
+            search=mock.MockSearch(),
+        )
+
+        phase_imaging_7x7.modify_settings(
+            dataset=imaging_7x7, results=mock.MockResults()
+        )
+
+        assert (
+            phase_imaging_7x7.settings.settings_lens.preload_traced_grids_of_planes
+            is False
+        )
+
+    def test__has_galaxy_with_fixed_light__true_if_a_galaxy_has_no_free_light_parameters(
+        self
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic,
+                    mass=al.mp.SphericalIsothermal(),
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        assert phase_imaging_7x7.has_galaxy_with_fixed_light is False
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(),
+                    mass=al.mp.SphericalIsothermal,
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        assert phase_imaging_7x7.has_galaxy_with_fixed_light is True
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic()),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        assert phase_imaging_7x7.has_galaxy_with_fixed_light is True
+
+    def test__modify_settings__preloads_blurred_images_of_galaxies_if_light_is_fixed(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=1.0),
+                    mass=al.mp.SphericalIsothermal,
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            settings=al.SettingsPhaseImaging(),
+            search=mock.MockSearch(),
+        )
+
+        phase_imaging_7x7.modify_settings(
+            dataset=imaging_7x7, results=mock.MockResults()
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.settings.settings_lens.preload_traced_grids_of_planes is False
+        assert analysis.settings.settings_lens.preload_blurred_images_of_galaxies is True
+
+        prior_count = phase_imaging_7x7.model.prior_count
+
+        for value in [0.4, 0.5, 0.6]:
+
+            instance = phase_imaging_7x7.model.instance_from_unit_vector(
+                [value] * prior_count
+            )
+
+            figure_of_merit = analysis.log_likelihood_function(instance=instance)
+
+            fit = al.FitImaging(
+                masked_imaging=analysis.masked_imaging,
+                tracer=al.Tracer.from_galaxies(galaxies=instance.galaxies),
+            )
+
+            assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+        assert analysis.blurred_images_of_galaxies_cache[(0, 0)][2] is not None
+
+    def test__modify_settings__preloads_inversion_matrices_if_mass_is_fixed(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                source=al.GalaxyModel(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(3, 3)),
+                    regularization=al.reg.Constant,
+                ),
+            ),
+            settings=al.SettingsPhaseImaging(),
+            search=mock.MockSearch(),
+        )
+
+        phase_imaging_7x7.modify_settings(
+            dataset=imaging_7x7, results=mock.MockResults()
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.settings.settings_lens.preload_inversion_matrices is True
+
+        for value in [0.4, 0.5, 0.6]:
+
+            instance = phase_imaging_7x7.model.instance_from_unit_vector([value])
+
+            figure_of_merit = analysis.log_likelihood_function(instance=instance)
+
+            fit = al.FitImaging(
+                masked_imaging=analysis.masked_imaging,
+                tracer=al.Tracer.from_galaxies(galaxies=instance.galaxies),
+                settings_pixelization=analysis.settings.settings_pixelization,
+                settings_inversion=analysis.settings.settings_inversion,
+            )
+
+            assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+        assert analysis.inversion_matrices_cache["mapper"] is not None
+
+    def test__modify_settings__preloads_deflections_of_galaxies_if_macro_mass_is_fixed(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=0.1),
+                    mass=al.mp.EllipticalIsothermal(einstein_radius=1.0),
+                ),
+                subhalo=al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal),
+                source=al.Galaxy(
+                    redshift=1.0, light=al.lp.EllipticalSersic(intensity=0.1)
+                ),
+            ),
+            settings=al.SettingsPhaseImaging(),
+            search=mock.MockSearch(),
+        )
+
+        phase_imaging_7x7.modify_settings(
+            dataset=imaging_7x7, results=mock.MockResults()
+        )
+
+        assert phase_imaging_7x7.mass_is_model is True
+        assert phase_imaging_7x7.has_galaxy_with_fixed_mass is True
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.settings.settings_lens.preload_deflections_of_galaxies is True
+
+        for value in [0.4, 0.5, 0.6]:
+
+            instance = phase_imaging_7x7.model.instance_from_unit_vector([value] * 3)
+
+            figure_of_merit = analysis.log_likelihood_function(instance=instance)
+
+            fit = al.FitImaging(
+                masked_imaging=analysis.masked_imaging,
+                tracer=al.Tracer.from_galaxies(galaxies=instance.galaxies),
+            )
+
+            assert figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+        assert len(analysis.deflections_of_galaxies_cache) > 0
+
+    def test__settings_lens__deflections_interpolate_accuracy_passed_to_tracers(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal),
+                source=al.Galaxy(
+                    redshift=1.0, light=al.lp.EllipticalSersic(intensity=0.1)
+                ),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_lens=al.SettingsLens(deflections_interpolate_accuracy=0.01)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        phase_imaging_7x7.modify_settings(
+            dataset=imaging_7x7, results=mock.MockResults()
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([0.5] * 3)
+
+        tracer = analysis.tracer_for_instance(instance=instance)
+
+        assert tracer.deflections_interpolate_accuracy == 0.01
+
+
 class TestExtensions:
     def test__extend_with_stochastic_phase__sets_up_model_correctly(self, mask_7x7):
         galaxies = af.ModelInstance()
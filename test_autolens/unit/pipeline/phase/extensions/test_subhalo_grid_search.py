@@ -0,0 +1,185 @@
+import shutil
+
+import pytest
+
+import autofit as af
+import autolens as al
+from autolens import exc
+from autofit.mock.mock import MockAnalysis, MockSearch
+
+
+def make_model(subhalo_prior_limits):
+
+    lens = al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0))
+
+    subhalo = al.GalaxyModel(redshift=0.5, mass=al.mp.SphericalIsothermal)
+    subhalo.mass.centre_0 = af.UniformPrior(*subhalo_prior_limits)
+    subhalo.mass.centre_1 = af.UniformPrior(*subhalo_prior_limits)
+
+    model = af.ModelMapper()
+    model.galaxies = af.CollectionPriorModel(lens=lens, subhalo=subhalo)
+
+    return model, [subhalo.mass.centre_0, subhalo.mass.centre_1]
+
+
+class InterruptedAnalysis(MockAnalysis):
+    def __init__(self, number_of_fits):
+
+        super().__init__()
+
+        self.number_of_fits = number_of_fits
+
+    def log_likelihood_function(self, instance):
+
+        if len(self.fit_instances) == self.number_of_fits:
+            raise KeyboardInterrupt
+
+        return super().log_likelihood_function(instance=instance)
+
+
+class TestGridSearchSubhalo:
+    def test__einstein_ring_from_model__uses_inputs_else_largest_einstein_radius(
+        self
+    ):
+
+        model, grid_priors = make_model(subhalo_prior_limits=(-3.0, 3.0))
+
+        grid_search = al.GridSearchSubhalo(
+            paths=af.Paths(name="subhalo_grid_search"), search=MockSearch()
+        )
+
+        assert grid_search.einstein_ring_from_model(
+            model=model, grid_priors=grid_priors
+        ) == (1.0, (0.0, 0.0))
+
+        grid_search = al.GridSearchSubhalo(
+            paths=af.Paths(name="subhalo_grid_search"),
+            search=MockSearch(),
+            einstein_radius=2.0,
+            centre=(0.1, 0.1),
+        )
+
+        assert grid_search.einstein_ring_from_model(
+            model=model, grid_priors=grid_priors
+        ) == (2.0, (0.1, 0.1))
+
+    def test__cell_order_from__cells_on_einstein_ring_first(self):
+
+        model, grid_priors = make_model(subhalo_prior_limits=(-3.0, 3.0))
+
+        grid_search = al.GridSearchSubhalo(
+            paths=af.Paths(name="subhalo_grid_search"),
+            search=MockSearch(),
+            number_of_steps=5,
+        )
+
+        grid_priors = sorted(grid_priors, key=lambda prior: prior.id)
+
+        cell_order = grid_search.cell_order_from(
+            physical_lists=grid_search.make_physical_lists(grid_priors),
+            grid_priors=grid_priors,
+            model=model,
+        )
+
+        assert sorted(cell_order) == list(range(25))
+        assert sorted(cell_order[0:4]) == [7, 11, 13, 17]
+        assert sorted(cell_order[4:8]) == [6, 8, 16, 18]
+        assert set(cell_order[-4:]) == {0, 4, 20, 24}
+
+    def test__fit__completed_cells_are_recorded_and_not_refitted(self):
+
+        model, grid_priors = make_model(subhalo_prior_limits=(0.0, 1.0))
+
+        grid_search = al.GridSearchSubhalo(
+            paths=af.Paths(name="subhalo_grid_search_resume"),
+            search=MockSearch(),
+            number_of_steps=2,
+            number_of_cores=1,
+        )
+
+        shutil.rmtree(grid_search.paths.output_path, ignore_errors=True)
+
+        analysis = MockAnalysis()
+
+        result = grid_search.fit(
+            model=model, analysis=analysis, grid_priors=grid_priors
+        )
+
+        assert len(result.results) == 4
+        assert len(analysis.fit_instances) == 4
+        assert sorted(grid_search.completed_cells()) == [0, 1, 2, 3]
+
+        analysis = MockAnalysis()
+
+        result = grid_search.fit(
+            model=model, analysis=analysis, grid_priors=grid_priors
+        )
+
+        assert len(result.results) == 4
+        assert len(analysis.fit_instances) == 0
+
+    def test__fit__interrupted_and_resumed__only_cells_not_completed_are_fitted(
+        self, monkeypatch
+    ):
+
+        model, grid_priors = make_model(subhalo_prior_limits=(0.0, 1.0))
+
+        grid_search = al.GridSearchSubhalo(
+            paths=af.Paths(name="subhalo_grid_search_interrupted"),
+            search=MockSearch(),
+            number_of_steps=2,
+            number_of_cores=1,
+        )
+
+        shutil.rmtree(grid_search.paths.output_path, ignore_errors=True)
+
+        with pytest.raises(KeyboardInterrupt):
+            grid_search.fit(
+                model=model,
+                analysis=InterruptedAnalysis(number_of_fits=3),
+                grid_priors=grid_priors,
+            )
+
+        assert len(grid_search.completed_cells()) == 3
+
+        searches_fitted = []
+
+        def fit(search, model, analysis, **kwargs):
+            searches_fitted.append(search)
+            return af.NonLinearSearch.fit(search, model=model, analysis=analysis)
+
+        monkeypatch.setattr(MockSearch, "fit", fit)
+
+        analysis = MockAnalysis()
+
+        result = grid_search.fit(
+            model=model, analysis=analysis, grid_priors=grid_priors
+        )
+
+        assert len(searches_fitted) == 1
+        assert len(analysis.fit_instances) == 1
+        assert all(isinstance(cell, af.Result) for cell in result.results)
+        assert sorted(grid_search.completed_cells()) == [0, 1, 2, 3]
+
+    def test__fit__parallel_cells_with_parallel_search__raises_exception(self):
+
+        model, grid_priors = make_model(subhalo_prior_limits=(0.0, 1.0))
+
+        search = MockSearch()
+        search.number_of_cores = 2
+
+        grid_search = al.GridSearchSubhalo(
+            paths=af.Paths(name="subhalo_grid_search_parallel_search"),
+            search=search,
+            number_of_steps=2,
+            number_of_cores=2,
+        )
+
+        shutil.rmtree(grid_search.paths.output_path, ignore_errors=True)
+
+        analysis = MockAnalysis()
+
+        with pytest.raises(exc.PhaseException):
+            grid_search.fit(model=model, analysis=analysis, grid_priors=grid_priors)
+
+        assert len(analysis.fit_instances) == 0
@@ -1,11 +1,15 @@
+import multiprocessing as mp
+import pickle
 from os import path
 
 import autofit as af
 import autolens as al
+from autoarray import exc as aa_exc
 from autolens import exc
 import pytest
 from astropy import cosmology as cosmo
-from autolens.fit.fit import FitImaging
+from autolens.fit.fit import FitImaging, log_likelihood_upper_bound_imaging_from
+from autolens.lens import ray_tracing
 from autolens.mock import mock
 import numpy as np
 
@@ -18,6 +22,10 @@ pytestmark = pytest.mark.filterwarnings(
 directory = path.dirname(path.realpath(__file__))
 
 
+def log_likelihood_in_process(analysis, instance):
+    return analysis.log_likelihood_function(instance=instance)
+
+
 class TestLogLikelihoodFunction:
     def test__positions_do_not_trace_within_threshold__raises_exception(
         self, phase_imaging_7x7, imaging_7x7, mask_7x7
@@ -44,6 +52,275 @@ class TestLogLikelihoodFunction:
         with pytest.raises(exc.RayTracingException):
             analysis.log_likelihood_function(instance=instance)
 
+    def test__likelihood_stages__calls_and_rejections_of_every_stage_recorded(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        imaging_7x7.positions = al.GridIrregularGrouped([[(1.0, 100.0), (200.0, 2.0)]])
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=0.1),
+                    mass=al.mp.SphericalIsothermal(),
+                ),
+                source=al.Galaxy(redshift=1.0),
+            ),
+            settings=al.SettingsPhaseImaging(),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([])
+
+        analysis.log_likelihood_function(instance=instance)
+
+        assert analysis.likelihood_stages.calls == {"positions": 1, "fit": 1}
+        assert analysis.likelihood_stages.rejections == {"positions": 0, "fit": 0}
+
+        analysis.settings.settings_lens = al.SettingsLens(positions_threshold=0.01)
+
+        with pytest.raises(exc.RayTracingException):
+            analysis.log_likelihood_function(instance=instance)
+
+        assert analysis.likelihood_stages.calls == {"positions": 2, "fit": 1}
+        assert analysis.likelihood_stages.rejections == {"positions": 1, "fit": 0}
+
+    def test__log_likelihood_upper_bound_below_threshold__rejected_before_fit(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=0.1),
+                    mass=al.mp.SphericalIsothermal(),
+                ),
+                source=al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(3, 3)),
+                    regularization=al.reg.Constant(),
+                ),
+            ),
+            hyper_background_noise=al.hyper_data.HyperBackgroundNoise(
+                noise_scale=1.0
+            ),
+            settings=al.SettingsPhaseImaging(),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([])
+
+        log_evidence = analysis.log_likelihood_function(instance=instance)
+
+        log_likelihood_upper_bound = log_likelihood_upper_bound_imaging_from(
+            masked_imaging=analysis.masked_dataset,
+            tracer=analysis.tracer_for_instance(instance=instance),
+            hyper_background_noise=instance.hyper_background_noise,
+        )
+
+        assert log_evidence < log_likelihood_upper_bound
+
+        analysis.settings.settings_lens = al.SettingsLens(
+            log_likelihood_threshold=log_likelihood_upper_bound - 1.0
+        )
+
+        assert analysis.log_likelihood_function(
+            instance=instance
+        ) == pytest.approx(log_evidence, 1.0e-4)
+
+        analysis.settings.settings_lens = al.SettingsLens(
+            log_likelihood_threshold=log_likelihood_upper_bound + 1.0
+        )
+
+        with pytest.raises(exc.LikelihoodException):
+            analysis.log_likelihood_function(instance=instance)
+
+        assert analysis.likelihood_stages.calls == {
+            "positions": 3,
+            "fit": 2,
+            "upper_bound": 2,
+        }
+        assert analysis.likelihood_stages.rejections == {
+            "positions": 0,
+            "fit": 0,
+            "upper_bound": 1,
+        }
+
+    def test__pixelization_coverage_below_minimum__rejected_before_inversion(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                source=al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(30, 30)),
+                    regularization=al.reg.Constant(),
+                ),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_lens=al.SettingsLens(pixelization_minimum_coverage=0.5)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([])
+
+        with pytest.raises(exc.PixelizationException):
+            analysis.log_likelihood_function(instance=instance)
+
+        assert analysis.likelihood_stages.calls == {
+            "positions": 1,
+            "pixelization_coverage": 1,
+        }
+        assert analysis.likelihood_stages.rejections == {
+            "positions": 0,
+            "pixelization_coverage": 1,
+        }
+
+
+class TestLogLikelihoodFunctionBatch:
+    def test__batch_matches_log_likelihood_function_of_every_instance(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.SphericalSersic,
+                    mass=al.mp.SphericalIsothermal,
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.SphericalSersic),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_masked_imaging=al.SettingsMaskedImaging(sub_size=2)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [0.1 * i] * phase_imaging_7x7.model.prior_count
+            )
+            for i in range(1, 5)
+        ]
+
+        log_likelihoods = analysis.log_likelihood_function_batch(instances=instances)
+
+        assert log_likelihoods.shape == (4,)
+
+        for instance, log_likelihood in zip(instances, log_likelihoods):
+            assert log_likelihood == pytest.approx(
+                analysis.log_likelihood_function(instance=instance), 1.0e-8
+            )
+
+    def test__instance_raising_fit_exception__log_likelihood_is_minus_infinity(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        imaging_7x7.positions = al.GridIrregularGrouped([[(1.0, 100.0), (200.0, 2.0)]])
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                source=al.Galaxy(redshift=1.0),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_lens=al.SettingsLens(positions_threshold=0.01)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([])
+
+        log_likelihoods = analysis.log_likelihood_function_batch(
+            instances=[instance, instance]
+        )
+
+        assert (log_likelihoods == -np.inf).all()
+
+    def test__instance_raising_grid_exception_in_batch__only_that_instance_is_minus_infinity(
+        self, imaging_7x7, mask_7x7, monkeypatch
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.SphericalSersic,
+                    mass=al.mp.SphericalIsothermal,
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.SphericalSersic),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_masked_imaging=al.SettingsMaskedImaging(sub_size=2)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(
+                [0.1 * i] * phase_imaging_7x7.model.prior_count
+            )
+            for i in range(1, 5)
+        ]
+
+        failing_tracer_intensity = instances[2].galaxies.lens.light.intensity
+
+        blurred_images_from = (
+            ray_tracing.blurred_images_of_tracers_from_grid_and_convolver
+        )
+
+        def blurred_images_or_exception_from(tracers, **kwargs):
+
+            for tracer in tracers:
+
+                lens_intensity = tracer.planes[0].galaxies[0].light.intensity
+
+                if lens_intensity == failing_tracer_intensity:
+                    raise aa_exc.GridException
+
+            return blurred_images_from(tracers=tracers, **kwargs)
+
+        monkeypatch.setattr(
+            ray_tracing,
+            "blurred_images_of_tracers_from_grid_and_convolver",
+            blurred_images_or_exception_from,
+        )
+
+        log_likelihoods = analysis.log_likelihood_function_batch(instances=instances)
+
+        assert log_likelihoods[2] == -np.inf
+
+        for index in [0, 1, 3]:
+            assert log_likelihoods[index] == pytest.approx(
+                analysis.log_likelihood_function(instance=instances[index]), 1.0e-8
+            )
+
 
 class TestFit:
     def test__fit_using_imaging(self, imaging_7x7, mask_7x7, samples_with_result):
@@ -92,7 +369,7 @@ class TestFit:
 
         fit = al.FitImaging(masked_imaging=masked_imaging, tracer=tracer)
 
-        assert fit.log_likelihood == fit_figure_of_merit
+        assert fit.log_likelihood == pytest.approx(fit_figure_of_merit, 1.0e-8)
 
     def test__figure_of_merit__includes_hyper_image_and_noise__matches_fit(
         self, imaging_7x7, mask_7x7
@@ -135,7 +412,7 @@ class TestFit:
             hyper_background_noise=hyper_background_noise,
         )
 
-        assert fit.log_likelihood == fit_figure_of_merit
+        assert fit.log_likelihood == pytest.approx(fit_figure_of_merit, 1.0e-8)
 
     def test__uses_hyper_fit_correctly(self, masked_imaging_7x7):
 
@@ -197,6 +474,93 @@ class TestFit:
         assert (fit.tracer.galaxies[0].hyper_galaxy_image == lens_hyper_image).all()
         assert fit_likelihood == fit.log_likelihood
 
+    def test__tracer_for_instance__reuses_tracer_template_and_associates_hyper_images(
+        self, masked_imaging_7x7
+    ):
+
+        lens_hyper_image = al.Array.ones(shape_2d=(3, 3), pixel_scales=0.1)
+        hyper_model_image = al.Array.full(
+            fill_value=0.5, shape_2d=(3, 3), pixel_scales=0.1
+        )
+
+        results = mock.MockResults(
+            use_as_hyper_dataset=True,
+            hyper_galaxy_image_path_dict={("galaxies", "lens"): lens_hyper_image},
+            hyper_model_image=hyper_model_image,
+        )
+
+        analysis = al.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=al.SettingsPhaseImaging(),
+            results=results,
+            cosmology=cosmo.Planck15,
+        )
+
+        def instance_from(lens_redshift):
+
+            instance = af.ModelInstance()
+            instance.galaxies = af.ModelInstance()
+            instance.galaxies.lens = al.Galaxy(redshift=lens_redshift)
+            instance.galaxies.source = al.Galaxy(redshift=1.0)
+
+            return instance
+
+        tracer = analysis.tracer_for_instance(instance=instance_from(lens_redshift=0.5))
+
+        tracer_template = analysis.tracer_template
+
+        tracer = analysis.tracer_for_instance(instance=instance_from(lens_redshift=0.5))
+
+        assert analysis.tracer_template is tracer_template
+        assert tracer.plane_redshifts == [0.5, 1.0]
+        assert (tracer.galaxies[0].hyper_galaxy_image == lens_hyper_image).all()
+        assert (tracer.galaxies[0].hyper_model_image == hyper_model_image).all()
+        assert tracer.galaxies[1].hyper_galaxy_image is None
+
+        tracer = analysis.tracer_for_instance(instance=instance_from(lens_redshift=0.6))
+
+        assert analysis.tracer_template is not tracer_template
+        assert tracer.plane_redshifts == [0.6, 1.0]
+
+    def test__preload_traced_grids_of_planes__figure_of_merit_unchanged(
+        self, imaging_7x7, mask_7x7
+    ):
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            settings=al.SettingsPhaseImaging(),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector([value] * 7)
+            for value in [0.4, 0.5, 0.6]
+        ]
+
+        figures_of_merit = [
+            analysis.log_likelihood_function(instance=instance)
+            for instance in instances
+        ]
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+        analysis.settings.settings_lens = analysis.settings.settings_lens.modify_preload(
+            preload_traced_grids_of_planes=True
+        )
+
+        assert [
+            analysis.log_likelihood_function(instance=instance)
+            for instance in instances
+        ] == figures_of_merit
+
     def test__figure_of_merit__with_stochastic_likelihood_resamples_matches_galaxy_profiles(
         self, masked_imaging_7x7
     ):
@@ -317,3 +681,148 @@ class TestFit:
 
         assert len(log_evidences) == 2
         assert log_evidences[0] != log_evidences[1]
+
+    def test__stochastic_log_evidences__preloaded_sparse_grids__log_evidences_differ(
+        self, masked_imaging_7x7
+    ):
+
+        galaxies = af.ModelInstance()
+        galaxies.lens = al.Galaxy(
+            redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.2)
+        )
+        galaxies.source = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.VoronoiBrightnessImage(pixels=5),
+            regularization=al.reg.Constant(),
+        )
+
+        instance = af.ModelInstance()
+        instance.galaxies = galaxies
+
+        source_hyper_image = al.Array.ones(shape_2d=(3, 3), pixel_scales=0.1)
+        source_hyper_image[4] = 10.0
+        hyper_model_image = al.Array.full(
+            fill_value=0.5, shape_2d=(3, 3), pixel_scales=0.1
+        )
+
+        results = mock.MockResults(
+            use_as_hyper_dataset=True,
+            hyper_galaxy_image_path_dict={("galaxies", "source"): source_hyper_image},
+            hyper_model_image=hyper_model_image,
+        )
+
+        analysis = al.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=al.SettingsPhaseImaging(
+                settings_lens=al.SettingsLens(stochastic_samples=3)
+            ),
+            results=results,
+            cosmology=cosmo.Planck15,
+        )
+
+        tracer = analysis.tracer_for_instance(
+            instance=analysis.associate_hyper_images(instance=instance)
+        )
+
+        analysis.settings.settings_pixelization = al.SettingsPixelization(
+            preload_sparse_grids_of_planes=tracer.sparse_image_plane_grids_of_planes_from_grid(
+                grid=masked_imaging_7x7.grid
+            )
+        )
+
+        np.random.seed(1)
+        log_evidences = analysis.stochastic_log_evidences_for_instance(
+            instance=instance
+        )
+
+        assert len(log_evidences) == 3
+        assert len(set(log_evidences)) > 1
+
+    def test__stochastic_number_of_cores_above_1__same_results_as_serial(
+        self, masked_imaging_7x7
+    ):
+
+        galaxies = af.ModelInstance()
+        galaxies.lens = al.Galaxy(
+            redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.2)
+        )
+        galaxies.source = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.VoronoiBrightnessImage(pixels=5),
+            regularization=al.reg.Constant(),
+        )
+
+        instance = af.ModelInstance()
+        instance.galaxies = galaxies
+
+        source_hyper_image = al.Array.ones(shape_2d=(3, 3), pixel_scales=0.1)
+        source_hyper_image[4] = 10.0
+        hyper_model_image = al.Array.full(
+            fill_value=0.5, shape_2d=(3, 3), pixel_scales=0.1
+        )
+
+        results = mock.MockResults(
+            use_as_hyper_dataset=True,
+            hyper_galaxy_image_path_dict={("galaxies", "source"): source_hyper_image},
+            hyper_model_image=hyper_model_image,
+        )
+
+        analysis_serial = al.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=al.SettingsPhaseImaging(
+                settings_lens=al.SettingsLens(
+                    stochastic_likelihood_resamples=3, stochastic_samples=4
+                )
+            ),
+            results=results,
+            cosmology=cosmo.Planck15,
+        )
+
+        analysis_parallel = al.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=al.SettingsPhaseImaging(
+                settings_lens=al.SettingsLens(
+                    stochastic_likelihood_resamples=3,
+                    stochastic_samples=4,
+                    stochastic_number_of_cores=2,
+                )
+            ),
+            results=results,
+            cosmology=cosmo.Planck15,
+        )
+
+        log_likelihood = analysis_serial.log_likelihood_function(instance=instance)
+
+        assert analysis_parallel.log_likelihood_function(
+            instance=instance
+        ) == pytest.approx(log_likelihood, 1.0e-8)
+
+        stochastic_pool = analysis_parallel.stochastic_pool
+
+        assert stochastic_pool is not None
+        assert analysis_parallel.log_likelihood_function(
+            instance=instance
+        ) == pytest.approx(log_likelihood, 1.0e-8)
+        assert analysis_parallel.stochastic_pool is stochastic_pool
+
+        assert pickle.loads(pickle.dumps(analysis_parallel)).stochastic_pool is None
+
+        # Processes of a pool (e.g. those of a parallel non-linear search) cannot create a pool, thus the fits are
+        # performed serially in them.
+
+        with mp.Pool(processes=1) as pool:
+            assert pool.apply(
+                log_likelihood_in_process, (analysis_parallel, instance)
+            ) == pytest.approx(log_likelihood, 1.0e-8)
+
+        np.random.seed(1)
+        log_evidences_serial = analysis_serial.stochastic_log_evidences_for_instance(
+            instance=instance
+        )
+        np.random.seed(1)
+        log_evidences_parallel = analysis_parallel.stochastic_log_evidences_for_instance(
+            instance=instance
+        )
+
+        assert log_evidences_parallel == pytest.approx(log_evidences_serial, 1.0e-8)
+        assert len(log_evidences_parallel) == 4
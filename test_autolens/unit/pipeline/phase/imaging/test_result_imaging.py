@@ -35,10 +35,69 @@ class TestImagePassing:
 
         result.instance.galaxies.lens = al.Galaxy(redshift=0.5)
 
+        assert result.image_galaxy_dict is image_dict
+
+        result.clear_cache()
+
         image_dict = result.image_galaxy_dict
         assert (image_dict[("galaxies", "lens")].in_2d == np.zeros((7, 7))).all()
         assert isinstance(image_dict[("galaxies", "source")], np.ndarray)
 
+    def test__max_log_likelihood_tracer_and_fit__cached_until_cache_cleared(
+        self, masked_imaging_7x7
+    ):
+
+        galaxies = af.ModelInstance()
+        galaxies.lens = al.Galaxy(
+            redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+        )
+        galaxies.source = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.Rectangular(shape=(3, 3)),
+            regularization=al.reg.Constant(),
+        )
+
+        instance = af.ModelInstance()
+        instance.galaxies = galaxies
+
+        analysis = al.PhaseImaging.Analysis(
+            masked_imaging=masked_imaging_7x7,
+            settings=al.SettingsPhaseImaging(),
+            results=mock.MockResults(),
+            cosmology=cosmo.Planck15,
+        )
+
+        result = al.PhaseImaging.Result(
+            samples=mock.MockSamples(max_log_likelihood_instance=instance),
+            previous_model=af.ModelMapper(),
+            analysis=analysis,
+            search=None,
+        )
+
+        tracer = result.max_log_likelihood_tracer
+        fit = result.max_log_likelihood_fit
+
+        assert fit.tracer is tracer
+        assert result.max_log_likelihood_tracer is tracer
+        assert result.max_log_likelihood_fit is fit
+        assert result.pixelization is galaxies.source.pixelization
+
+        hyper_galaxy_image_path_dict = result.hyper_galaxy_image_path_dict
+
+        assert (
+            result.image_galaxy_dict[("galaxies", "source")]
+            == fit.inversion.mapped_reconstructed_image
+        ).all()
+        assert hyper_galaxy_image_path_dict[("galaxies", "source")] is not (
+            result.image_galaxy_dict[("galaxies", "source")]
+        )
+
+        result.clear_cache()
+
+        assert result.max_log_likelihood_tracer is not tracer
+        assert result.max_log_likelihood_fit is not fit
+        assert result.max_log_likelihood_fit.figure_of_merit == fit.figure_of_merit
+
     def test__stochastic_log_evidences(self, masked_imaging_7x7):
 
         lens_hyper_image = al.Array.ones(shape_2d=(3, 3), pixel_scales=0.1)
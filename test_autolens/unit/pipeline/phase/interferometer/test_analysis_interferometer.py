@@ -6,7 +6,11 @@ from autolens import exc
 from autolens.mock import mock
 import pytest
 from astropy import cosmology as cosmo
-from autolens.fit.fit import FitInterferometer
+from autoarray import exc as aa_exc
+from autolens.fit.fit import (
+    FitInterferometer,
+    log_likelihood_upper_bound_interferometer_from,
+)
 
 pytestmark = pytest.mark.filterwarnings(
     "ignore:Using a non-tuple sequence for multidimensional indexing is deprecated; use `arr[tuple(seq)]` instead of "
@@ -47,6 +51,48 @@ class TestLogLikelihoodFunction:
         with pytest.raises(exc.RayTracingException):
             analysis.log_likelihood_function(instance=instance)
 
+    def test__log_likelihood_upper_bound_below_threshold__rejected_before_fit(
+        self, interferometer_7, mask_7x7, visibilities_mask_7
+    ):
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        phase_interferometer_7 = al.PhaseInterferometer(
+            galaxies=dict(
+                lens=al.Galaxy(
+                    redshift=0.5, light=al.lp.EllipticalSersic(intensity=0.1)
+                )
+            ),
+            hyper_background_noise=hyper_background_noise,
+            settings=al.SettingsPhaseInterferometer(),
+            search=mock.MockSearch("test_phase"),
+            real_space_mask=mask_7x7,
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7,
+            mask=visibilities_mask_7,
+            results=mock.MockResults(),
+        )
+        instance = phase_interferometer_7.model.instance_from_unit_vector([])
+
+        log_likelihood = analysis.log_likelihood_function(instance=instance)
+
+        log_likelihood_upper_bound = log_likelihood_upper_bound_interferometer_from(
+            masked_interferometer=analysis.masked_interferometer,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        assert log_likelihood < log_likelihood_upper_bound
+
+        analysis.settings.settings_lens = al.SettingsLens(
+            log_likelihood_threshold=log_likelihood_upper_bound + 1.0
+        )
+
+        with pytest.raises(exc.LikelihoodException):
+            analysis.log_likelihood_function(instance=instance)
+
+        assert analysis.likelihood_stages.rejections["upper_bound"] == 1
+
 
 class TestFit:
     def test__fit_using_interferometer(
@@ -108,7 +154,7 @@ class TestFit:
             masked_interferometer=masked_interferometer, tracer=tracer
         )
 
-        assert fit.log_likelihood == fit_figure_of_merit
+        assert fit.log_likelihood == pytest.approx(fit_figure_of_merit, 1.0e-8)
 
     def test__fit_figure_of_merit__includes_hyper_image_and_noise__matches_fit(
         self, interferometer_7, mask_7x7, visibilities_mask_7
@@ -154,7 +200,112 @@ class TestFit:
             hyper_background_noise=hyper_background_noise,
         )
 
-        assert fit.log_likelihood == fit_figure_of_merit
+        assert fit.log_likelihood == pytest.approx(fit_figure_of_merit, 1.0e-8)
+
+    def test__use_dirty_image__fit_figure_of_merit_matches_dirty_image_fit(
+        self, interferometer_7, mask_7x7, visibilities_mask_7
+    ):
+        lens_galaxy = al.Galaxy(
+            redshift=0.5, light=al.lp.EllipticalSersic(intensity=0.1)
+        )
+
+        phase_interferometer_7 = al.PhaseInterferometer(
+            galaxies=dict(lens=lens_galaxy),
+            settings=al.SettingsPhaseInterferometer(
+                settings_masked_interferometer=al.SettingsMaskedInterferometer(
+                    sub_size=2
+                ),
+                use_dirty_image=True,
+            ),
+            search=mock.MockSearch("test_phase"),
+            real_space_mask=mask_7x7,
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7,
+            mask=visibilities_mask_7,
+            results=mock.MockResults(),
+        )
+
+        assert analysis.masked_interferometer.dirty_image_interferometer is not None
+
+        instance = phase_interferometer_7.model.instance_from_unit_vector([])
+        fit_figure_of_merit = analysis.log_likelihood_function(instance=instance)
+
+        tracer = analysis.tracer_for_instance(instance=instance)
+
+        fit = al.FitInterferometerDirtyImage(
+            masked_interferometer=analysis.masked_interferometer, tracer=tracer
+        )
+
+        assert fit.log_likelihood == pytest.approx(fit_figure_of_merit, 1.0e-8)
+
+    def test__use_dirty_image__hyper_background_noise__fit_to_visibilities(
+        self, interferometer_7, mask_7x7, visibilities_mask_7
+    ):
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        lens_galaxy = al.Galaxy(
+            redshift=0.5, light=al.lp.EllipticalSersic(intensity=0.1)
+        )
+
+        phase_interferometer_7 = al.PhaseInterferometer(
+            galaxies=dict(lens=lens_galaxy),
+            hyper_background_noise=hyper_background_noise,
+            settings=al.SettingsPhaseInterferometer(use_dirty_image=True),
+            search=mock.MockSearch("test_phase"),
+            real_space_mask=mask_7x7,
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7,
+            mask=visibilities_mask_7,
+            results=mock.MockResults(),
+        )
+
+        instance = phase_interferometer_7.model.instance_from_unit_vector([])
+        fit_figure_of_merit = analysis.log_likelihood_function(instance=instance)
+
+        fit = FitInterferometer(
+            masked_interferometer=analysis.masked_interferometer,
+            tracer=analysis.tracer_for_instance(instance=instance),
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        assert fit.log_likelihood == pytest.approx(fit_figure_of_merit, 1.0e-8)
+
+    def test__use_dirty_image__grid_exception__raises_fit_exception(
+        self, interferometer_7, mask_7x7, visibilities_mask_7, monkeypatch
+    ):
+        lens_galaxy = al.Galaxy(
+            redshift=0.5, light=al.lp.EllipticalSersic(intensity=0.1)
+        )
+
+        phase_interferometer_7 = al.PhaseInterferometer(
+            galaxies=dict(lens=lens_galaxy),
+            settings=al.SettingsPhaseInterferometer(use_dirty_image=True),
+            search=mock.MockSearch("test_phase"),
+            real_space_mask=mask_7x7,
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7,
+            mask=visibilities_mask_7,
+            results=mock.MockResults(),
+        )
+
+        def fit_interferometer_dirty_image(masked_interferometer, tracer):
+            raise aa_exc.GridException
+
+        monkeypatch.setattr(
+            "autolens.fit.fit.FitInterferometerDirtyImage",
+            fit_interferometer_dirty_image,
+        )
+
+        instance = phase_interferometer_7.model.instance_from_unit_vector([])
+
+        with pytest.raises(af.exc.FitException):
+            analysis.log_likelihood_function(instance=instance)
 
     def test__stochastic_histogram_for_instance(self, masked_interferometer_7):
 
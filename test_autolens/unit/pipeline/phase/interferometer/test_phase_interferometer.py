@@ -4,6 +4,7 @@ import pytest
 
 import autofit as af
 import autolens as al
+from autolens import exc
 from autolens.mock import mock
 
 pytestmark = pytest.mark.filterwarnings(
@@ -84,6 +85,41 @@ class TestMakeAnalysis:
         assert analysis.masked_dataset.grid.sub_steps == [2]
         assert isinstance(analysis.masked_dataset.transformer, al.TransformerDFT)
 
+    def test__chunked_visibilities_with_pixelization__requires_w_tilde(
+        self, interferometer_7, mask_7x7, visibilities_mask_7
+    ):
+        phase_interferometer_7 = al.PhaseInterferometer(
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                source=al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(3, 3)),
+                    regularization=al.reg.Constant(),
+                ),
+            ),
+            settings=al.SettingsPhaseInterferometer(visibilities_chunk_size=3),
+            search=mock.MockSearch("phase_interferometer_7"),
+            real_space_mask=mask_7x7,
+        )
+
+        with pytest.raises(exc.PhaseException):
+            phase_interferometer_7.make_analysis(
+                dataset=interferometer_7,
+                mask=visibilities_mask_7,
+                results=mock.MockResults(),
+            )
+
+        phase_interferometer_7.settings.use_w_tilde = True
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer_7,
+            mask=visibilities_mask_7,
+            results=mock.MockResults(),
+        )
+
+        assert analysis.masked_interferometer.visibilities_chunk_size == 3
+        assert analysis.masked_interferometer.w_tilde is not None
+
     def test__masks_visibilities_and_noise_map_correctly(
         self, phase_interferometer_7, interferometer_7, visibilities_mask_7
     ):
@@ -109,3 +109,56 @@ def test__tag__mixture_of_values():
         "pix[use_border]__"
         "inv[lop]"
     )
+
+    settings = al.SettingsPhaseInterferometer(use_dirty_image=True)
+
+    assert (
+        settings.phase_tag_no_inversion == "settings__"
+        "interferometer[grid_sub_2__nufft]__"
+        "lens[pos_off]__"
+        "dirty"
+    )
+    assert (
+        settings.phase_tag_with_inversion == "settings__"
+        "interferometer[grid_sub_2_inv_sub_2__nufft]__"
+        "lens[pos_off]__"
+        "pix[use_border]__"
+        "inv[mat]"
+    )
+
+    settings = al.SettingsPhaseInterferometer(visibilities_chunk_size=1000)
+
+    assert (
+        settings.phase_tag_no_inversion == "settings__"
+        "interferometer[grid_sub_2__nufft]__"
+        "lens[pos_off]__"
+        "chunked"
+    )
+    assert (
+        settings.phase_tag_with_inversion == "settings__"
+        "interferometer[grid_sub_2_inv_sub_2__nufft]__"
+        "lens[pos_off]__"
+        "pix[use_border]__"
+        "inv[mat]__"
+        "chunked"
+    )
+
+    settings = al.SettingsPhaseInterferometer(
+        use_w_tilde=True, visibilities_chunk_size=1000
+    )
+
+    assert (
+        settings.phase_tag_no_inversion == "settings__"
+        "interferometer[grid_sub_2__nufft]__"
+        "lens[pos_off]__"
+        "chunked"
+    )
+    assert (
+        settings.phase_tag_with_inversion == "settings__"
+        "interferometer[grid_sub_2_inv_sub_2__nufft]__"
+        "lens[pos_off]__"
+        "pix[use_border]__"
+        "inv[mat]__"
+        "w_tilde__"
+        "chunked"
+    )
@@ -170,6 +170,28 @@ class TestSetupSubhalo:
             == "subhalo[nfw_sph_ludlow__mass_is_instance__source_is_model__grid_4__centre_(2.00,2.00)__mass_1.0e+10]"
         )
 
+    def test__grid_search_phase_class_from__grid_search_subhalo_with_number_of_cores(
+        self,
+    ):
+
+        setup = al.SetupSubhalo(parallel=True, number_of_cores=2)
+
+        phase = setup.grid_search_phase_class_from(phase_class=al.PhaseImaging)(
+            search=af.MockSearch(paths=af.Paths(name="subhalo")), number_of_steps=2
+        )
+
+        assert isinstance(phase.search, al.GridSearchSubhalo)
+        assert phase.search.number_of_cores == 2
+
+        setup = al.SetupSubhalo(parallel=False)
+
+        phase = setup.grid_search_phase_class_from(phase_class=al.PhaseImaging)(
+            search=af.MockSearch(paths=af.Paths(name="subhalo")), number_of_steps=2
+        )
+
+        assert isinstance(phase.search, al.GridSearchSubhalo)
+        assert phase.search.number_of_cores == 1
+
 
 class TestSetupPipeline:
     def test__tag(self):